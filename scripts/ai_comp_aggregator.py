@@ -24,17 +24,31 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import argparse
 import json
-import glob
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from job_data import latest_jobs_file, load_jobs
+from master_store import has_store
+from job_db import build_job_db, load_rows, count_by, salary_by, total_jobs, query
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
 DATA_DIR = Path("data")
 SITE_ASSETS = Path("site/assets")
-MASTER_DB = DATA_DIR / "master_jobs_database.csv"
+MASTER_DIR = DATA_DIR / "master"
+MASTER_DB = DATA_DIR / "master_jobs_database.csv"  # pre-partition master, read if not yet migrated
+
+# Columns analyze_compensation() reads; the rest of the store is never loaded
+ANALYSIS_COLUMNS = ['title', 'company', 'salary_min', 'salary_max', 'job_category',
+                    'seniority', 'metro', 'remote_type']
 ANALYSIS_OUTPUT = DATA_DIR / "comp_analysis.json"
+
+# analysis key -> column of the salary breakdowns, and the jobs a value needs to be listed
+BREAKDOWN_COLUMNS = {'by_category': 'job_category', 'by_seniority': 'seniority',
+                     'by_metro': 'metro', 'by_remote': 'remote_type'}
+MIN_BREAKDOWN_JOBS = 3
 NEWSLETTER_OUTPUT = DATA_DIR / "comp_newsletter_section.md"
 
 # Chart output paths
@@ -281,18 +295,27 @@ def initialize_data_dir():
 
 
 def load_job_data():
-    """Load job data from master database or latest enriched file."""
-    # Try master database first
+    """Load job data from master store or latest enriched file.
+
+    With a master store, analyze_compensation() gets its salary breakdowns
+    from load_salary_breakdowns() instead of grouping these rows.
+    """
+    # Try master store first, through its query database (see job_db.py)
+    if has_store(str(MASTER_DIR)):
+        build_job_db(master_dir=str(MASTER_DIR))
+        df = load_rows(ANALYSIS_COLUMNS)
+        print(f"  Loaded master store: {len(df)} records")
+        return df
+
     if MASTER_DB.exists():
         df = pd.read_csv(MASTER_DB)
         print(f"  Loaded master database: {len(df)} records")
         return df
 
     # Fall back to latest enriched file
-    job_files = glob.glob(str(DATA_DIR / "ai_jobs_*.csv"))
-    if job_files:
-        latest_file = sorted(job_files)[-1]
-        df = pd.read_csv(latest_file)
+    latest_file = latest_jobs_file(str(DATA_DIR))
+    if latest_file:
+        df = load_jobs(latest_file, data_dir=str(DATA_DIR))
         print(f"  Loaded {latest_file}: {len(df)} records")
         return df
 
@@ -300,11 +323,42 @@ def load_job_data():
     return pd.DataFrame()
 
 
+def load_salary_breakdowns():
+    """Salary breakdowns from the job database, or None without a master store."""
+    if not has_store(str(MASTER_DIR)):
+        return None
+    # load_job_data() has synced the database already
+    return query_salary_breakdowns()
+
+
 # ============================================================
 # COMPENSATION ANALYSIS
 # ============================================================
-def analyze_compensation(df):
-    """Generate comprehensive compensation analysis for AI jobs."""
+def query_salary_breakdowns():
+    """Salary breakdowns (by_category, by_seniority, ...) as GROUP BY queries on the job database."""
+    breakdowns = {}
+    for key, column in BREAKDOWN_COLUMNS.items():
+        rows = salary_by(column, min_jobs=MIN_BREAKDOWN_JOBS)
+        if column == 'metro':
+            rows = rows[~rows['value'].isin(['', 'Unknown'])]
+        breakdowns[key] = {
+            row.value: {
+                'count': int(row.jobs),
+                'min_base_avg': round(row.min_base_avg),
+                'max_base_avg': round(row.max_base_avg),
+                'median': round(row.median),
+            }
+            for row in rows.itertuples()
+        }
+    return breakdowns
+
+
+def analyze_compensation(df, breakdowns=None):
+    """Generate comprehensive compensation analysis for AI jobs.
+
+    breakdowns: precomputed by_* sections (query_salary_breakdowns); computed
+    from df if not given.
+    """
 
     # Filter to records with salary data
     salary_df = df[
@@ -343,8 +397,11 @@ def analyze_compensation(df):
             'p90': round(salary_df['salary_max'].quantile(0.90)),
         }
 
+    if breakdowns is not None:
+        analysis.update(breakdowns)
+
     # By Job Category
-    if 'job_category' in salary_df.columns:
+    if breakdowns is None and 'job_category' in salary_df.columns:
         for category in salary_df['job_category'].unique():
             cat_df = salary_df[salary_df['job_category'] == category]
             if len(cat_df) >= 3:
@@ -356,7 +413,7 @@ def analyze_compensation(df):
                 }
 
     # By Seniority
-    if 'seniority' in salary_df.columns:
+    if breakdowns is None and 'seniority' in salary_df.columns:
         for seniority in salary_df['seniority'].unique():
             sen_df = salary_df[salary_df['seniority'] == seniority]
             if len(sen_df) >= 3:
@@ -368,7 +425,7 @@ def analyze_compensation(df):
                 }
 
     # By Metro
-    if 'metro' in salary_df.columns:
+    if breakdowns is None and 'metro' in salary_df.columns:
         for metro in salary_df['metro'].dropna().unique():
             if metro and metro != 'Unknown':
                 metro_df = salary_df[salary_df['metro'] == metro]
@@ -381,7 +438,7 @@ def analyze_compensation(df):
                     }
 
     # By Remote
-    if 'remote_type' in salary_df.columns:
+    if breakdowns is None and 'remote_type' in salary_df.columns:
         for remote_type in salary_df['remote_type'].unique():
             remote_df = salary_df[salary_df['remote_type'] == remote_type]
             if len(remote_df) >= 3:
@@ -517,7 +574,7 @@ def main():
             print("  No data available. Run enrichment first.")
             return
 
-        analysis = analyze_compensation(df)
+        analysis = analyze_compensation(df, load_salary_breakdowns())
         generate_all_charts(analysis)
         generate_newsletter_section(analysis)
 
@@ -533,7 +590,7 @@ def main():
         if len(df) == 0:
             print("  No data available.")
             return
-        analysis = analyze_compensation(df)
+        analysis = analyze_compensation(df, load_salary_breakdowns())
         print(f"\n  Analysis complete. Run --charts or --newsletter next.")
 
     elif args.charts:
@@ -552,6 +609,19 @@ def main():
             analysis = json.load(f)
         generate_newsletter_section(analysis)
 
+    elif args.status and has_store(str(MASTER_DIR)):
+        # Answered by indexed queries; no rows are loaded
+        build_job_db(master_dir=str(MASTER_DIR))
+        total = total_jobs()
+        if total == 0:
+            print("  No data available.")
+        else:
+            print(f"\n  Total jobs: {total}")
+            salary_count = int(query('SELECT COUNT(*) AS n FROM jobs WHERE CAST(salary_max AS REAL) > 0')['n'][0])
+            print(f"  Jobs with salary: {salary_count} ({round(salary_count/total*100, 1)}%)")
+            print(f"  Categories: {len(count_by('job_category'))}")
+            print(f"  Locations: {len(count_by('metro'))}")
+
     elif args.status:
         df = load_job_data()
         if len(df) == 0:
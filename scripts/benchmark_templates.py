@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the shared page frame in templates.py.
+
+Renders the frame every generator wraps around its content (head, nav, CTA,
+footer) for a batch of pages, twice:
+
+- caches cleared: the current code with its fragment caches cleared before
+  each page, so every page rebuilds its nav/footer/CTA, recompiles the head
+  template and re-minifies the shared stylesheet
+- precompiled: fragments come from the per-run cache and the head is filled
+  into its precompiled template
+
+The first number shows what the caches save. It approximates, but is not, a
+measurement of the code before the templates were precompiled.
+
+Stylesheets are written to a temporary directory, not site/assets.
+
+Usage:
+    python scripts/benchmark_templates.py
+    python scripts/benchmark_templates.py --pages 5000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from templates import (
+    get_html_head, get_nav_html, get_footer_html, get_cta_box, clear_template_cache,
+)
+from site_writer import flush_pages
+
+ACTIVE_PAGES = ['jobs', 'salaries', 'companies', 'tools', 'insights', None]
+
+
+def render_page(i):
+    """A page as the generators assemble it, with a small body."""
+    title = f"Senior AI Engineer {i} at Example Corp"
+    description = f"AI engineer role {i}: salary, skills and how to apply."
+    return f'''{get_html_head(title, description, f'jobs/example-{i}/')}
+{get_nav_html(ACTIVE_PAGES[i % len(ACTIVE_PAGES)])}
+    <main>
+        <h1>{title}</h1>
+        <p>{description}</p>
+        {get_cta_box()}
+    </main>
+{get_footer_html()}'''
+
+
+def time_pages(pages, cached):
+    """Seconds to render `pages` pages."""
+    clear_template_cache()
+    start = time.perf_counter()
+    for i in range(pages):
+        if not cached:
+            clear_template_cache()
+        render_page(i)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time per-page rendering of the shared page frame')
+    parser.add_argument('--pages', type=int, default=2000, help='Pages per run (default: 2000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per mode; the best is reported (default: 3)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  AI MARKET PULSE - TEMPLATE RENDER BENCHMARK")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            clear_template_cache()
+            uncached_html = render_page(0)
+            if render_page(0) != uncached_html:
+                print("  ERROR: cached and uncached output differ")
+                return 1
+            results = {}
+            for mode, cached in (('caches cleared', False), ('precompiled', True)):
+                best = min(time_pages(args.pages, cached) for _ in range(args.repeat))
+                results[mode] = best
+                print(f"  {mode:<15} {best / args.pages * 1e6:8.1f} us/page  ({args.pages} pages, best of {args.repeat})")
+        finally:
+            # Stylesheets are buffered by site_writer; write them inside the temporary directory
+            flush_pages()
+            os.chdir(cwd)
+            clear_template_cache()
+
+    print(f"\n  Saved by the caches: {results['caches cleared'] / results['precompiled']:.1f}x")
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,23 +5,49 @@ Enrich raw AI job data and prepare for page generation.
 This script processes raw job scrape data and outputs:
 1. data/jobs.json - For the live job board
 2. data/ai_jobs_YYYYMMDD.csv - Weekly enriched data for page generators
-3. data/market_intelligence.json - Skills/tools analysis for insights page
+3. data/ai_jobs_YYYYMMDD.summary.json - Totals of that CSV for generators (job_data.load_snapshot_summary)
+4. data/market_intelligence.json - Skills/tools analysis for insights page
+
+Usage:
+    python scripts/enrich_jobs.py               # single process
+    python scripts/enrich_jobs.py --workers 4   # classify row chunks in 4 processes (0 = all CPUs)
+    python scripts/enrich_jobs.py --stream      # chunked read, incremental CSV + data/jobs.jsonl
+    python scripts/enrich_jobs.py --no-cache    # ignore data/.enrich_cache.sqlite and re-classify everything
 """
 
+import argparse
+import hashlib
+import inspect
 import pandas as pd
+import numpy as np
 import json
 import re
 import os
+import sqlite3
+import sys
 from datetime import datetime, date
 import glob
 from collections import Counter
 
+# Add scripts directory to path for imports
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from render_pool import render_pages, resolve_jobs
+from job_data import write_snapshot_summary, summary_path
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
 
 DATA_DIR = "data"
 
+# Rows per work unit when enriching with --workers N
+ENRICH_CHUNK_ROWS = 5000
+
+# Classifier results from earlier runs, keyed by job URL (see classify_posting)
+ENRICH_CACHE_PATH = f"{DATA_DIR}/.enrich_cache.sqlite"
+
 # Skills to extract from job descriptions
 SKILL_KEYWORDS = {
     # LLM Frameworks
@@ -517,40 +543,178 @@ EXCLUDED_TITLE_EXCEPTIONS = [
     'recommendation', 'personalization',
 ]
 
+# Description signals used to categorize generic titles (first match wins)
+DESCRIPTION_CATEGORY_SIGNALS = {
+    'Prompt Engineer': ['prompt engineering', 'prompt design', 'prompt optimization'],
+    'LLM Engineer': ['llm development', 'large language model', 'fine-tuning llm'],
+    'RAG Engineer': ['rag pipeline', 'rag system', 'retrieval augmented'],
+    'AI/ML Engineer': ['machine learning model', 'ml pipeline', 'deep learning', 'neural network'],
+    'MLOps Engineer': ['mlops', 'ml operations', 'model deployment', 'model serving'],
+    'Data Scientist': ['data science', 'statistical modeling', 'predictive analytics'],
+}
 
-def is_ai_relevant(title, description):
+# =============================================================================
+# KEYWORD MATCHING
+# =============================================================================
+# Every classifier below asks "which of my keywords occur in this text?".
+# Instead of one `keyword in text` loop per dictionary, all keywords for a
+# given text (title, description, location) are compiled into one regex and
+# the text is scanned once. Each classifier then walks its own list in order
+# against the set of hits, so first-match-wins semantics are unchanged.
+
+
+def build_keyword_matcher(keywords):
+    """Compile keywords into a single trie-shaped regex.
+
+    Keywords are anchored on their first letter or digit: leading spaces and
+    punctuation (' go ', ', ai') are checked on each hit instead, which keeps
+    the regex's fast first-character skip effective on long descriptions.
+
+    At each position the trie matches the longest anchored term. Any shorter
+    term starting there is a prefix of it, so the hits for a position are the
+    keywords of the longest match and of its prefixes (precomputed in
+    'plain' and 'anchored').
+    """
+    keywords = set(keywords)
+    leads = {}
+    for keyword in keywords:
+        lead = re.match(r'[^a-z0-9]*', keyword).group()
+        if lead == keyword:
+            lead = ''
+        leads.setdefault(keyword[len(lead):], []).append((lead, keyword))
+    terms = sorted(leads)
+
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def emit(node):
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Try the longer terms first, fall back to the one ending here
+        return f'(?:{body})?' if '' in node else body
+
+    plain = {}
+    anchored = {}
+    for term in terms:
+        found = [pair for other in terms if term.startswith(other) for pair in leads[other]]
+        plain[term] = [keyword for lead, keyword in found if not lead]
+        anchored[term] = [(lead, keyword) for lead, keyword in found if lead]
+
+    return {
+        'pattern': re.compile(emit(trie)) if terms else None,
+        'plain': plain,
+        'anchored': anchored,
+    }
+
+
+def match_keywords(matcher, text):
+    """Set of the matcher's keywords that occur in text (same as `keyword in text`)."""
+    hits = set()
+    if matcher['pattern'] is None:
+        return hits
+    search = matcher['pattern'].search
+    plain = matcher['plain']
+    anchored = matcher['anchored']
+    # Restart one character after each match start so overlapping keywords are found
+    match = search(text)
+    while match:
+        longest = match.group()
+        start = match.start()
+        hits.update(plain[longest])
+        for lead, keyword in anchored[longest]:
+            if start >= len(lead) and text.startswith(lead, start - len(lead)):
+                hits.add(keyword)
+        match = search(text, start + 1)
+    return hits
+
+
+def _ordered_rules(patterns_by_label):
+    """Flatten {label: [patterns]} into [(pattern, label)] in priority order."""
+    return [(pattern, label) for label, patterns in patterns_by_label.items() for pattern in patterns]
+
+
+def _first_match(rules, hits, default=None):
+    """Label of the first (keyword, label) rule whose keyword was hit."""
+    for keyword, label in rules:
+        if keyword in hits:
+            return label
+    return default
+
+
+SENIORITY_RULES = _ordered_rules(SENIORITY_PATTERNS)
+COMPANY_STAGE_RULES = _ordered_rules(COMPANY_STAGE_PATTERNS)
+DESCRIPTION_CATEGORY_RULES = _ordered_rules(DESCRIPTION_CATEGORY_SIGNALS)
+TECH_KEYWORD_MAX_LEN = max(len(keyword) for keyword in TECH_COMPANY_KEYWORDS)
+
+TITLE_MATCHER = build_keyword_matcher(
+    AI_RELEVANCE_TITLE_KEYWORDS + EXCLUDED_TITLE_PATTERNS + EXCLUDED_TITLE_EXCEPTIONS
+    + [keyword for keyword, _ in CATEGORY_RULES]
+    + [pattern for pattern, _ in SENIORITY_RULES]
+)
+DESCRIPTION_MATCHER = build_keyword_matcher(
+    AI_RELEVANCE_DESCRIPTION_KEYWORDS + list(SKILL_KEYWORDS)
+    + [pattern for pattern, _ in DESCRIPTION_CATEGORY_RULES]
+    + [pattern for pattern, _ in COMPANY_STAGE_RULES]
+    + [pattern for patterns in RED_FLAG_PATTERNS.values() for pattern in patterns]
+    + AI_BUZZWORDS + TECH_COMPANY_KEYWORDS
+)
+LOCATION_MATCHER = build_keyword_matcher(METRO_MAPPING)
+
+
+def scan_title(title):
+    """Keyword hits for a job title (pass to the classifiers as title_hits)."""
+    return match_keywords(TITLE_MATCHER, str(title).lower() if title else '')
+
+
+def scan_description(description):
+    """Keyword hits for a job description (pass to the classifiers as desc_hits)."""
+    return match_keywords(DESCRIPTION_MATCHER, str(description).lower() if description else '')
+
+
+def is_ai_relevant(title, description, title_hits=None, desc_hits=None):
     """
     Determine if a job is AI-relevant based on title and description.
 
+    title_hits/desc_hits are optional precomputed scan_title/scan_description results.
+
     Returns:
         (bool, str): (is_relevant, reason)
     """
-    title_lower = str(title).lower() if title else ''
-    desc_lower = str(description).lower() if description else ''
+    if title_hits is None:
+        title_hits = scan_title(title)
 
     # Step 1: Check if title has explicit AI keywords
     for keyword in AI_RELEVANCE_TITLE_KEYWORDS:
-        if keyword in title_lower:
+        if keyword in title_hits:
             return True, f"title_keyword:{keyword}"
 
     # Step 2: Check if title matches excluded patterns
     is_excluded = False
     for pattern in EXCLUDED_TITLE_PATTERNS:
-        if pattern in title_lower:
+        if pattern in title_hits:
             is_excluded = True
             # But check if it has an exception (AI qualifier)
             for exception in EXCLUDED_TITLE_EXCEPTIONS:
-                if exception in title_lower:
+                if exception in title_hits:
                     return True, f"excluded_but_has_ai:{exception}"
             break
 
+    if desc_hits is None:
+        desc_hits = scan_description(description)
+
     # If title is excluded and no AI qualifier, check description more strictly
     if is_excluded:
         # For excluded titles, require STRONG AI signals in description
         ai_signal_count = 0
         found_signals = []
         for keyword in AI_RELEVANCE_DESCRIPTION_KEYWORDS:
-            if keyword in desc_lower:
+            if keyword in desc_hits:
                 ai_signal_count += 1
                 found_signals.append(keyword)
                 if ai_signal_count >= 3:  # Require multiple strong signals
@@ -559,29 +723,30 @@ def is_ai_relevant(title, description):
 
     # Step 3: For non-excluded titles, check description for AI relevance
     for keyword in AI_RELEVANCE_DESCRIPTION_KEYWORDS:
-        if keyword in desc_lower:
+        if keyword in desc_hits:
             return True, f"desc_keyword:{keyword}"
 
     # Step 4: No AI signals found
     return False, "no_ai_signals"
 
 
-def extract_skills(text):
+def extract_skills(text, desc_hits=None):
     """Extract skills from job description"""
     if not text or pd.isna(text):
         return []
 
-    text_lower = str(text).lower()
-    found_skills = set()
+    if desc_hits is None:
+        desc_hits = scan_description(text)
 
+    found_skills = set()
     for keyword, canonical in SKILL_KEYWORDS.items():
-        if keyword in text_lower:
+        if keyword in desc_hits:
             found_skills.add(canonical)
 
     return sorted(list(found_skills))
 
 
-def categorize_job(title, description=''):
+def categorize_job(title, description='', title_hits=None, desc_hits=None):
     """Categorize job based on title and description.
 
     Returns a specific category or None if job doesn't fit any category.
@@ -589,32 +754,21 @@ def categorize_job(title, description=''):
     if not title or pd.isna(title):
         return None
 
-    title_lower = str(title).lower()
-    desc_lower = str(description).lower() if description else ''
+    if title_hits is None:
+        title_hits = scan_title(title)
 
     # First pass: check title against rules
-    for keyword, category in CATEGORY_RULES:
-        if keyword in title_lower:
-            return category
+    category = _first_match(CATEGORY_RULES, title_hits)
+    if category:
+        return category
 
     # Second pass: check description for strong category signals
     # This helps categorize generic titles that have AI work in description
-    desc_category_signals = {
-        'Prompt Engineer': ['prompt engineering', 'prompt design', 'prompt optimization'],
-        'LLM Engineer': ['llm development', 'large language model', 'fine-tuning llm'],
-        'RAG Engineer': ['rag pipeline', 'rag system', 'retrieval augmented'],
-        'AI/ML Engineer': ['machine learning model', 'ml pipeline', 'deep learning', 'neural network'],
-        'MLOps Engineer': ['mlops', 'ml operations', 'model deployment', 'model serving'],
-        'Data Scientist': ['data science', 'statistical modeling', 'predictive analytics'],
-    }
-
-    for category, signals in desc_category_signals.items():
-        for signal in signals:
-            if signal in desc_lower:
-                return category
+    if desc_hits is None:
+        desc_hits = scan_description(description)
 
-    # No category match - return None (job will be filtered out)
-    return None
+    # No category match - returns None (job will be filtered out)
+    return _first_match(DESCRIPTION_CATEGORY_RULES, desc_hits)
 
 
 def determine_remote_type(row):
@@ -647,52 +801,46 @@ def normalize_metro(location):
     if not location or pd.isna(location):
         return None
 
-    location_lower = str(location).lower()
-
-    for pattern, metro in METRO_MAPPING.items():
-        if pattern in location_lower:
-            return metro
+    location_hits = match_keywords(LOCATION_MATCHER, str(location).lower())
+    return _first_match(METRO_MAPPING.items(), location_hits)
 
-    return None
 
-
-def classify_seniority(title):
+def classify_seniority(title, title_hits=None):
     """Classify job seniority level from title"""
     if not title or pd.isna(title):
         return 'Mid'
 
-    title_lower = str(title).lower()
-
-    for level, patterns in SENIORITY_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in title_lower:
-                return level
+    if title_hits is None:
+        title_hits = scan_title(title)
 
-    return 'Mid'
+    return _first_match(SENIORITY_RULES, title_hits, default='Mid')
 
 
-def detect_tech_company(company, description=''):
+def detect_tech_company(company, description='', desc_hits=None):
     """Detect if company is a tech company"""
     if not company:
         return False
 
-    text = f"{company} {description}".lower()
-    return any(keyword in text for keyword in TECH_COMPANY_KEYWORDS)
+    if desc_hits is None:
+        desc_hits = scan_description(description)
+    if any(keyword in desc_hits for keyword in TECH_COMPANY_KEYWORDS):
+        return True
+
+    # Keywords in the company name, or spanning "{company} {description}"
+    head = f"{company} {str(description)[:TECH_KEYWORD_MAX_LEN - 1]}".lower()
+    head_hits = match_keywords(DESCRIPTION_MATCHER, head)
+    return any(keyword in head_hits for keyword in TECH_COMPANY_KEYWORDS)
 
 
-def detect_company_stage(description):
+def detect_company_stage(description, desc_hits=None):
     """Detect company stage from job description"""
     if not description or pd.isna(description):
         return 'Unknown'
 
-    desc_lower = str(description).lower()
+    if desc_hits is None:
+        desc_hits = scan_description(description)
 
-    for stage, patterns in COMPANY_STAGE_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in desc_lower:
-                return stage
-
-    return 'Unknown'
+    return _first_match(COMPANY_STAGE_RULES, desc_hits, default='Unknown')
 
 
 def calculate_data_quality(row):
@@ -728,49 +876,253 @@ def get_data_quality_label(score):
         return 'Basic'
 
 
-def extract_red_flags(description):
+def extract_red_flags(description, desc_hits=None):
     """Extract red flags from job description"""
     if not description or pd.isna(description):
         return []
 
-    desc_lower = str(description).lower()
-    flags = []
-
-    for flag_type, patterns in RED_FLAG_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in desc_lower:
-                flags.append(flag_type)
-                break
+    if desc_hits is None:
+        desc_hits = scan_description(description)
 
-    return flags
+    return [
+        flag_type for flag_type, patterns in RED_FLAG_PATTERNS.items()
+        if any(pattern in desc_hits for pattern in patterns)
+    ]
 
 
-def extract_buzzwords(description):
+def extract_buzzwords(description, desc_hits=None):
     """Extract buzzwords from job description"""
     if not description or pd.isna(description):
         return []
 
-    desc_lower = str(description).lower()
-    found = []
+    if desc_hits is None:
+        desc_hits = scan_description(description)
+
+    return [buzzword for buzzword in AI_BUZZWORDS if buzzword in desc_hits]
+
+
+def classify_posting(title, description, company, include_irrelevant=False):
+    """Run every text classifier on one posting.
+
+    Returns a JSON-serializable record: relevance and category always, the
+    remaining text fields when the posting has a category and is AI-relevant
+    (or include_irrelevant is set, for runs without the AI filter). This is
+    the part of enrichment that is stored in the enrichment cache.
+    """
+    # Scan title and description once; every classifier reuses the hits
+    title_hits = scan_title(title)
+    desc_hits = scan_description(description)
+
+    is_relevant, reason = is_ai_relevant(title, description, title_hits, desc_hits)
+    record = {
+        'is_relevant': is_relevant,
+        'reason': reason,
+        'job_category': categorize_job(title, description, title_hits, desc_hits),
+    }
+    if record['job_category'] is not None and (is_relevant or include_irrelevant):
+        record.update({
+            'experience_level': determine_experience_level(title, description),
+            'seniority': classify_seniority(title, title_hits),
+            'skills_tags': extract_skills(description, desc_hits),
+            'is_tech': detect_tech_company(company, description, desc_hits),
+            'company_stage': detect_company_stage(description, desc_hits),
+            'red_flags': extract_red_flags(description, desc_hits),
+            'buzzwords': extract_buzzwords(description, desc_hits),
+        })
+    return record
+
+
+def get_classifier_rules_version():
+    """Hash of the keyword tables and classifier code behind classify_posting.
+
+    Cached records from a different version are never reused, so editing a
+    keyword list or a classifier re-classifies everything on the next run.
+    """
+    rules = json.dumps([
+        AI_RELEVANCE_TITLE_KEYWORDS, AI_RELEVANCE_DESCRIPTION_KEYWORDS,
+        EXCLUDED_TITLE_PATTERNS, EXCLUDED_TITLE_EXCEPTIONS, CATEGORY_RULES,
+        DESCRIPTION_CATEGORY_SIGNALS, SKILL_KEYWORDS, SENIORITY_PATTERNS,
+        TECH_COMPANY_KEYWORDS, COMPANY_STAGE_PATTERNS, RED_FLAG_PATTERNS, AI_BUZZWORDS,
+    ])
+    code = ''.join(inspect.getsource(fn) for fn in (
+        build_keyword_matcher, match_keywords, _first_match, is_ai_relevant, categorize_job,
+        determine_experience_level, classify_seniority, extract_skills, detect_tech_company,
+        detect_company_stage, extract_red_flags, extract_buzzwords, classify_posting,
+    ))
+    return hashlib.md5((rules + code).encode()).hexdigest()[:12]
+
+
+CLASSIFIER_RULES_VERSION = get_classifier_rules_version()
+
+
+def posting_hash(title, description, company):
+    """Content hash of everything classify_posting reads, plus the rules version."""
+    content = '\0'.join([CLASSIFIER_RULES_VERSION, title, description, company])
+    return hashlib.md5(content.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def open_enrichment_cache(cache_path):
+    """Open (creating if needed) the SQLite enrichment cache."""
+    conn = sqlite3.connect(cache_path, timeout=60)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS enrichment ('
+        ' url TEXT PRIMARY KEY,'
+        ' content_hash TEXT NOT NULL,'
+        ' rules_version TEXT NOT NULL,'
+        ' record TEXT NOT NULL,'
+        ' updated TEXT NOT NULL)'
+    )
+    return conn
+
+
+def read_cached_postings(conn, urls):
+    """{url: (content_hash, record_json)} for the urls present in the cache."""
+    urls = list(set(urls))
+    cached = {}
+    # Stay well under SQLite's bound-parameter limit
+    for start in range(0, len(urls), 500):
+        batch = urls[start:start + 500]
+        placeholders = ','.join('?' * len(batch))
+        rows = conn.execute(
+            f'SELECT url, content_hash, record FROM enrichment WHERE url IN ({placeholders})', batch)
+        for url, content_hash, record in rows:
+            cached[url] = (content_hash, record)
+    return cached
+
+
+def write_cached_postings(conn, entries):
+    """Insert or replace (url, content_hash, record_json) entries."""
+    if not entries:
+        return
+    updated = date.today().isoformat()
+    with conn:
+        conn.executemany(
+            'INSERT OR REPLACE INTO enrichment (url, content_hash, rules_version, record, updated) '
+            'VALUES (?, ?, ?, ?, ?)',
+            [(url, content_hash, CLASSIFIER_RULES_VERSION, record, updated)
+             for url, content_hash, record in entries])
+
+
+def prune_enrichment_cache(cache_path):
+    """Drop records from other classifier versions (they can never be reused)."""
+    if not os.path.exists(cache_path):
+        return 0
+    conn = open_enrichment_cache(cache_path)
+    try:
+        with conn:
+            deleted = conn.execute('DELETE FROM enrichment WHERE rules_version != ?',
+                                   (CLASSIFIER_RULES_VERSION,)).rowcount
+    finally:
+        conn.close()
+    return deleted
+
+
+# =============================================================================
+# COLUMNAR HELPERS (used by process_jobs)
+# =============================================================================
+# Row-wise equivalents: determine_remote_type, calculate_data_quality,
+# get_data_quality_label. Each helper takes the raw frame (or one of its
+# columns) and returns one value per row.
+
+
+def raw_column(df, name, default=None):
+    """Column of the raw frame, or a constant column if the scrape lacks it."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+
+def text_values(values, missing=''):
+    """str(value) per row, with `missing` for NaN/None."""
+    strings = values.map(str).to_numpy(dtype=object)
+    strings[values.isna().to_numpy()] = missing
+    return strings.tolist()
+
+
+def parse_salary_column(values):
+    """int(float(value)) per row as a float array, NaN where missing or unparseable."""
+    if pd.api.types.is_numeric_dtype(values):
+        amounts = values.to_numpy(dtype=float, na_value=np.nan, copy=True)
+    else:
+        # Strings from a messy scrape: keep float()'s exact parsing rules
+        def parse(value):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return np.nan
+        amounts = np.array([parse(v) if pd.notna(v) else np.nan for v in values], dtype=float)
+    amounts[~np.isfinite(amounts)] = np.nan
+    return np.trunc(amounts)
+
+
+def salary_values(amounts):
+    """Float salary array -> list of int/None."""
+    present = ~np.isnan(amounts)
+    values = np.full(len(amounts), None, dtype=object)
+    values[present] = [int(v) for v in amounts[present]]
+    return values.tolist()
+
+
+def truthy_column(values):
+    """bool(value) per row (NaN counts as True, like the row-wise check)."""
+    if pd.api.types.is_bool_dtype(values):
+        return values.to_numpy(dtype=bool)
+    if pd.api.types.is_numeric_dtype(values):
+        numbers = values.to_numpy(dtype=float, na_value=np.nan)
+        return (numbers != 0) | np.isnan(numbers)
+    return np.array([bool(v) for v in values], dtype=bool)
+
+
+def remote_type_column(df):
+    """determine_remote_type for every row."""
+    is_remote = truthy_column(raw_column(df, 'is_remote', False))
+    location = pd.Series(text_values(raw_column(df, 'location', '')), index=df.index).str.lower()
+    return np.select(
+        [is_remote | location.str.contains('remote', regex=False).to_numpy(dtype=bool),
+         location.str.contains('hybrid', regex=False).to_numpy(dtype=bool)],
+        ['remote', 'hybrid'],
+        default='onsite',
+    )
+
 
-    for buzzword in AI_BUZZWORDS:
-        if buzzword in desc_lower:
-            found.append(buzzword)
+def data_quality_column(df):
+    """calculate_data_quality for every row."""
+    description = raw_column(df, 'description')
+    location = raw_column(df, 'location')
+    company = raw_column(df, 'company')
 
-    return found
+    has_description = np.array([len(str(v)) > 100 for v in description], dtype=bool) & description.notna().to_numpy()
+    has_salary = (raw_column(df, 'min_amount').notna() | raw_column(df, 'max_amount').notna()).to_numpy()
+    has_location = location.notna().to_numpy() & ~location.map(str).isin(['', 'nan', 'None']).to_numpy()
+    has_company = company.notna().to_numpy() & ~company.map(str).isin(['', 'nan', 'None', 'Unknown']).to_numpy()
 
+    return 40 * has_description + 30 * has_salary + 15 * has_location + 15 * has_company
 
-def process_jobs(df, apply_ai_filter=True):
+
+def data_quality_labels(scores):
+    """get_data_quality_label for an array of scores."""
+    return np.select([scores >= 85, scores >= 55], ['Premium', 'Good'], default='Basic')
+
+
+def process_jobs(df, apply_ai_filter=True, cache_path=None):
     """Process raw job data into enriched format.
 
+    Text classifiers run per row; salary, remote type, data quality, dates and
+    URLs are computed column-wise for the rows that pass the filters.
+
+    With cache_path, classify_posting results are looked up by job URL and
+    reused when the title, description, company and classifier rules are
+    unchanged; only new or edited postings are classified.
+
     Args:
         df: Raw job DataFrame
         apply_ai_filter: If True, filter out non-AI jobs (default True)
+        cache_path: SQLite enrichment cache (default: no cache)
 
     Returns:
         Tuple of (jobs_list, filter_stats_dict)
     """
-    jobs = []
     today = date.today()
     import_date = today.isoformat()
     import_week = today.strftime('%Y-W%W')
@@ -785,185 +1137,282 @@ def process_jobs(df, apply_ai_filter=True):
         'exclusion_reasons': Counter(),
     }
 
-    for _, row in df.iterrows():
+    # Pass 1: filter and classify on the text (the only per-row work)
+    record_fields = ('experience_level', 'seniority', 'job_category', 'skills_tags',
+                     'is_tech', 'company_stage', 'red_flags', 'buzzwords')
+    positions = []
+    text_fields = {key: [] for key in ('title', 'description') + record_fields}
+    companies = text_values(raw_column(df, 'company'), missing='Unknown')
+
+    # Same lookup as row.get('job_url', row.get('job_url_direct')): job_url wins whenever the column exists
+    url_column = 'job_url' if 'job_url' in df.columns else 'job_url_direct'
+    urls = text_values(raw_column(df, url_column), missing=None)
+
+    conn = None
+    cached = {}
+    new_entries = []
+    if cache_path:
+        conn = open_enrichment_cache(cache_path)
+        cached = read_cached_postings(conn, [url for url in urls if url])
+        filter_stats['cache_hits'] = 0
+
+    rows = zip(raw_column(df, 'title'), raw_column(df, 'description'), companies, urls)
+    for position, (title_value, description_value, company, url) in enumerate(rows):
         # Skip if no title
-        if pd.isna(row.get('title')):
+        if pd.isna(title_value):
             filter_stats['no_title'] += 1
             continue
 
-        title = str(row.get('title', ''))
-        description = str(row.get('description', '')) if pd.notna(row.get('description')) else ''
+        title = str(title_value)
+        description = str(description_value) if pd.notna(description_value) else ''
+
+        record = None
+        if conn is not None and url:
+            content_hash = posting_hash(title, description, company)
+            entry = cached.get(url)
+            if entry is not None and entry[0] == content_hash:
+                record = json.loads(entry[1])
+                # Records of filtered-out postings lack the text fields a no-filter run needs
+                if (record['job_category'] is not None and 'seniority' not in record
+                        and (record['is_relevant'] or not apply_ai_filter)):
+                    record = None
+                else:
+                    filter_stats['cache_hits'] += 1
+        if record is None:
+            record = classify_posting(title, description, company, include_irrelevant=not apply_ai_filter)
+            if conn is not None and url:
+                new_entries.append((url, content_hash, json.dumps(record)))
 
         # Apply AI relevance filter
-        if apply_ai_filter:
-            is_relevant, reason = is_ai_relevant(title, description)
-            if not is_relevant:
-                filter_stats['not_ai_relevant'] += 1
-                filter_stats['exclusion_reasons'][reason] += 1
-                continue
+        if apply_ai_filter and not record['is_relevant']:
+            filter_stats['not_ai_relevant'] += 1
+            filter_stats['exclusion_reasons'][record['reason']] += 1
+            continue
 
         # Categorize the job
-        job_category = categorize_job(title, description)
-        if job_category is None:
+        if record['job_category'] is None:
             filter_stats['no_category'] += 1
             filter_stats['exclusion_reasons']['no_category_match'] += 1
             continue
 
         filter_stats['included'] += 1
+        positions.append(position)
+        text_fields['title'].append(title)
+        text_fields['description'].append(description)
+        for key in record_fields:
+            text_fields[key].append(record[key])
+
+    if conn is not None:
+        write_cached_postings(conn, new_entries)
+        conn.close()
+
+    # Pass 2: column-wise fields for the included rows
+    kept = df.iloc[positions]
+    count = len(kept)
+
+    # Salary, with hourly rates converted to an annual estimate for comparison
+    salary_min = parse_salary_column(raw_column(kept, 'min_amount'))
+    salary_max = parse_salary_column(raw_column(kept, 'max_amount'))
+    interval = raw_column(kept, 'interval')
+    hourly = np.array(['hour' in v.lower() for v in text_values(interval)], dtype=bool)
+    for amounts in (salary_min, salary_max):
+        convert = hourly & (amounts != 0) & (amounts < 500)
+        amounts[convert] = amounts[convert] * 2080
+    has_salary = (~np.isnan(salary_min) & (salary_min != 0)) | (~np.isnan(salary_max) & (salary_max != 0))
+    salary_min = salary_values(salary_min)
+    salary_max = salary_values(salary_max)
+
+    location = text_values(raw_column(kept, 'location'))
+    metros = {value: normalize_metro(value) for value in set(location)}
+    remote_type = remote_type_column(kept)
+    data_quality_score = data_quality_column(kept)
+
+    job_ids = raw_column(kept, 'id')
+    job_id = [value[:12] for value in text_values(job_ids)]
+    date_posted = raw_column(kept, 'date_posted')
+    date_posted = [value[:10] if value is not None else None
+                   for value in text_values(date_posted, missing=None)]
+
+    source_url = text_values(raw_column(kept, url_column))
+
+    description = text_fields['description']
+    columns = {
+        'job_id': job_id,
+        'title': text_fields['title'],
+        'company': [companies[position] for position in positions],
+        'location': location,
+        'metro': [metros[value] for value in location],
+        'remote_type': remote_type.tolist(),
+        'is_remote': (remote_type == 'remote').tolist(),
+        'salary_min': salary_min,
+        'salary_max': salary_max,
+        'min_amount': salary_min,  # Alias for compatibility
+        'max_amount': salary_max,  # Alias for compatibility
+        'salary_type': np.where(hourly, 'hourly', 'annual').tolist(),
+        'experience_level': text_fields['experience_level'],
+        'seniority': text_fields['seniority'],
+        'job_category': text_fields['job_category'],
+        'skills_tags': text_fields['skills_tags'],
+        'is_tech': text_fields['is_tech'],
+        'company_stage': text_fields['company_stage'],
+        'data_quality_score': data_quality_score.tolist(),
+        'data_quality': data_quality_labels(data_quality_score).tolist(),
+        'has_description': [len(value) > 100 for value in description],
+        'has_salary': has_salary.tolist(),
+        'red_flags': text_fields['red_flags'],
+        'buzzwords': text_fields['buzzwords'],
+        'date_posted': date_posted,
+        'date_scraped': [import_date] * count,
+        'import_date': [import_date] * count,
+        'import_week': [import_week] * count,
+        'week_added': [import_date] * count,
+        'source': raw_column(kept, 'site', 'indeed').map(str).tolist(),
+        'source_url': source_url,
+        'job_url_direct': source_url,
+        'description': description,
+        'description_snippet': [value[:500] for value in description],
+    }
 
-        # Extract salary
-        salary_min = None
-        salary_max = None
-        salary_type = 'annual'
+    keys = list(columns)
+    jobs = [dict(zip(keys, values)) for values in zip(*columns.values())]
 
-        if pd.notna(row.get('min_amount')):
-            try:
-                salary_min = int(float(row['min_amount']))
-            except:
-                pass
-        if pd.notna(row.get('max_amount')):
-            try:
-                salary_max = int(float(row['max_amount']))
-            except:
-                pass
-        if pd.notna(row.get('interval')):
-            interval = str(row['interval']).lower()
-            if 'hour' in interval:
-                salary_type = 'hourly'
-                # Convert hourly to annual estimate for comparison
-                if salary_min and salary_min < 500:
-                    salary_min = int(salary_min * 2080)
-                if salary_max and salary_max < 500:
-                    salary_max = int(salary_max * 2080)
-
-        # Build job object
-        location = str(row.get('location', '')) if pd.notna(row.get('location')) else ''
-        company = str(row.get('company', '')) if pd.notna(row.get('company')) else 'Unknown'
-
-        # Calculate data quality
-        row_dict = row.to_dict()
-        data_quality_score = calculate_data_quality(row_dict)
-
-        job = {
-            'job_id': str(row.get('id', ''))[:12] if pd.notna(row.get('id')) else '',
-            'title': title,
-            'company': company,
-            'location': location,
-            'metro': normalize_metro(location),
-            'remote_type': determine_remote_type(row),
-            'is_remote': determine_remote_type(row) == 'remote',
-            'salary_min': salary_min,
-            'salary_max': salary_max,
-            'min_amount': salary_min,  # Alias for compatibility
-            'max_amount': salary_max,  # Alias for compatibility
-            'salary_type': salary_type,
-            'experience_level': determine_experience_level(title, description),
-            'seniority': classify_seniority(title),
-            'job_category': job_category,  # Use pre-computed category
-            'skills_tags': extract_skills(description),
-            'is_tech': detect_tech_company(company, description),
-            'company_stage': detect_company_stage(description),
-            'data_quality_score': data_quality_score,
-            'data_quality': get_data_quality_label(data_quality_score),
-            'has_description': bool(description and len(description) > 100),
-            'has_salary': bool(salary_min or salary_max),
-            'red_flags': extract_red_flags(description),
-            'buzzwords': extract_buzzwords(description),
-            'date_posted': str(row.get('date_posted', ''))[:10] if pd.notna(row.get('date_posted')) else None,
-            'date_scraped': date.today().isoformat(),
-            'import_date': import_date,
-            'import_week': import_week,
-            'week_added': import_date,
-            'source': str(row.get('site', 'indeed')),
-            'source_url': str(row.get('job_url', row.get('job_url_direct', ''))) if pd.notna(row.get('job_url', row.get('job_url_direct'))) else '',
-            'job_url_direct': str(row.get('job_url', row.get('job_url_direct', ''))) if pd.notna(row.get('job_url', row.get('job_url_direct'))) else '',
-            'description': description,
-            'description_snippet': description[:500] if description else '',
-        }
+    return jobs, filter_stats
 
-        jobs.append(job)
 
-    return jobs, filter_stats
+def process_jobs_chunk(start, stop, df, apply_ai_filter=True, cache_path=None):
+    """process_jobs for rows [start, stop) of df (one --workers work unit)."""
+    return process_jobs(df.iloc[start:stop], apply_ai_filter=apply_ai_filter, cache_path=cache_path)
 
 
-def generate_market_intelligence(jobs):
-    """Generate market intelligence data from jobs"""
-    all_skills = []
-    all_buzzwords = []
-    all_red_flags = []
-    categories_count = Counter()
-    experience_count = Counter()
-    seniority_count = Counter()
-    remote_count = Counter()
-    metro_count = Counter()
-    company_stage_count = Counter()
-    tech_count = 0
-    data_quality_count = Counter()
+def merge_filter_stats(chunk_stats):
+    """Combine per-chunk filter_stats in chunk order.
 
-    # Salary stats
-    salaries = []
-    salaries_by_category = {}
-    salaries_by_seniority = {}
+    Counts are summed. exclusion_reasons keeps first-seen order across chunks,
+    so most_common() ties print the same as a single-process run.
+    """
+    merged = {
+        'total_input': 0,
+        'no_title': 0,
+        'not_ai_relevant': 0,
+        'no_category': 0,
+        'included': 0,
+        'exclusion_reasons': Counter(),
+    }
+    for stats in chunk_stats:
+        for key, value in stats.items():
+            if key == 'exclusion_reasons':
+                merged[key].update(value)
+            else:
+                merged[key] = merged.get(key, 0) + value
+    return merged
 
-    for job in jobs:
-        # Skills
-        all_skills.extend(job.get('skills_tags', []))
 
-        # Buzzwords
-        all_buzzwords.extend(job.get('buzzwords', []))
+def process_jobs_parallel(df, apply_ai_filter=True, workers=1, chunk_rows=ENRICH_CHUNK_ROWS,
+                          cache_path=None):
+    """process_jobs split into row chunks across a process pool.
 
-        # Red flags
-        all_red_flags.extend(job.get('red_flags', []))
+    Workers are forked and inherit df, so only the enriched jobs are sent back.
+    Chunks are merged in input order; the result is identical to process_jobs(df).
+
+    Args:
+        df: Raw job DataFrame
+        apply_ai_filter: If True, filter out non-AI jobs (default True)
+        workers: Number of worker processes (1 = process_jobs in this process)
+        chunk_rows: Rows per work unit
+        cache_path: SQLite enrichment cache (each worker opens its own connection)
+
+    Returns:
+        Tuple of (jobs_list, filter_stats_dict)
+    """
+    if workers <= 1 or len(df) <= chunk_rows:
+        return process_jobs(df, apply_ai_filter=apply_ai_filter, cache_path=cache_path)
+
+    chunks = [(start, min(start + chunk_rows, len(df))) for start in range(0, len(df), chunk_rows)]
+    jobs = []
+    chunk_stats = []
+    results = render_pages(process_jobs_chunk, chunks, jobs=workers, chunk_size=1,
+                           shared={'df': df, 'apply_ai_filter': apply_ai_filter, 'cache_path': cache_path})
+    for chunk_jobs, stats in results:
+        jobs.extend(chunk_jobs)
+        chunk_stats.append(stats)
+
+    return jobs, merge_filter_stats(chunk_stats)
+
+
+def new_market_tally():
+    """Empty running totals for market intelligence (see tally_jobs)."""
+    return {
+        'total_jobs': 0,
+        'skills': Counter(),
+        'buzzwords': Counter(),
+        'red_flags': Counter(),
+        'categories': Counter(),
+        'experience': Counter(),
+        'seniority': Counter(),
+        'remote': Counter(),
+        'metro': Counter(),
+        'company_stage': Counter(),
+        'tech': 0,
+        'data_quality': Counter(),
+        'salaries': [],
+        'salaries_by_category': {},
+        'salaries_by_seniority': {},
+    }
+
+
+def tally_jobs(tally, jobs):
+    """Add a batch of enriched jobs to the running totals."""
+    for job in jobs:
+        tally['total_jobs'] += 1
+
+        # Skills, buzzwords, red flags
+        tally['skills'].update(job.get('skills_tags', []))
+        tally['buzzwords'].update(job.get('buzzwords', []))
+        tally['red_flags'].update(job.get('red_flags', []))
 
         # Category
         cat = job.get('job_category', 'Other')
-        categories_count[cat] += 1
+        tally['categories'][cat] += 1
 
         # Experience
-        experience_count[job.get('experience_level', 'mid')] += 1
+        tally['experience'][job.get('experience_level', 'mid')] += 1
 
         # Seniority
         seniority = job.get('seniority', 'Mid')
-        seniority_count[seniority] += 1
+        tally['seniority'][seniority] += 1
 
         # Remote
-        remote_count[job.get('remote_type', 'onsite')] += 1
+        tally['remote'][job.get('remote_type', 'onsite')] += 1
 
         # Metro
         if job.get('metro'):
-            metro_count[job['metro']] += 1
+            tally['metro'][job['metro']] += 1
 
         # Company stage
-        stage = job.get('company_stage', 'Unknown')
-        company_stage_count[stage] += 1
+        tally['company_stage'][job.get('company_stage', 'Unknown')] += 1
 
         # Tech company
         if job.get('is_tech'):
-            tech_count += 1
+            tally['tech'] += 1
 
         # Data quality
-        quality = job.get('data_quality', 'Basic')
-        data_quality_count[quality] += 1
+        tally['data_quality'][job.get('data_quality', 'Basic')] += 1
 
         # Salary
         if job.get('salary_max'):
             sal = job['salary_max']
-            salaries.append(sal)
+            tally['salaries'].append(sal)
+            tally['salaries_by_category'].setdefault(cat, []).append(sal)
+            tally['salaries_by_seniority'].setdefault(seniority, []).append(sal)
 
-            # By category
-            if cat not in salaries_by_category:
-                salaries_by_category[cat] = []
-            salaries_by_category[cat].append(sal)
+    return tally
 
-            # By seniority
-            if seniority not in salaries_by_seniority:
-                salaries_by_seniority[seniority] = []
-            salaries_by_seniority[seniority].append(sal)
 
-    # Skill counts
-    skill_counts = Counter(all_skills)
-    buzzword_counts = Counter(all_buzzwords)
-    red_flag_counts = Counter(all_red_flags)
+def market_intelligence_from_tally(tally):
+    """Build the market_intelligence.json payload from running totals."""
+    total_jobs = tally['total_jobs']
+    skill_counts = tally['skills']
+    tech_count = tally['tech']
 
     # Group by category
     skills_by_category = {}
@@ -974,6 +1423,7 @@ def generate_market_intelligence(jobs):
         skills_by_category[category][skill] = count
 
     # Calculate salary stats
+    salaries = tally['salaries']
     salary_stats = {}
     if salaries:
         salaries.sort()
@@ -987,7 +1437,7 @@ def generate_market_intelligence(jobs):
 
     # Salary by category
     salary_by_category = {}
-    for cat, sals in salaries_by_category.items():
+    for cat, sals in tally['salaries_by_category'].items():
         if sals:
             sals.sort()
             salary_by_category[cat] = {
@@ -998,7 +1448,7 @@ def generate_market_intelligence(jobs):
 
     # Salary by seniority
     salary_by_seniority = {}
-    for sen, sals in salaries_by_seniority.items():
+    for sen, sals in tally['salaries_by_seniority'].items():
         if sals:
             sals.sort()
             salary_by_seniority[sen] = {
@@ -1009,33 +1459,219 @@ def generate_market_intelligence(jobs):
 
     intel = {
         'date': date.today().isoformat(),
-        'total_jobs': len(jobs),
+        'total_jobs': total_jobs,
         'skills': dict(skill_counts.most_common(50)),
         'skills_by_category': skills_by_category,
-        'categories': dict(categories_count.most_common()),
-        'experience_levels': dict(experience_count),
-        'seniority_breakdown': dict(seniority_count),
-        'remote_breakdown': dict(remote_count),
-        'top_metros': dict(metro_count.most_common(10)),
-        'company_stages': dict(company_stage_count.most_common()),
+        'categories': dict(tally['categories'].most_common()),
+        'experience_levels': dict(tally['experience']),
+        'seniority_breakdown': dict(tally['seniority']),
+        'remote_breakdown': dict(tally['remote']),
+        'top_metros': dict(tally['metro'].most_common(10)),
+        'company_stages': dict(tally['company_stage'].most_common()),
         'tech_companies': tech_count,
-        'tech_percentage': round(tech_count / len(jobs) * 100, 1) if jobs else 0,
-        'data_quality_breakdown': dict(data_quality_count),
+        'tech_percentage': round(tech_count / total_jobs * 100, 1) if total_jobs else 0,
+        'data_quality_breakdown': dict(tally['data_quality']),
         'salary_stats': salary_stats,
         'salary_by_category': salary_by_category,
         'salary_by_seniority': salary_by_seniority,
-        'buzzwords': dict(buzzword_counts.most_common(20)),
-        'red_flags': dict(red_flag_counts.most_common()),
+        'buzzwords': dict(tally['buzzwords'].most_common(20)),
+        'red_flags': dict(tally['red_flags'].most_common()),
     }
 
     return intel
 
 
+def generate_market_intelligence(jobs):
+    """Generate market intelligence data from jobs"""
+    return market_intelligence_from_tally(tally_jobs(new_market_tally(), jobs))
+
+
+def write_jobs_csv(jobs, csv_filename, append=False):
+    """Write enriched jobs to the page-generator CSV (or append rows to it)."""
+    df_output = pd.DataFrame(jobs)
+
+    # Convert list fields to strings for CSV
+    list_columns = ['skills_tags', 'red_flags', 'buzzwords']
+    for col in list_columns:
+        if col in df_output.columns:
+            df_output[col] = df_output[col].apply(lambda x: ','.join(x) if isinstance(x, list) else x)
+
+    # Salaries are ints or None; write them as floats so every chunk of a
+    # streamed file is formatted the same way
+    for col in ['salary_min', 'salary_max', 'min_amount', 'max_amount']:
+        if col in df_output.columns:
+            df_output[col] = df_output[col].astype(float)
+
+    if append:
+        df_output.to_csv(csv_filename, index=False, mode='a', header=False)
+    else:
+        df_output.to_csv(csv_filename, index=False)
+
+
+def print_filter_stats(filter_stats, jobs_count):
+    """Print filtering results and the top exclusion reasons."""
+    print(f"\n Filtering results:")
+    print(f"   Input jobs: {filter_stats['total_input']}")
+    print(f"   No title: {filter_stats['no_title']}")
+    print(f"   Not AI-relevant: {filter_stats['not_ai_relevant']}")
+    print(f"   No category match: {filter_stats['no_category']}")
+    print(f"   INCLUDED: {filter_stats['included']}")
+    if 'cache_hits' in filter_stats:
+        classified = filter_stats['total_input'] - filter_stats['no_title'] - filter_stats['cache_hits']
+        print(f"   Classifier cache: {filter_stats['cache_hits']} reused, {classified} classified")
+
+    # Show top exclusion reasons
+    if filter_stats['exclusion_reasons']:
+        print(f"\n Top exclusion reasons:")
+        for reason, count in filter_stats['exclusion_reasons'].most_common(5):
+            print(f"   {reason}: {count}")
+
+    print(f"\n Jobs after filtering: {jobs_count}")
+
+
+def print_market_summary(intel):
+    """Print category, seniority, remote, quality, tech and salary breakdowns."""
+    total_jobs = intel['total_jobs']
+
+    # Print category breakdown
+    print("\n By category:")
+    for cat, count in intel['categories'].items():
+        print(f"   {cat}: {count}")
+
+    # Seniority breakdown
+    print("\n By seniority:")
+    for level, count in Counter(intel['seniority_breakdown']).most_common():
+        pct = (count / total_jobs * 100) if total_jobs else 0
+        print(f"   {level}: {count} ({pct:.1f}%)")
+
+    # Remote breakdown
+    print("\n Remote breakdown:")
+    for rtype, count in intel['remote_breakdown'].items():
+        pct = (count / total_jobs * 100) if total_jobs else 0
+        print(f"   {rtype}: {count} ({pct:.1f}%)")
+
+    # Data quality breakdown
+    print("\n Data quality:")
+    for q, count in Counter(intel['data_quality_breakdown']).most_common():
+        pct = (count / total_jobs * 100) if total_jobs else 0
+        print(f"   {q}: {count} ({pct:.1f}%)")
+
+    # Tech company stats
+    tech_count = intel['tech_companies']
+    print(f"\n Tech companies: {tech_count} ({tech_count/total_jobs*100:.1f}%)")
+
+    # Salary stats
+    salary_stats = intel['salary_stats']
+    if salary_stats:
+        print(f"\n Salary data: {salary_stats['count_with_salary']} jobs with salary")
+        print(f"   Average max: ${salary_stats['avg']:,}")
+
+
+def save_jobs_json(jobs):
+    """Save jobs.json (for live job board)."""
+    output_json = {
+        'last_updated': date.today().isoformat(),
+        'total_jobs': len(jobs),
+        'jobs': jobs
+    }
+    with open(f'{DATA_DIR}/jobs.json', 'w') as f:
+        json.dump(output_json, f, indent=2)
+
+
+def enrich_streaming(raw_file, csv_filename, workers=1, chunk_rows=ENRICH_CHUNK_ROWS, cache_path=None):
+    """Enrich a raw scrape chunk by chunk, appending output as it goes.
+
+    Reads chunk_rows x workers raw rows at a time, drops URLs already seen,
+    classifies the chunk (in parallel with workers > 1) and appends the jobs
+    to csv_filename and data/jobs.jsonl. jobs.json is assembled from the
+    JSON-lines file at the end, and market intelligence from running totals.
+    Only the seen-URL set and the salary lists grow with the scrape; the jobs
+    themselves (with their descriptions) are never all in memory.
+
+    Returns:
+        Tuple of (market_intelligence_dict, filter_stats_dict)
+    """
+    columns = pd.read_csv(raw_file, nrows=0).columns
+    url_col = 'job_url' if 'job_url' in columns else 'job_url_direct'
+
+    # Text columns are read as strings so every chunk parses them the same way
+    text_columns = ['id', 'site', 'job_url', 'job_url_direct', 'title', 'company',
+                    'location', 'date_posted', 'interval', 'description']
+    reader = pd.read_csv(raw_file, chunksize=chunk_rows * workers,
+                         dtype={col: str for col in text_columns})
+
+    jsonl_filename = f'{DATA_DIR}/jobs.jsonl'
+    seen_urls = set()
+    rows_read = 0
+    rows_kept = 0
+    filter_stats = merge_filter_stats([])
+    tally = new_market_tally()
+    csv_started = False
+
+    with open(jsonl_filename, 'w') as jsonl:
+        for chunk in reader:
+            rows_read += len(chunk)
+
+            # Deduplicate against everything read so far (like drop_duplicates
+            # with keep='first': all missing URLs count as one value)
+            keep = []
+            for url in chunk[url_col]:
+                key = url if pd.notna(url) else None
+                keep.append(key not in seen_urls)
+                seen_urls.add(key)
+            chunk = chunk[np.array(keep, dtype=bool)]
+            rows_kept += len(chunk)
+
+            jobs, stats = process_jobs_parallel(chunk, apply_ai_filter=True, workers=workers,
+                                                chunk_rows=chunk_rows, cache_path=cache_path)
+            filter_stats = merge_filter_stats([filter_stats, stats])
+            tally_jobs(tally, jobs)
+
+            if jobs:
+                write_jobs_csv(jobs, csv_filename, append=csv_started)
+                csv_started = True
+            for job in jobs:
+                jsonl.write(json.dumps(job) + '\n')
+
+            print(f"   Read {rows_read:,} rows, {tally['total_jobs']:,} jobs enriched")
+
+    if not csv_started:
+        write_jobs_csv([], csv_filename)
+
+    print(f" Raw jobs loaded: {rows_read}")
+    print(f" After deduplication: {rows_kept}")
+
+    # jobs.json for the live job board, copied line by line from the JSON-lines file
+    with open(jsonl_filename) as jsonl, open(f'{DATA_DIR}/jobs.json', 'w') as f:
+        f.write(f'{{"last_updated": "{date.today().isoformat()}", '
+                f'"total_jobs": {tally["total_jobs"]}, "jobs": [')
+        for position, line in enumerate(jsonl):
+            f.write((',\n' if position else '\n') + line.rstrip('\n'))
+        f.write('\n]}\n')
+
+    return market_intelligence_from_tally(tally), filter_stats
+
+
 def main():
+    parser = argparse.ArgumentParser(description='AI Market Pulse job enrichment')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parallel enrichment processes (0 = all CPUs, default: 1)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Read the raw CSV in chunks and append output incrementally')
+    parser.add_argument('--chunk-rows', type=int, default=ENRICH_CHUNK_ROWS,
+                        help=f'Rows per chunk for --workers/--stream (default: {ENRICH_CHUNK_ROWS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Re-classify every posting instead of reusing {ENRICH_CACHE_PATH}')
+    args = parser.parse_args()
+    workers = resolve_jobs(args.workers)
+    cache_path = None if args.no_cache else ENRICH_CACHE_PATH
+
     print("="*70)
     print("  AI MARKET PULSE - JOB ENRICHMENT")
     print("="*70)
 
+    csv_filename = f"{DATA_DIR}/ai_jobs_{date.today().strftime('%Y%m%d')}.csv"
+
     # Find raw job files
     raw_files = glob.glob(f"{DATA_DIR}/raw_ai_jobs_*.csv")
     if not raw_files:
@@ -1064,99 +1700,58 @@ def main():
         latest_file = max(raw_files, key=os.path.getctime)
         print(f"\n Loading: {latest_file}")
 
-        df = pd.read_csv(latest_file)
-        print(f" Raw jobs loaded: {len(df)}")
-
-        # Deduplicate
-        url_col = 'job_url' if 'job_url' in df.columns else 'job_url_direct'
-        df = df.drop_duplicates(subset=[url_col], keep='first')
-        print(f" After deduplication: {len(df)}")
-
-        # Process jobs with AI relevance filter
-        jobs, filter_stats = process_jobs(df, apply_ai_filter=True)
-
-        # Print filtering stats
-        print(f"\n Filtering results:")
-        print(f"   Input jobs: {filter_stats['total_input']}")
-        print(f"   No title: {filter_stats['no_title']}")
-        print(f"   Not AI-relevant: {filter_stats['not_ai_relevant']}")
-        print(f"   No category match: {filter_stats['no_category']}")
-        print(f"   INCLUDED: {filter_stats['included']}")
-
-        # Show top exclusion reasons
-        if filter_stats['exclusion_reasons']:
-            print(f"\n Top exclusion reasons:")
-            for reason, count in filter_stats['exclusion_reasons'].most_common(5):
-                print(f"   {reason}: {count}")
-
-        print(f"\n Jobs after filtering: {len(jobs)}")
-
-    # Print category breakdown
-    categories = Counter(job['job_category'] for job in jobs)
-    print("\n By category:")
-    for cat, count in categories.most_common():
-        print(f"   {cat}: {count}")
-
-    # Seniority breakdown
-    seniority = Counter(job['seniority'] for job in jobs)
-    print("\n By seniority:")
-    for level, count in seniority.most_common():
-        pct = (count / len(jobs) * 100) if jobs else 0
-        print(f"   {level}: {count} ({pct:.1f}%)")
-
-    # Remote breakdown
-    remote = Counter(job['remote_type'] for job in jobs)
-    print("\n Remote breakdown:")
-    for rtype, count in remote.items():
-        pct = (count / len(jobs) * 100) if jobs else 0
-        print(f"   {rtype}: {count} ({pct:.1f}%)")
-
-    # Data quality breakdown
-    quality = Counter(job['data_quality'] for job in jobs)
-    print("\n Data quality:")
-    for q, count in quality.most_common():
-        pct = (count / len(jobs) * 100) if jobs else 0
-        print(f"   {q}: {count} ({pct:.1f}%)")
+        if cache_path:
+            os.makedirs(DATA_DIR, exist_ok=True)
+            pruned = prune_enrichment_cache(cache_path)
+            if pruned:
+                print(f" Dropped {pruned} cached classifications from older classifier rules")
+
+        if args.stream:
+            os.makedirs(DATA_DIR, exist_ok=True)
+            print(f" Streaming in chunks of {args.chunk_rows * workers:,} rows"
+                  + (f" with {workers} workers" if workers > 1 else ""))
+            intel, filter_stats = enrich_streaming(latest_file, csv_filename, workers=workers,
+                                                   chunk_rows=args.chunk_rows, cache_path=cache_path)
+            print_filter_stats(filter_stats, intel['total_jobs'])
+            jobs = None
+        else:
+            df = pd.read_csv(latest_file)
+            print(f" Raw jobs loaded: {len(df)}")
 
-    # Tech company stats
-    tech_count = sum(1 for job in jobs if job.get('is_tech'))
-    print(f"\n Tech companies: {tech_count} ({tech_count/len(jobs)*100:.1f}%)")
+            # Deduplicate
+            url_col = 'job_url' if 'job_url' in df.columns else 'job_url_direct'
+            df = df.drop_duplicates(subset=[url_col], keep='first')
+            print(f" After deduplication: {len(df)}")
 
-    # Salary stats
-    salaries = [j['salary_max'] for j in jobs if j.get('salary_max')]
-    if salaries:
-        avg_sal = sum(salaries) // len(salaries)
-        print(f"\n Salary data: {len(salaries)} jobs with salary")
-        print(f"   Average max: ${avg_sal:,}")
+            # Process jobs with AI relevance filter
+            if workers > 1:
+                print(f" Enriching with {workers} workers")
+            jobs, filter_stats = process_jobs_parallel(df, apply_ai_filter=True, workers=workers,
+                                                       chunk_rows=args.chunk_rows, cache_path=cache_path)
+            print_filter_stats(filter_stats, len(jobs))
 
     # Generate market intelligence
-    intel = generate_market_intelligence(jobs)
+    if jobs is not None:
+        intel = generate_market_intelligence(jobs)
+    print_market_summary(intel)
 
     # Ensure data directory exists
     os.makedirs(DATA_DIR, exist_ok=True)
 
-    # Save jobs.json (for live job board)
-    output_json = {
-        'last_updated': date.today().isoformat(),
-        'total_jobs': len(jobs),
-        'jobs': jobs
-    }
-    with open(f'{DATA_DIR}/jobs.json', 'w') as f:
-        json.dump(output_json, f, indent=2)
-    print(f"\n Saved: {DATA_DIR}/jobs.json")
-
-    # Save CSV for page generators
-    csv_filename = f"{DATA_DIR}/ai_jobs_{date.today().strftime('%Y%m%d')}.csv"
-    df_output = pd.DataFrame(jobs)
+    if jobs is None:
+        print(f"\n Saved: {DATA_DIR}/jobs.json (from {DATA_DIR}/jobs.jsonl)")
+        print(f" Saved: {csv_filename}")
+    else:
+        save_jobs_json(jobs)
+        print(f"\n Saved: {DATA_DIR}/jobs.json")
 
-    # Convert list fields to strings for CSV
-    list_columns = ['skills_tags', 'red_flags', 'buzzwords']
-    for col in list_columns:
-        if col in df_output.columns:
-            df_output[col] = df_output[col].apply(lambda x: ','.join(x) if isinstance(x, list) else x)
+        # Save CSV for page generators
+        write_jobs_csv(jobs, csv_filename)
+        print(f" Saved: {csv_filename}")
 
-    df_output.to_csv(csv_filename, index=False)
-    print(f" Saved: {csv_filename}")
+    # Summary sidecar, so generators don't re-read the CSV for totals
+    write_snapshot_summary(csv_filename, data_dir=DATA_DIR)
+    print(f" Saved: {summary_path(csv_filename)}")
 
     # Save market intelligence
     with open(f'{DATA_DIR}/market_intelligence.json', 'w') as f:
@@ -1166,8 +1761,8 @@ def main():
     print(f"\n{'='*70}")
     print(" ENRICHMENT COMPLETE!")
     print(f"{'='*70}")
-    print(f" Total jobs: {len(jobs)}")
-    print(f" Jobs with salary: {len(salaries)}")
+    print(f" Total jobs: {intel['total_jobs']}")
+    print(f" Jobs with salary: {intel['salary_stats'].get('count_with_salary', 0)}")
     print(f"\n Ready for page generation!")
     print("="*70)
 
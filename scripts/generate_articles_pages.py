@@ -22,13 +22,15 @@ sys.path.insert(0, script_dir)
 
 from templates import (
     get_html_head, get_nav_html, get_footer_html, get_cta_box,
-    BASE_URL, SITE_NAME, slugify
+    BASE_URL, SITE_NAME, slugify, get_stylesheet_link
 )
 from seo_core import (
     generate_breadcrumb_schema, generate_faq_schema, generate_faq_html,
     generate_article_schema, generate_article_faqs, CSS_FAQ_SECTION,
     auto_link_content
 )
+from render_pool import parse_jobs_arg, render_pages
+from site_manifest import write_page, flush_pages
 
 # Directories
 DATA_DIR = os.path.join(os.path.dirname(script_dir), 'data')
@@ -911,7 +913,7 @@ def generate_article_page(article, author, market_data, all_articles):
         seo_title,
         description,
         f"insights/{slug}/",
-        extra_head=f'<style>{CSS_ARTICLE}{CSS_FAQ_SECTION}{CSS_RELATED_RESOURCES}</style>'
+        extra_head=get_stylesheet_link('article', CSS_ARTICLE + CSS_FAQ_SECTION + CSS_RELATED_RESOURCES)
     )}
     {article_schema}
     {breadcrumb_schema}
@@ -981,9 +983,7 @@ def generate_article_page(article, author, market_data, all_articles):
 
     # Write file
     article_dir = os.path.join(INSIGHTS_DIR, slug)
-    os.makedirs(article_dir, exist_ok=True)
-    with open(os.path.join(article_dir, 'index.html'), 'w') as f:
-        f.write(html)
+    write_page(os.path.join(article_dir, 'index.html'), html)
 
     return True
 
@@ -1032,7 +1032,7 @@ def generate_tag_page(tag, articles, categories_data):
         f"{tag_display} - AI Career Insights",
         f"Articles about {tag_display.lower()} in AI careers. {article_count} insights on jobs, salaries, and skills.",
         f"insights/tags/{tag}/",
-        extra_head=f'<style>{CSS_ARTICLE}</style>',
+        extra_head=get_stylesheet_link('article-list', CSS_ARTICLE),
         robots=robots_directive
     )}
     {breadcrumb_schema}
@@ -1065,9 +1065,7 @@ def generate_tag_page(tag, articles, categories_data):
 
     # Write file
     tag_dir = os.path.join(INSIGHTS_DIR, 'tags', tag)
-    os.makedirs(tag_dir, exist_ok=True)
-    with open(os.path.join(tag_dir, 'index.html'), 'w') as f:
-        f.write(html)
+    write_page(os.path.join(tag_dir, 'index.html'), html)
 
 
 def generate_category_page(category, category_info, articles, all_categories):
@@ -1112,7 +1110,7 @@ def generate_category_page(category, category_info, articles, all_categories):
         f"{category_name} - AI Insights",
         category_desc or f"AI career {category_name.lower()}. {article_count} insights on the AI job market.",
         f"insights/category/{category}/",
-        extra_head=f'<style>{CSS_ARTICLE}</style>'
+        extra_head=get_stylesheet_link('article-list', CSS_ARTICLE)
     )}
     {breadcrumb_schema}
     {get_nav_html('insights')}
@@ -1150,13 +1148,13 @@ def generate_category_page(category, category_info, articles, all_categories):
 
     # Write file
     cat_dir = os.path.join(INSIGHTS_DIR, 'category', category)
-    os.makedirs(cat_dir, exist_ok=True)
-    with open(os.path.join(cat_dir, 'index.html'), 'w') as f:
-        f.write(html)
+    write_page(os.path.join(cat_dir, 'index.html'), html)
 
 
 def main():
     """Main generation function."""
+    render_jobs = parse_jobs_arg()
+
     # Load data
     data = load_articles_data()
     articles = data.get('articles', [])
@@ -1174,8 +1172,10 @@ def main():
 
     # Generate individual article pages
     article_count = 0
-    for article in articles:
-        if generate_article_page(article, author, market_data, articles):
+    results = render_pages(generate_article_page, articles, jobs=render_jobs,
+                           shared={'author': author, 'market_data': market_data, 'all_articles': articles})
+    for article, generated in zip(articles, results):
+        if generated:
             article_count += 1
             print(f"    Generated: /insights/{article['slug']}/")
 
@@ -1190,8 +1190,10 @@ def main():
     # Generate tag pages
     tag_count = 0
     thin_tag_count = 0
-    for tag, tag_articles in tag_index.items():
-        generate_tag_page(tag, tag_articles, categories)
+    tag_items = list(tag_index.items())
+    results = render_pages(generate_tag_page, tag_items, jobs=render_jobs,
+                           shared={'categories_data': categories})
+    for (tag, tag_articles), _ in zip(tag_items, results):
         tag_count += 1
         if len(tag_articles) < MIN_ARTICLES_FOR_TAG_INDEX:
             thin_tag_count += 1
@@ -1201,14 +1203,19 @@ def main():
 
     # Generate category pages
     cat_count = 0
-    for category, category_info in categories.items():
-        cat_articles = [a for a in articles if a.get('category') == category]
-        generate_category_page(category, category_info, cat_articles, categories)
+    category_items = [
+        (category, category_info, [a for a in articles if a.get('category') == category])
+        for category, category_info in categories.items()
+    ]
+    results = render_pages(generate_category_page, category_items, jobs=render_jobs,
+                           shared={'all_categories': categories})
+    for (category, _, _), _ in zip(category_items, results):
         cat_count += 1
         print(f"    Generated: /insights/category/{category}/")
 
     print(f"\n  Generated {article_count} article pages")
     print(f"  Generated {tag_count} tag pages ({thin_tag_count} noindexed as thin content)")
+    flush_pages()
     print(f"  Generated {cat_count} category pages")
     print("=" * 70)
 
@@ -6,9 +6,7 @@ Creates pages like /jobs/prompt-engineer/, /jobs/remote/, /jobs/san-francisco/
 
 import pandas as pd
 from datetime import datetime
-import glob
 import os
-import json
 import sys
 import hashlib
 import re
@@ -20,6 +18,8 @@ sys.path.insert(0, script_dir)
 
 try:
     from templates import get_html_head, get_nav_html, get_footer_html, get_cta_box, format_salary, is_remote, BASE_URL, SITE_NAME
+    from job_data import load_jobs
+    from site_manifest import write_page, flush_pages
 except Exception as e:
     print(f"ERROR importing templates: {e}")
     traceback.print_exc()
@@ -34,13 +34,8 @@ print("  AI MARKET PULSE - GENERATING CATEGORY PAGES")
 print("="*70)
 
 # Load job data
-files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
-if files:
-    df = pd.read_csv(max(files, key=os.path.getctime))
-elif os.path.exists(f"{DATA_DIR}/jobs.json"):
-    with open(f"{DATA_DIR}/jobs.json") as f:
-        df = pd.DataFrame(json.load(f).get('jobs', []))
-else:
+df = load_jobs(data_dir=DATA_DIR)
+if df.empty:
     print(" No job data found")
     exit(1)
 
@@ -154,10 +149,7 @@ def generate_category_page(filtered_df, slug, title, description, salary_page_sl
 
 {get_footer_html()}'''
 
-    page_dir = f'{JOBS_DIR}/{slug}'
-    os.makedirs(page_dir, exist_ok=True)
-    with open(f'{page_dir}/index.html', 'w') as f:
-        f.write(html)
+    write_page(f'{JOBS_DIR}/{slug}/index.html', html)
     return True
 
 
@@ -193,4 +185,5 @@ for field, value, slug, title, desc, salary_slug in CATEGORIES:
     if generate_category_page(filtered, slug, title, desc, salary_page_slug=salary_slug):
         print(f"   Generated /jobs/{slug}/ ({len(filtered)} jobs)")
 
+flush_pages()
 print("="*70)
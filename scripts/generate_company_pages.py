@@ -12,9 +12,9 @@ SEO FEATURES:
 - Proper meta descriptions
 """
 
+import numpy as np
 import pandas as pd
 import os
-import glob
 from datetime import datetime
 import json
 import sys
@@ -23,9 +23,12 @@ sys.path.insert(0, 'scripts')
 from templates import (
     slugify, format_salary, BASE_URL, SITE_NAME,
     get_html_head, get_nav_html, get_footer_html, get_cta_box,
-    get_breadcrumb_html, get_img_tag
+    get_breadcrumb_html, get_img_tag, get_stylesheet_link
 )
 from seo_core import generate_breadcrumb_schema, generate_collectionpage_schema
+from render_pool import parse_jobs_arg, render_pages
+from job_data import latest_jobs_file, load_jobs, summarize_companies
+from site_manifest import write_page, flush_pages
 
 # Minimum jobs required for a company page to be indexed
 MIN_JOBS_FOR_INDEX = 3
@@ -37,13 +40,12 @@ COMPANIES_DIR = f'{SITE_DIR}/companies'
 
 def get_latest_jobs():
     """Load latest enriched job data"""
-    job_files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
-    if not job_files:
+    latest_file = latest_jobs_file(DATA_DIR)
+    if not latest_file:
         return pd.DataFrame()
 
-    latest_file = sorted(job_files)[-1]
     print(f"  Loading: {latest_file}")
-    return pd.read_csv(latest_file)
+    return load_jobs(latest_file, data_dir=DATA_DIR)
 
 
 def escape_html(text):
@@ -91,73 +93,114 @@ def get_organization_schema(company_name, company_slug, num_jobs, categories, lo
     return f'<script type="application/ld+json">\n{json.dumps(schema, indent=2)}\n</script>'
 
 
-def find_similar_companies(company_name, jobs_df, all_companies_data, num_similar=6):
-    """Find similar companies based on categories, skills, and job counts."""
-    if not all_companies_data:
+def parse_skill_tags(skills):
+    """Split a skills_tags cell the way company pages always have (comma-separated)."""
+    if not isinstance(skills, str):
         return []
+    return [s.strip() for s in skills.split(',')]
 
-    # Get current company's characteristics
-    company_jobs = jobs_df[jobs_df['company'] == company_name]
-    company_categories = set()
-    company_skills = set()
 
-    if 'job_category' in company_jobs.columns:
-        company_categories = set(company_jobs['job_category'].dropna().unique())
-
-    if 'skills_tags' in company_jobs.columns:
-        for skills in company_jobs['skills_tags'].dropna():
-            if isinstance(skills, str):
-                company_skills.update([s.strip() for s in skills.split(',')])
-
-    # Score other companies
-    scored_companies = []
-    for other_company, other_data in all_companies_data.items():
-        if other_company == company_name:
-            continue
-
-        score = 0
-        other_jobs = jobs_df[jobs_df['company'] == other_company]
-
-        # Category overlap
-        other_categories = set()
-        if 'job_category' in other_jobs.columns:
-            other_categories = set(other_jobs['job_category'].dropna().unique())
-        category_overlap = len(company_categories & other_categories)
-        score += category_overlap * 20
-
-        # Skill overlap
-        other_skills = set()
-        if 'skills_tags' in other_jobs.columns:
-            for skills in other_jobs['skills_tags'].dropna():
-                if isinstance(skills, str):
-                    other_skills.update([s.strip() for s in skills.split(',')])
-        skill_overlap = len(company_skills & other_skills)
-        score += skill_overlap * 5
-
-        # Similar job count (prefer companies with similar scale)
-        current_count = len(company_jobs)
-        other_count = other_data.get('count', 0)
-        if other_count > 0:
-            size_ratio = min(current_count, other_count) / max(current_count, other_count)
-            score += int(size_ratio * 15)
-
-        # Bonus for companies with disclosed salary
-        if other_data.get('salary_range'):
-            score += 5
-
-        if score > 0:
-            scored_companies.append({
-                'name': other_company,
-                'slug': slugify(other_company),
-                'count': other_data.get('count', 0),
-                'salary_range': other_data.get('salary_range', ''),
-                'categories': list(other_categories)[:3],
-                'score': score
-            })
-
-    # Sort by score and return top N
-    scored_companies.sort(key=lambda x: (x['score'], x['count']), reverse=True)
-    return scored_companies[:num_similar]
+def format_salary_range(salary_min, salary_max):
+    """'$120K - $250K' from a summary row's salary bounds ('' if none)."""
+    if pd.isna(salary_min) or pd.isna(salary_max):
+        return ''
+    return f"${int(salary_min/1000)}K - ${int(salary_max/1000)}K"
+
+
+def build_company_profiles(jobs_df, companies, summary=None):
+    """Build a profile per company from the summarize_companies() table.
+
+    Adds what only company pages need: the skill set (for similarity) and the
+    ten most-mentioned skills.
+
+    Returns {company: {'count', 'salary_range', 'categories', 'locations',
+    'skills', 'top_skills'}} in the order of `companies`.
+    """
+    if summary is None:
+        summary = summarize_companies(jobs_df)
+
+    skills = {}
+    skill_counts = {}
+    if 'skills_tags' in jobs_df.columns:
+        tags = jobs_df['skills_tags'][jobs_df['company'].isin(companies)].dropna()
+        for company, values in tags.groupby(jobs_df['company'], sort=False):
+            company_skills = set()
+            counts = {}
+            for value in values:
+                for skill in parse_skill_tags(value):
+                    company_skills.add(skill)
+                    if skill:
+                        counts[skill] = counts.get(skill, 0) + 1
+            skills[company] = company_skills
+            skill_counts[company] = counts
+
+    profiles = {}
+    for company in companies:
+        row = summary.loc[company]
+        profiles[company] = {
+            'count': int(row['jobs']),
+            'salary_range': format_salary_range(row['salary_min'], row['salary_max']),
+            'categories': row['categories'],
+            'locations': row['locations'],
+            'skills': skills.get(company, set()),
+            'top_skills': sorted(skill_counts.get(company, {}).items(), key=lambda x: x[1], reverse=True)[:10],
+        }
+    return profiles
+
+
+def _incidence_matrix(sets):
+    """Rows of a 0/1 matrix, one per set, over the union of their members."""
+    columns = {}
+    for members in sets:
+        for member in members:
+            columns.setdefault(member, len(columns))
+    matrix = np.zeros((len(sets), max(len(columns), 1)), dtype=np.int32)
+    for row, members in enumerate(sets):
+        matrix[row, [columns[m] for m in members]] = 1
+    return matrix
+
+
+def find_similar_companies(profiles, num_similar=6):
+    """Top similar companies for every company, scored in one matrix pass.
+
+    Scoring: +20 per shared category, +5 per shared skill, up to +15 for a
+    similar job count, +5 if the other company discloses salary. Ties go to
+    the larger company, then to profile order.
+
+    Returns {company: [similar company dicts]}.
+    """
+    names = list(profiles)
+    if len(names) < 2:
+        return {name: [] for name in names}
+
+    category_matrix = _incidence_matrix([profiles[n]['categories'] for n in names])
+    skill_matrix = _incidence_matrix([profiles[n]['skills'] for n in names])
+    counts = np.array([profiles[n]['count'] for n in names], dtype=np.float64)
+    has_salary = np.array([bool(profiles[n]['salary_range']) for n in names])
+
+    # scores[i, j]: how similar company j is to company i
+    scores = category_matrix @ category_matrix.T * 20 + skill_matrix @ skill_matrix.T * 5
+    size_ratio = np.minimum.outer(counts, counts) / np.maximum.outer(counts, counts)
+    scores += (size_ratio * 15).astype(np.int32)
+    scores += np.where(has_salary, 5, 0)[np.newaxis, :].astype(np.int32)
+    np.fill_diagonal(scores, 0)
+
+    # Rank by (score, count); the stable sort keeps profile order on full ties
+    rank_keys = scores.astype(np.int64) * (int(counts.max()) + 1) + counts.astype(np.int64)
+
+    similar = {}
+    for i, name in enumerate(names):
+        candidates = np.flatnonzero(scores[i] > 0)
+        top = candidates[np.argsort(-rank_keys[i, candidates], kind='stable')[:num_similar]]
+        similar[name] = [{
+            'name': names[j],
+            'slug': slugify(names[j]),
+            'count': profiles[names[j]]['count'],
+            'salary_range': profiles[names[j]]['salary_range'],
+            'categories': profiles[names[j]]['categories'][:3],
+            'score': int(scores[i, j]),
+        } for j in top]
+    return similar
 
 
 def generate_similar_companies_html(similar_companies, current_company):
@@ -270,8 +313,13 @@ CSS_SIMILAR_COMPANIES = '''
 '''
 
 
-def generate_company_page(company_name, jobs_df, all_companies_data=None):
-    """Generate a single company page with full SEO optimization"""
+def generate_company_page(company_name, profiles, company_jobs, similar_companies=None):
+    """Generate a single company page with full SEO optimization
+
+    profiles comes from build_company_profiles(), company_jobs maps each
+    company to its postings (dicts) and similar_companies to its
+    find_similar_companies() list.
+    """
     company_slug = slugify(company_name)
     if not company_slug:
         return None
@@ -279,49 +327,21 @@ def generate_company_page(company_name, jobs_df, all_companies_data=None):
     company_dir = f"{COMPANIES_DIR}/{company_slug}"
     os.makedirs(company_dir, exist_ok=True)
 
-    # Get company jobs
-    company_jobs = jobs_df[jobs_df['company'] == company_name].copy()
-    num_jobs = len(company_jobs)
+    profile = profiles[company_name]
+    num_jobs = profile['count']
 
     # Determine if page should be noindexed (thin content protection)
     is_thin_content = num_jobs < MIN_JOBS_FOR_INDEX
     robots_meta = '<meta name="robots" content="noindex, follow">' if is_thin_content else ''
 
-    # Get unique categories
-    categories = []
-    if 'job_category' in company_jobs.columns:
-        categories = company_jobs['job_category'].dropna().unique().tolist()
-
-    # Calculate salary range
-    salary_range = ""
-    if 'salary_max' in company_jobs.columns:
-        salaries = pd.to_numeric(company_jobs['salary_max'], errors='coerce').dropna()
-        if len(salaries) > 0:
-            min_sal = salaries.min()
-            max_sal = salaries.max()
-            salary_range = f"${int(min_sal/1000)}K - ${int(max_sal/1000)}K"
-
-    # Get locations
-    locations = []
-    if 'location' in company_jobs.columns:
-        locations = company_jobs['location'].dropna().unique().tolist()[:5]
-
-    # Skills mentioned
-    skills_mentioned = []
-    if 'skills_tags' in company_jobs.columns:
-        for skills in company_jobs['skills_tags'].dropna():
-            if isinstance(skills, str):
-                skills_mentioned.extend(skills.split(','))
-    skills_count = {}
-    for skill in skills_mentioned:
-        skill = skill.strip()
-        if skill:
-            skills_count[skill] = skills_count.get(skill, 0) + 1
-    top_skills = sorted(skills_count.items(), key=lambda x: x[1], reverse=True)[:10]
+    categories = profile['categories']
+    salary_range = profile['salary_range']
+    locations = profile['locations'][:5]
+    top_skills = profile['top_skills']
 
     # Generate job listings HTML
     jobs_html = ""
-    for _, job in company_jobs.iterrows():
+    for job in company_jobs[company_name]:
         title = job.get('title', 'Untitled')
         location = job.get('location', 'Location not specified')
         salary = format_salary(job.get('salary_min'), job.get('salary_max'))
@@ -382,9 +402,9 @@ def generate_company_page(company_name, jobs_df, all_companies_data=None):
 
     # === SIMILAR COMPANIES ===
     similar_companies_html = ""
-    if all_companies_data and len(all_companies_data) > 1:
-        similar_companies = find_similar_companies(company_name, jobs_df, all_companies_data, num_similar=6)
-        similar_companies_html = generate_similar_companies_html(similar_companies, company_name)
+    if similar_companies:
+        similar_companies_html = generate_similar_companies_html(similar_companies.get(company_name, []),
+                                                                 company_name)
 
     # Custom CSS for company pages
     company_css = '''
@@ -483,15 +503,16 @@ def generate_company_page(company_name, jobs_df, all_companies_data=None):
             .company-header h1 { font-size: 1.75rem; }
             .company-stats { flex-direction: column; }
         }
-        ''' + CSS_SIMILAR_COMPANIES + '''
     </style>
-    '''
+    ''' + get_stylesheet_link('similar-companies', CSS_SIMILAR_COMPANIES)
+
+    extra_head = f'{org_schema}\\n{company_css}'
 
     html = f'''{get_html_head(
         page_title,
         meta_desc,
         f"companies/{company_slug}/",
-        extra_head=f'{org_schema}\\n{company_css}',
+        extra_head=extra_head,
         robots=robots_directive
     )}
 {get_nav_html('companies')}
@@ -538,8 +559,7 @@ def generate_company_page(company_name, jobs_df, all_companies_data=None):
 {get_footer_html()}'''
 
     output_path = f"{company_dir}/index.html"
-    with open(output_path, 'w') as f:
-        f.write(html)
+    write_page(output_path, html)
 
     return company_slug, is_thin_content
 
@@ -617,11 +637,13 @@ def generate_companies_index(companies_data):
 
     meta_desc = f"Browse {company_count} companies actively hiring for AI, ML, and Prompt Engineering roles."
 
+    extra_head = f'{collection_schema}\\n{companies_css}'
+
     html = f'''{get_html_head(
         "Companies Hiring for AI Roles",
         meta_desc,
         "companies/",
-        extra_head=f'{collection_schema}\\n{companies_css}'
+        extra_head=extra_head
     )}
 {get_nav_html('companies')}
 
@@ -645,8 +667,7 @@ def generate_companies_index(companies_data):
 {get_footer_html()}'''
 
     output_path = f"{COMPANIES_DIR}/index.html"
-    with open(output_path, 'w') as f:
-        f.write(html)
+    write_page(output_path, html)
 
     print(f"  Saved companies index: {output_path}")
 
@@ -656,6 +677,8 @@ def main():
     print("  GENERATING COMPANY PAGES")
     print("="*70)
 
+    render_jobs = parse_jobs_arg()
+
     # Load job data
     jobs_df = get_latest_jobs()
     if jobs_df.empty:
@@ -664,33 +687,19 @@ def main():
 
     print(f"  Loaded {len(jobs_df)} jobs")
 
-    # Get companies with enough jobs
-    company_counts = jobs_df['company'].value_counts()
-    companies_to_generate = company_counts[company_counts >= 2].index.tolist()
+    # Get companies with enough jobs (one groupby: counts, salaries, categories, locations)
+    summary = summarize_companies(jobs_df)
+    companies_to_generate = summary.index[summary['jobs'] >= 2].tolist()
 
     print(f"  Found {len(companies_to_generate)} companies with 2+ jobs")
 
-    # First pass: collect all companies data for similar companies feature
-    companies_data = {}
-    for company in companies_to_generate:
-        if pd.isna(company) or not company or company == 'Unknown':
-            continue
-
-        company_jobs = jobs_df[jobs_df['company'] == company]
-
-        # Calculate salary range
-        salary_range = ""
-        if 'salary_max' in company_jobs.columns:
-            salaries = pd.to_numeric(company_jobs['salary_max'], errors='coerce').dropna()
-            if len(salaries) > 0:
-                min_sal = salaries.min()
-                max_sal = salaries.max()
-                salary_range = f"${int(min_sal/1000)}K - ${int(max_sal/1000)}K"
-
-        companies_data[company] = {
-            'count': len(company_jobs),
-            'salary_range': salary_range
-        }
+    # First pass: company profiles from the summary, then similarity over all companies
+    companies = [company for company in companies_to_generate
+                 if not (pd.isna(company) or not company or company == 'Unknown')]
+    companies_data = build_company_profiles(jobs_df, companies, summary)
+    similar_companies = find_similar_companies(companies_data, num_similar=6)
+    company_jobs = {company: group.to_dict('records')
+                    for company, group in jobs_df[jobs_df['company'].isin(companies)].groupby('company', sort=False)}
 
     # Second pass: generate individual company pages with similar companies
     print(f"  (with similar companies internal linking)")
@@ -698,8 +707,10 @@ def main():
     indexed_count = 0
     noindex_count = 0
 
-    for company in companies_data.keys():
-        result = generate_company_page(company, jobs_df, all_companies_data=companies_data)
+    results = render_pages(generate_company_page, list(companies_data.keys()), jobs=render_jobs,
+                           shared={'profiles': companies_data, 'company_jobs': company_jobs,
+                                   'similar_companies': similar_companies})
+    for result in results:
         if result:
             slug, is_thin = result
             generated += 1
@@ -710,6 +721,7 @@ def main():
 
     # Generate index page
     generate_companies_index(companies_data)
+    flush_pages()
 
     print(f"\n{'='*70}")
     print(f"  Generated {generated} company pages")
@@ -10,9 +10,15 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime, timedelta
 import os
-import glob
+import sys
 import json
 
+# Add scripts directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from job_data import latest_jobs_file, load_jobs, load_snapshot_summary
+
 # ============================================================
 # GITHUB ACTIONS CONFIGURATION
 # ============================================================
@@ -44,8 +50,8 @@ tracking_file = f'{DATA_DIR}/job_count_history.csv'
 def update_tracking_data():
     """Update job count tracking from current data"""
     # Find latest enriched file
-    job_files = glob.glob(f'{DATA_DIR}/ai_jobs_*.csv')
-    if not job_files:
+    latest_file = latest_jobs_file(DATA_DIR)
+    if not latest_file:
         print("  No enriched job files found")
         return None
 
@@ -74,10 +80,8 @@ def update_tracking_data():
     else:
         df_tracking = pd.DataFrame(columns=['Date', 'AI Job Openings'])
 
-    # Get today's count from latest file
-    latest_file = sorted(job_files)[-1]
-    jobs_df = pd.read_csv(latest_file)
-    today_count = len(jobs_df)
+    # Get today's count from the latest snapshot's summary sidecar
+    today_count = load_snapshot_summary(latest_file, data_dir=DATA_DIR)['rows']
     today = pd.Timestamp.now().normalize()
 
     # Add today's data if not already present
@@ -172,17 +176,16 @@ def create_graph(df_subset, title, filename, show_annotations=True):
 
 def create_category_chart():
     """Create a bar chart showing job distribution by category"""
-    job_files = glob.glob(f'{DATA_DIR}/ai_jobs_*.csv')
-    if not job_files:
+    latest_file = latest_jobs_file(DATA_DIR)
+    if not latest_file:
         return
 
-    latest_file = sorted(job_files)[-1]
-    jobs_df = pd.read_csv(latest_file)
+    counts = load_snapshot_summary(latest_file, data_dir=DATA_DIR)['counts']
 
-    if 'job_category' not in jobs_df.columns:
+    if 'job_category' not in counts:
         return
 
-    categories = jobs_df['job_category'].value_counts().head(8)
+    categories = pd.Series(counts['job_category']).head(8)
 
     fig, ax = plt.subplots(figsize=(12, 8), facecolor=colors['bg'])
     ax.set_facecolor(colors['bg'])
@@ -213,12 +216,11 @@ def create_category_chart():
 
 def create_salary_distribution():
     """Create a histogram of salary distribution"""
-    job_files = glob.glob(f'{DATA_DIR}/ai_jobs_*.csv')
-    if not job_files:
+    latest_file = latest_jobs_file(DATA_DIR)
+    if not latest_file:
         return
 
-    latest_file = sorted(job_files)[-1]
-    jobs_df = pd.read_csv(latest_file)
+    jobs_df = load_jobs(latest_file, columns=['salary_max'], data_dir=DATA_DIR)
 
     if 'salary_max' not in jobs_df.columns:
         return
@@ -261,30 +263,26 @@ def create_salary_distribution():
 
 def create_social_preview():
     """Create social preview image with highest paying job this week"""
-    job_files = glob.glob(f'{DATA_DIR}/ai_jobs_*.csv')
-    if not job_files:
+    latest_file = latest_jobs_file(DATA_DIR)
+    if not latest_file:
         print(f"\n  No jobs file found - skipping social preview")
         return
 
-    latest_file = sorted(job_files)[-1]
     print(f"\n  Social Preview")
     print(f"   Loading: {latest_file}")
 
     try:
-        jobs_df = pd.read_csv(latest_file)
+        summary = load_snapshot_summary(latest_file, data_dir=DATA_DIR)
 
-        if 'salary_max' not in jobs_df.columns:
+        if summary['salary'] is None:
             print("    No salary_max column found")
             return
 
-        valid_jobs = jobs_df[jobs_df['salary_max'].notna() & (jobs_df['salary_max'] > 0)]
-
-        if valid_jobs.empty:
+        if not summary['positive_salary']['count']:
             print("    No jobs with valid salary data")
             return
 
-        top_job = valid_jobs.loc[valid_jobs['salary_max'].idxmax()]
-        max_salary = int(top_job['salary_max'])
+        max_salary = int(summary['positive_salary']['max'])
         salary_k = f"${max_salary // 1000}k"
 
         print(f"   Found top salary: {salary_k}")
@@ -328,17 +326,16 @@ def create_social_preview():
 
 def create_remote_breakdown():
     """Create a pie chart showing remote vs onsite breakdown"""
-    job_files = glob.glob(f'{DATA_DIR}/ai_jobs_*.csv')
-    if not job_files:
+    latest_file = latest_jobs_file(DATA_DIR)
+    if not latest_file:
         return
 
-    latest_file = sorted(job_files)[-1]
-    jobs_df = pd.read_csv(latest_file)
+    counts = load_snapshot_summary(latest_file, data_dir=DATA_DIR)['counts']
 
-    if 'remote_type' not in jobs_df.columns:
+    if 'remote_type' not in counts:
         return
 
-    remote_counts = jobs_df['remote_type'].value_counts()
+    remote_counts = pd.Series(counts['remote_type'])
 
     fig, ax = plt.subplots(figsize=(10, 10), facecolor=colors['bg'])
     ax.set_facecolor(colors['bg'])
@@ -9,7 +9,6 @@ Uses the shared templates for consistent styling with other pages.
 import json
 import pandas as pd
 import os
-import glob
 import re
 import hashlib
 from datetime import datetime
@@ -24,20 +23,20 @@ from templates import (
     format_salary, slugify, BASE_URL, SITE_NAME
 )
 from seo_core import generate_organization_schema, generate_website_schema
+from job_data import latest_jobs_file, previous_jobs_file, load_jobs, summarize_companies, load_snapshot_summary
+from snapshot_diff import load_snapshot_diff
+from site_manifest import write_page, flush_pages
 
 DATA_DIR = 'data'
 SITE_DIR = 'site'
 
+# generate_company_pages.py builds a page for every company with 2+ jobs
+MIN_JOBS_FOR_COMPANY_PAGE = 2
+
 
 def get_jobs_files():
     """Find the two most recent ai_jobs CSV files"""
-    pattern = f"{DATA_DIR}/ai_jobs_*.csv"
-    files = sorted(glob.glob(pattern))
-    if not files:
-        return None, None
-    current = files[-1]
-    previous = files[-2] if len(files) >= 2 else None
-    return current, previous
+    return latest_jobs_file(DATA_DIR), previous_jobs_file(DATA_DIR)
 
 
 def calculate_stats():
@@ -49,52 +48,57 @@ def calculate_stats():
             'date': datetime.now().strftime('%Y-%m-%d'),
             'total_jobs': 0,
             'wow_change': 0,
+            'jobs_added': 0,
+            'jobs_removed': 0,
             'remote_pct': 0,
             'avg_max_salary': 0,
             'jobs_with_salary': 0,
             'top_categories': []
         }
 
-    df = pd.read_csv(current_file)
-    total_jobs = len(df)
+    # Totals come from the snapshot's summary sidecar (see job_data.load_snapshot_summary)
+    summary = load_snapshot_summary(current_file, data_dir=DATA_DIR)
+    counts = summary['counts']
+    total_jobs = summary['rows']
 
-    # Calculate WoW change
+    # Calculate WoW change (from the snapshot diff sidecar, see snapshot_diff.py)
     wow_change = 0
+    jobs_added = jobs_removed = 0
     if previous_file:
-        prev_df = pd.read_csv(previous_file)
-        prev_jobs = len(prev_df)
+        diff = load_snapshot_diff(current_file, previous_file, data_dir=DATA_DIR)
+        prev_jobs = diff['old']['jobs']
+        jobs_added, jobs_removed = diff['added'], diff['removed']
         if prev_jobs > 0:
             wow_change = ((total_jobs - prev_jobs) / prev_jobs) * 100
-            print(f"  WoW: {prev_jobs} -> {total_jobs} ({wow_change:+.0f}%)")
+            print(f"  WoW: {prev_jobs} -> {total_jobs} ({wow_change:+.0f}%), "
+                  f"{jobs_added} added, {jobs_removed} removed")
 
     # Calculate remote percentage
     remote_pct = 0
-    if 'remote_type' in df.columns:
-        remote_count = (df['remote_type'] == 'remote').sum()
+    if 'remote_type' in counts:
+        remote_count = counts['remote_type'].get('remote', 0)
         remote_pct = (remote_count / total_jobs * 100) if total_jobs > 0 else 0
-    elif 'is_remote' in df.columns:
-        remote_pct = (df['is_remote'].sum() / total_jobs * 100) if total_jobs > 0 else 0
+    elif summary['is_remote'] is not None:
+        remote_pct = (summary['is_remote'] / total_jobs * 100) if total_jobs > 0 else 0
 
     # Calculate average max salary
     avg_max_salary = 0
     jobs_with_salary = 0
-    if 'salary_max' in df.columns:
-        salary_data = pd.to_numeric(df['salary_max'], errors='coerce')
-        salary_data = salary_data[(salary_data > 50000) & (salary_data < 1000000)]
-        if len(salary_data) > 0:
-            avg_max_salary = int(salary_data.mean())
-            jobs_with_salary = len(salary_data)
+    if summary['salary'] and summary['salary']['count'] > 0:
+        avg_max_salary = int(summary['salary']['mean'])
+        jobs_with_salary = summary['salary']['count']
 
     # Top categories
     top_categories = []
-    if 'job_category' in df.columns:
-        top_cats = df['job_category'].value_counts().head(5)
-        top_categories = list(top_cats.index)
+    if 'job_category' in counts:
+        top_categories = list(counts['job_category'])[:5]
 
     return {
         'date': datetime.now().strftime('%Y-%m-%d'),
         'total_jobs': total_jobs,
         'wow_change': wow_change,
+        'jobs_added': jobs_added,
+        'jobs_removed': jobs_removed,
         'remote_pct': remote_pct,
         'avg_max_salary': avg_max_salary,
         'jobs_with_salary': jobs_with_salary,
@@ -118,7 +122,8 @@ def get_featured_jobs(limit=6):
     if not current_file:
         return []
 
-    df = pd.read_csv(current_file)
+    df = load_jobs(current_file, columns=['title', 'company', 'location', 'salary_min', 'salary_max', 'job_category'],
+                   data_dir=DATA_DIR)
 
     # Prioritize jobs with salary data
     if 'salary_max' in df.columns:
@@ -129,6 +134,28 @@ def get_featured_jobs(limit=6):
     return featured
 
 
+def get_top_companies(limit=8):
+    """Companies with the most open roles (that have a company page)"""
+    current_file, _ = get_jobs_files()
+    if not current_file:
+        return []
+
+    df = load_jobs(current_file, columns=['company', 'salary_max', 'job_category', 'location',
+                                          'remote_type', 'is_remote'], data_dir=DATA_DIR)
+    summary = summarize_companies(df)
+
+    top = []
+    for company, row in summary[summary['jobs'] >= MIN_JOBS_FOR_COMPANY_PAGE].iterrows():
+        slug = slugify(company)
+        if not slug or company == 'Unknown':
+            continue
+        name = str(company).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        top.append({'name': name, 'slug': slug, 'jobs': int(row['jobs'])})
+        if len(top) == limit:
+            break
+    return top
+
+
 def generate_homepage():
     """Generate the main homepage HTML"""
     print("="*70)
@@ -137,6 +164,7 @@ def generate_homepage():
 
     stats = calculate_stats()
     featured_jobs = get_featured_jobs(6)
+    top_companies = get_top_companies(8)
 
     # Format date
     update_date = datetime.strptime(stats['date'], '%Y-%m-%d').strftime('%B %d, %Y')
@@ -145,6 +173,25 @@ def generate_homepage():
     wow_arrow = '↑' if stats['wow_change'] >= 0 else '↓'
     wow_class = 'positive' if stats['wow_change'] >= 0 else 'negative'
 
+    # Top hiring companies (links to company pages)
+    companies_html = '\n                '.join(
+        f'<a href="/companies/{c["slug"]}/" class="category-tag">{c["name"]} ({c["jobs"]})</a>'
+        for c in top_companies
+    )
+    companies_section = f'''
+    <section class="categories-section">
+        <div class="container">
+            <div class="section-header">
+                <h2>Top Hiring Companies</h2>
+            </div>
+            <div class="categories-grid">
+                {companies_html}
+                <a href="/companies/" class="category-tag">All Companies →</a>
+            </div>
+        </div>
+    </section>
+''' if top_companies else ''
+
     # Generate featured jobs HTML
     featured_html = ''
     for job in featured_jobs:
@@ -518,7 +565,7 @@ def generate_homepage():
             </div>
         </div>
     </section>
-
+{companies_section}
     <section class="cta-section">
         <div class="container">
             <h2>Stay Updated on AI Jobs</h2>
@@ -567,8 +614,8 @@ def generate_homepage():
 
     # Write homepage
     output_path = f"{SITE_DIR}/index.html"
-    with open(output_path, 'w') as f:
-        f.write(html)
+    write_page(output_path, html)
+    flush_pages()
 
     print(f"\n  Saved: {output_path}")
     print(f"  Total jobs: {stats['total_jobs']}")
@@ -12,14 +12,19 @@ Generates visualization charts for the insights page:
 Outputs to site/assets/ for the website.
 """
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import json
 import os
-import glob
+import sys
 from collections import Counter
 
+# Add scripts directory to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from job_data import load_jobs
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
@@ -69,11 +74,8 @@ def load_market_intelligence():
 
 def load_jobs_data():
     """Load latest jobs data."""
-    job_files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
-    if not job_files:
-        return None
-    latest_file = sorted(job_files)[-1]
-    return pd.read_csv(latest_file)
+    df = load_jobs(data_dir=DATA_DIR)
+    return None if df.empty else df
 
 
 def create_tools_chart(intel):
@@ -4,9 +4,7 @@ Generate market intelligence/insights page at /insights/
 Analyzes AI tools, frameworks, skills, and trends from job descriptions.
 """
 
-import pandas as pd
 from datetime import datetime
-import glob
 import os
 import json
 import sys
@@ -19,6 +17,8 @@ sys.path.insert(0, script_dir)
 try:
     from templates import get_html_head, get_nav_html, get_footer_html, get_cta_box, BASE_URL, SITE_NAME
     from seo_core import generate_collectionpage_schema, generate_itemlist_schema
+    from job_data import load_jobs, load_snapshot_summary, summarize_snapshot
+    from site_manifest import write_page, flush_pages
 except Exception as e:
     print(f"ERROR importing templates: {e}")
     traceback.print_exc()
@@ -42,23 +42,19 @@ if os.path.exists(intel_file):
         intel = json.load(f)
     print(f"\n Loaded market intelligence data")
 else:
-    # Generate from job data
-    files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
-    if files:
-        df = pd.read_csv(max(files, key=os.path.getctime))
-    elif os.path.exists(f"{DATA_DIR}/jobs.json"):
-        with open(f"{DATA_DIR}/jobs.json") as f:
-            df = pd.DataFrame(json.load(f).get('jobs', []))
-    else:
+    # Generate from the latest snapshot's summary sidecar (or jobs.json without a snapshot)
+    summary = (load_snapshot_summary(data_dir=DATA_DIR)
+               or summarize_snapshot(load_jobs(columns=['job_category', 'remote_type'], data_dir=DATA_DIR)))
+    if not summary['rows']:
         print(" No data found")
         exit(1)
 
     # Basic intel from job data
     intel = {
-        'total_jobs': len(df),
+        'total_jobs': summary['rows'],
         'skills': {},
-        'categories': df['job_category'].value_counts().to_dict() if 'job_category' in df.columns else {},
-        'remote_breakdown': df['remote_type'].value_counts().to_dict() if 'remote_type' in df.columns else {},
+        'categories': summary['counts'].get('job_category', {}),
+        'remote_breakdown': summary['counts'].get('remote_type', {}),
     }
 
 total_jobs = intel.get('total_jobs', 0)
@@ -449,8 +445,8 @@ html = f'''{get_html_head(
 
 {get_footer_html()}'''
 
-with open(f'{INSIGHTS_DIR}/index.html', 'w') as f:
-    f.write(html)
+write_page(f'{INSIGHTS_DIR}/index.html', html)
+flush_pages()
 
 print(f"\n Generated insights page")
 print(f" Total jobs analyzed: {total_jobs}")
@@ -5,9 +5,7 @@ Generate the main job board listing page at /jobs/index.html
 
 import pandas as pd
 from datetime import datetime
-import glob
 import os
-import json
 import sys
 import hashlib
 import re
@@ -23,6 +21,8 @@ try:
         slugify, format_salary, is_remote, BASE_URL, SITE_NAME
     )
     from seo_core import generate_collectionpage_schema, generate_itemlist_schema
+    from job_data import list_jobs_files, load_jobs, load_snapshot_summary, summarize_snapshot
+    from site_manifest import write_page, flush_pages
 except Exception as e:
     print(f"ERROR importing templates: {e}")
     traceback.print_exc()
@@ -157,20 +157,17 @@ def main():
     os.makedirs(JOBS_DIR, exist_ok=True)
 
     # Load job data
-    files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
+    files = list_jobs_files(DATA_DIR)
     print(f"  Looking for CSV files in {DATA_DIR}/")
     print(f"  Found: {files}")
 
+    df = load_jobs(data_dir=DATA_DIR)
     if files:
-        latest_file = max(files, key=os.path.getmtime)
+        latest_file = files[-1]
         print(f"  Loading: {latest_file}")
-        df = pd.read_csv(latest_file)
         print(f"\n Loaded {len(df)} jobs from {latest_file}")
         print(f"  Columns: {list(df.columns)}")
-    elif os.path.exists(f"{DATA_DIR}/jobs.json"):
-        with open(f"{DATA_DIR}/jobs.json") as f:
-            data = json.load(f)
-        df = pd.DataFrame(data.get('jobs', []))
+    elif not df.empty:
         print(f"\n Loaded {len(df)} jobs from jobs.json")
     else:
         print(f" No job data found in {DATA_DIR}/")
@@ -180,22 +177,21 @@ def main():
             print(f"  Data dir contents: {os.listdir(DATA_DIR)}")
         sys.exit(1)
 
-    # Calculate stats
+    # Calculate stats (from the snapshot's summary sidecar when there is a snapshot)
+    summary = load_snapshot_summary(files[-1], data_dir=DATA_DIR) if files else summarize_snapshot(df)
+    counts = summary['counts']
     total_jobs = len(df)
 
     # Count remote jobs safely
-    remote_jobs = 0
-    if 'remote_type' in df.columns:
-        remote_jobs = len(df[df['remote_type'].astype(str).str.contains('remote', case=False, na=False)])
+    remote_jobs = sum(n for value, n in counts.get('remote_type', {}).items() if 'remote' in value.lower())
 
     # Salary stats
     salary_col = 'salary_max' if 'salary_max' in df.columns else 'max_amount'
-    salaries = df[salary_col].dropna() if salary_col in df.columns else pd.Series([])
-    salaries = salaries[salaries > 0]
-    avg_salary = int(salaries.mean() / 1000) if len(salaries) > 0 else 0
+    salaries = summary['positive_salary']
+    avg_salary = int(salaries['mean'] / 1000) if salaries and salaries['count'] > 0 else 0
 
     # Category counts
-    categories = df['job_category'].value_counts().head(6).to_dict() if 'job_category' in df.columns else {}
+    categories = dict(list(counts.get('job_category', {}).items())[:6])
 
     # Sort by salary (highest first), then by date
     if salary_col in df.columns:
@@ -289,6 +285,7 @@ def main():
 
         print(f"   Generated page {page_num}/{total_pages} (jobs {start_idx+1}-{end_idx})")
 
+    flush_pages()
     print(f"\n Generated job board with {total_jobs} jobs across {total_pages} pages")
     print("="*70)
 
@@ -446,8 +443,7 @@ def _generate_page_html(page_num, total_pages, total_jobs, avg_salary, remote_jo
         os.makedirs(page_dir, exist_ok=True)
         output_path = f'{page_dir}/index.html'
 
-    with open(output_path, 'w') as f:
-        f.write(html)
+    write_page(output_path, html)
 
 
 if __name__ == "__main__":
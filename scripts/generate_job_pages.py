@@ -9,17 +9,25 @@ SEO FEATURES:
 - Open Graph tags for social sharing
 - Twitter card tags
 - JobPosting JSON-LD schema for rich results
-- Stale job handling with similar job recommendations
+- Stale job handling with similar job recommendations (stale pages are the
+  pages in data/job_pages_manifest.json that are no longer in the data; the
+  master store's lifecycle table adds when each job was last listed)
+
+Pass --incremental to skip pages whose inputs (job fields, related jobs,
+template code) are unchanged since the last run, per data/job_pages_manifest.json.
+When the snapshot diff (snapshot_diff.py) shows the same jobs as the last run,
+on the same day and template, live pages are not even re-hashed.
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-import glob
 import os
 import re
 import hashlib
 import json
 import sys
+import sqlite3
 import traceback
 
 # Add scripts directory to path using absolute path
@@ -30,11 +38,17 @@ try:
     from templates import (
         get_html_head, get_nav_html, get_footer_html, get_cta_box,
         get_job_posting_schema, slugify, format_salary, is_remote,
-        get_breadcrumb_html, get_img_tag,
-        BASE_URL, SITE_NAME, CSS_VARIABLES, CSS_NAV, CSS_LAYOUT, CSS_CARDS, CSS_CTA, CSS_FOOTER, CSS_JOB_PAGE
+        get_breadcrumb_html, get_img_tag, get_base_styles, get_stylesheet_link,
+        BASE_URL, SITE_NAME
     )
-    from seo_core import generate_breadcrumb_schema
+    from seo_core import generate_breadcrumb_schema, record_page_head
     from nav_config import NAV_ITEMS, FOOTER_ITEMS, SUBSCRIBE_LINK, SUBSCRIBE_LABEL, NEWSLETTER_LINK
+    from render_pool import parse_jobs_arg, render_pages
+    from job_data import load_jobs, latest_jobs_file
+    from snapshot_diff import load_snapshot_diff
+    from master_store import has_store
+    from job_db import build_job_db, expired_jobs
+    from site_manifest import write_page, flush_pages
 except Exception as e:
     print(f"ERROR importing modules: {e}")
     traceback.print_exc()
@@ -43,6 +57,16 @@ except Exception as e:
 DATA_DIR = 'data'
 SITE_DIR = 'site'
 JOBS_DIR = f'{SITE_DIR}/jobs'
+MANIFEST_PATH = f'{DATA_DIR}/job_pages_manifest.json'
+RENDER_JOBS = parse_jobs_arg()
+INCREMENTAL = '--incremental' in sys.argv[1:]
+
+# Job fields that shape a job page (its own and those shown for related jobs)
+JOB_PAGE_FIELDS = [
+    'company', 'company_name', 'title', 'location', 'remote_type', 'is_remote',
+    'salary_min', 'salary_max', 'min_amount', 'max_amount', 'job_category',
+    'experience_level', 'skills_tags', 'date_posted', 'job_url_direct', 'source_url',
+]
 
 print("="*70)
 print("  AI MARKET PULSE - GENERATING INDIVIDUAL JOB PAGES")
@@ -50,28 +74,68 @@ print("="*70)
 
 os.makedirs(JOBS_DIR, exist_ok=True)
 
-# Find most recent enriched data
-files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
-if not files:
-    # Try loading from jobs.json
-    if os.path.exists(f"{DATA_DIR}/jobs.json"):
-        print(f"\n Loading from jobs.json...")
-        with open(f"{DATA_DIR}/jobs.json") as f:
-            data = json.load(f)
-        df = pd.DataFrame(data.get('jobs', []))
-        print(f" Loaded {len(df)} jobs")
-    else:
-        print(" No job data found")
-        exit(1)
-else:
-    latest_file = max(files, key=os.path.getctime)
-    df = pd.read_csv(latest_file)
-    print(f"\n Loaded {len(df)} jobs from {latest_file}")
+# Find most recent enriched data (falls back to jobs.json)
+latest_file = latest_jobs_file(DATA_DIR)
+df = load_jobs(latest_file, data_dir=DATA_DIR)
+if df.empty:
+    print(" No job data found")
+    exit(1)
+print(f"\n Loaded {len(df)} jobs from {latest_file or 'jobs.json'}")
 
 update_date = datetime.now().strftime('%B %d, %Y')
 iso_date = datetime.now().strftime('%Y-%m-%d')
 
 
+def get_template_version():
+    """Hash of the code that renders job pages, so template edits invalidate every page"""
+    digest = hashlib.md5()
+    for name in ['generate_job_pages.py', 'templates.py', 'seo_core.py', 'nav_config.py']:
+        with open(os.path.join(script_dir, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+TEMPLATE_VERSION = get_template_version()
+
+
+def load_page_manifest(snapshot_fingerprint=None):
+    """Load slug -> input hash from the previous run (None if missing or unreadable).
+
+    Also returns True if that run rendered the same snapshot fingerprint with
+    this template on this date, i.e. every live page's inputs are unchanged.
+    """
+    if not os.path.exists(MANIFEST_PATH):
+        return None, False
+    try:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None, False
+    same_inputs = (snapshot_fingerprint is not None
+                   and manifest.get('snapshot') == snapshot_fingerprint
+                   and manifest.get('template_version') == TEMPLATE_VERSION
+                   and manifest.get('generated') == iso_date)
+    return manifest.get('pages'), same_inputs
+
+
+def page_input_hash(*parts):
+    """Hash page inputs: strings as-is, jobs (Series/dicts) by JOB_PAGE_FIELDS"""
+    values = [TEMPLATE_VERSION]
+    for part in parts:
+        if isinstance(part, str):
+            values.append(part)
+        else:
+            values.append([str(part.get(field)) for field in JOB_PAGE_FIELDS])
+    return hashlib.md5(json.dumps(values).encode()).hexdigest()
+
+
+def page_is_current(slug, page_hash, previous_hashes):
+    """True if the page on disk was rendered from identical inputs"""
+    return (previous_hashes is not None
+            and previous_hashes.get(slug) == page_hash
+            and os.path.exists(f'{JOBS_DIR}/{slug}/index.html'))
+
+
 def make_slug(text):
     """Convert text to URL-friendly slug"""
     if pd.isna(text):
@@ -105,61 +169,118 @@ def parse_skills(skills_value):
     return []
 
 
-def find_related_jobs(job, all_jobs_df, num_related=4):
-    """Find related jobs based on company, category, and skills."""
-    related = []
-    company = str(job.get('company', job.get('company_name', '')))
-    category = str(job.get('job_category', ''))
-    skills = parse_skills(job.get('skills_tags'))
-    current_title = str(job.get('title', ''))
-    current_location = str(job.get('location', ''))
+def _job_identity(job):
+    """Company/title/location key used to recognise the same posting."""
+    return (
+        str(job.get('company', job.get('company_name', ''))),
+        str(job.get('title', '')),
+        str(job.get('location', '')),
+    )
+
+
+def _has_salary(job):
+    """True if the job has a positive max salary (shown as a bonus in scoring)."""
+    if pd.notna(job.get('salary_max', job.get('max_amount'))):
+        try:
+            return float(job.get('salary_max', job.get('max_amount', 0))) > 0
+        except:
+            pass
+    return False
+
+
+def top_positions(scores, num, candidates=None):
+    """Positions of the num highest scores, ties broken by position."""
+    if candidates is None:
+        candidates = np.arange(len(scores))
+    if len(candidates) > num:
+        # Only rows scoring at least the Nth best can make the cut
+        cutoff = np.partition(scores[candidates], -num)[-num]
+        candidates = candidates[scores[candidates] >= cutoff]
+    return candidates[np.argsort(-scores[candidates], kind='stable')[:num]]
+
+
+def build_related_jobs_index(all_jobs_df):
+    """Precompute inverted postings for related-job scoring.
+
+    Built once per run so each page's lookup touches only the rows that share
+    a company, category or skill instead of re-scanning the whole DataFrame.
+    Postings map a key to a sorted array of row positions in all_jobs_df.
+    """
+    company_postings = {}
+    category_postings = {}
+    skill_postings = {}
+    identity_postings = {}
+    remote = np.zeros(len(all_jobs_df), dtype=bool)
+    salary = np.zeros(len(all_jobs_df), dtype=bool)
+
+    for pos, (_, job) in enumerate(all_jobs_df.iterrows()):
+        identity = _job_identity(job)
+        identity_postings.setdefault(identity, []).append(pos)
+        company_postings.setdefault(identity[0], []).append(pos)
+        category_postings.setdefault(str(job.get('job_category', '')), []).append(pos)
+        for skill in set(parse_skills(job.get('skills_tags'))):
+            skill_postings.setdefault(skill, []).append(pos)
+        remote[pos] = is_remote(job)
+        salary[pos] = _has_salary(job)
+
+    def to_arrays(postings):
+        return {key: np.array(rows, dtype=np.intp) for key, rows in postings.items()}
+
+    return {
+        'df': all_jobs_df,
+        'company': to_arrays(company_postings),
+        'category': to_arrays(category_postings),
+        'skill': to_arrays(skill_postings),
+        'identity': to_arrays(identity_postings),
+        'remote': remote,
+        # Base score every candidate gets: +5 if it shows a salary
+        'salary_score': salary.astype(np.int32) * 5,
+    }
 
-    # Score each job
-    scored_jobs = []
-    for idx, other_job in all_jobs_df.iterrows():
-        other_company = str(other_job.get('company', other_job.get('company_name', '')))
-        other_title = str(other_job.get('title', ''))
-        other_location = str(other_job.get('location', ''))
 
-        # Skip same job
-        if other_company == company and other_title == current_title and other_location == current_location:
-            continue
+def find_related_jobs(job, related_index, num_related=4):
+    """Find related jobs based on company, category, and skills.
 
-        score = 0
+    Scoring: same company +50, same category +30, +10 per shared skill,
+    both remote +15, candidate has salary +5. Ties keep DataFrame order.
+    """
+    company, current_title, current_location = _job_identity(job)
+    category = str(job.get('job_category', ''))
+    skills = parse_skills(job.get('skills_tags'))
 
-        # Same company is highly relevant
-        if other_company == company:
-            score += 50
+    scores = related_index['salary_score'].copy()
 
-        # Same category is relevant
-        other_category = str(other_job.get('job_category', ''))
-        if category and other_category == category:
-            score += 30
+    # Same company is highly relevant
+    rows = related_index['company'].get(company)
+    if rows is not None:
+        scores[rows] += 50
 
-        # Skill overlap
-        other_skills = parse_skills(other_job.get('skills_tags'))
-        if skills and other_skills:
-            overlap = len(set(skills) & set(other_skills))
-            score += overlap * 10
+    # Same category is relevant
+    if category:
+        rows = related_index['category'].get(category)
+        if rows is not None:
+            scores[rows] += 30
+
+    # Skill overlap (candidates with no skills never match a posting)
+    if skills:
+        for skill in set(skills):
+            rows = related_index['skill'].get(skill)
+            if rows is not None:
+                scores[rows] += 10
 
-        # Remote preference match
-        if is_remote(job) and is_remote(other_job):
-            score += 15
+    # Remote preference match
+    if is_remote(job):
+        scores[related_index['remote']] += 15
 
-        # Has salary (more valuable to show)
-        if pd.notna(other_job.get('salary_max', other_job.get('max_amount'))):
-            try:
-                if float(other_job.get('salary_max', other_job.get('max_amount', 0))) > 0:
-                    score += 5
-            except:
-                pass
+    # Skip same job
+    rows = related_index['identity'].get((company, current_title, current_location))
+    if rows is not None:
+        scores[rows] = 0
 
-        if score > 0:
-            scored_jobs.append((idx, score, other_job))
+    top = top_positions(scores, num_related, candidates=np.flatnonzero(scores > 0))
 
-    # Sort by score and return top N
-    scored_jobs.sort(key=lambda x: x[1], reverse=True)
-    return [job_data for _, _, job_data in scored_jobs[:num_related]]
+    all_jobs_df = related_index['df']
+    return [all_jobs_df.iloc[pos] for pos in top]
 
 
 def generate_related_jobs_html(related_jobs, current_company):
@@ -306,9 +427,8 @@ CSS_RELATED_JOBS = '''
 '''
 
 
-def create_job_page(job, idx, all_jobs_df=None):
-    """Generate an individual job page with full SEO optimization"""
-
+def make_job_page_slug(job, idx):
+    """Slug for a job's page: company-title plus a hash of company/title/location"""
     company = str(job.get('company', job.get('company_name', 'Unknown')))
     title = str(job.get('title', 'AI Engineer'))
     location = str(job.get('location', '')) if pd.notna(job.get('location')) else ''
@@ -320,7 +440,32 @@ def create_job_page(job, idx, all_jobs_df=None):
 
     # Add hash suffix for uniqueness
     hash_suffix = hashlib.md5(f"{company}{title}{location}".encode()).hexdigest()[:6]
-    slug = f"{slug}-{hash_suffix}"
+    return f"{slug}-{hash_suffix}"
+
+
+def create_job_page(job, idx, related_index=None, previous_hashes=None):
+    """Generate an individual job page with full SEO optimization.
+
+    Returns (slug, input_hash, written). When previous_hashes is given and the
+    page's inputs match the recorded hash, rendering and writing are skipped.
+    """
+
+    company = str(job.get('company', job.get('company_name', 'Unknown')))
+    title = str(job.get('title', 'AI Engineer'))
+    location = str(job.get('location', '')) if pd.notna(job.get('location')) else ''
+    slug = make_job_page_slug(job, idx)
+
+    # === RELATED JOBS ===
+    related_jobs = []
+    if related_index is not None and len(related_index['df']) > 1:
+        related_jobs = find_related_jobs(job, related_index, num_related=4)
+
+    # === INCREMENTAL BUILD CHECK ===
+    # The posting schema falls back to today's date when date_posted is missing
+    fallback_date = iso_date if pd.isna(job.get('date_posted')) else ''
+    page_hash = page_input_hash(fallback_date, job, *related_jobs)
+    if page_is_current(slug, page_hash, previous_hashes):
+        return slug, page_hash, False
 
     # Get job details
     min_sal = job.get('salary_min', job.get('min_amount'))
@@ -422,11 +567,7 @@ def create_job_page(job, idx, all_jobs_df=None):
     meta_badges.append(f'<span class="job-meta-badge">{escape_html(job_category)}</span>')
     meta_badges_html = '\n                    '.join(meta_badges)
 
-    # === RELATED JOBS ===
-    related_jobs_html = ""
-    if all_jobs_df is not None and len(all_jobs_df) > 1:
-        related_jobs = find_related_jobs(job, all_jobs_df, num_related=4)
-        related_jobs_html = generate_related_jobs_html(related_jobs, company)
+    related_jobs_html = generate_related_jobs_html(related_jobs, company)
 
     # Build the page
     html = f'''<!DOCTYPE html>
@@ -463,15 +604,8 @@ def create_job_page(job, idx, all_jobs_df=None):
 
     {schema_json}
 
+    {get_base_styles()}
     <style>
-        {CSS_VARIABLES}
-        {CSS_NAV}
-        {CSS_LAYOUT}
-        {CSS_CARDS}
-        {CSS_CTA}
-        {CSS_FOOTER}
-        {CSS_JOB_PAGE}
-
         .job-header {{
             background: linear-gradient(135deg, var(--teal-primary) 0%, var(--bg-darker) 100%);
             padding: 48px 0;
@@ -507,8 +641,8 @@ def create_job_page(job, idx, all_jobs_df=None):
             flex-wrap: wrap;
             gap: 8px;
         }}
-        {CSS_RELATED_JOBS}
     </style>
+    {get_stylesheet_link('related-jobs', CSS_RELATED_JOBS)}
 </head>
 {get_nav_html('jobs').replace('<body>', '<body>')}
 
@@ -573,26 +707,62 @@ def create_job_page(job, idx, all_jobs_df=None):
 {get_footer_html()}'''
 
     # Create directory and save
-    page_dir = f'{JOBS_DIR}/{slug}'
-    os.makedirs(page_dir, exist_ok=True)
-    with open(f'{page_dir}/index.html', 'w') as f:
-        f.write(html)
+    record_page_head(f'jobs/{slug}/', f'{page_title} | {SITE_NAME}', meta_desc)
+    write_page(f'{JOBS_DIR}/{slug}/index.html', html)
+
+    return slug, page_hash, True
+
 
-    return slug
+def render_job_page(pos, jobs_df, related_index, previous_hashes):
+    """Render the job at row position pos (render_pages work unit)"""
+    return create_job_page(jobs_df.iloc[pos], jobs_df.index[pos], related_index=related_index,
+                           previous_hashes=previous_hashes)
 
 
 # Generate individual job pages
 print(f"\n Generating individual job pages...")
-print(f"   (with related jobs internal linking)")
+print(f"   (with related jobs internal linking, {RENDER_JOBS} render process(es))")
+jobs_diff = load_snapshot_diff(latest_file, data_dir=DATA_DIR) if latest_file else None
+snapshot_fingerprint = jobs_diff['new']['fingerprint'] if jobs_diff else None
+manifest_pages, same_inputs = load_page_manifest(snapshot_fingerprint)
+previous_hashes = (manifest_pages or {}) if INCREMENTAL else None
+same_inputs = INCREMENTAL and same_inputs
+if INCREMENTAL:
+    print(f"   Incremental build: {len(previous_hashes)} pages in {MANIFEST_PATH}")
+    if jobs_diff:
+        print(f"   Since {jobs_diff['old']['file']}: {jobs_diff['added']} added, "
+              f"{jobs_diff['removed']} removed, {jobs_diff['changed']} changed")
+page_hashes = {}
 job_slugs = []
-for idx, row in df.iterrows():
+last_position = {}
+for pos, (idx, row) in enumerate(df.iterrows()):
     if pd.notna(row.get('title')) and pd.notna(row.get('company', row.get('company_name'))):
-        slug = create_job_page(row, idx, all_jobs_df=df)
+        slug = make_job_page_slug(row, idx)
         job_slugs.append(slug)
-        if len(job_slugs) % 100 == 0:
-            print(f"   Generated {len(job_slugs)} pages...")
+        last_position[slug] = pos
+
+# Same jobs, template and date as the last run: keep the recorded hash of every page still on disk
+if same_inputs:
+    for slug in list(last_position):
+        if page_is_current(slug, previous_hashes.get(slug), previous_hashes):
+            page_hashes[slug] = previous_hashes[slug]
+            del last_position[slug]
+    print(f"   Snapshot unchanged since the last run: {len(page_hashes)} pages kept as they are")
+
+# Duplicate postings share a slug; only the last one's page would survive, so render just that
+written_count = 0
+related_index = build_related_jobs_index(df) if last_position else None
+for slug, page_hash, written in render_pages(render_job_page, sorted(last_position.values()), jobs=RENDER_JOBS,
+                                              shared={'jobs_df': df, 'related_index': related_index,
+                                                      'previous_hashes': previous_hashes}):
+    page_hashes[slug] = page_hash
+    written_count += written
+    if len(page_hashes) % 100 == 0:
+        print(f"   Generated {len(page_hashes)} pages...")
 
 print(f"\n Generated {len(job_slugs)} individual job pages")
+if INCREMENTAL:
+    print(f"   - Rewritten: {written_count}, unchanged: {len(page_hashes) - written_count}")
 
 # Save job index for linking
 with open(f'{DATA_DIR}/job_slugs.txt', 'w') as f:
@@ -608,57 +778,97 @@ print("  HANDLING STALE JOB PAGES")
 print("="*70)
 
 
-def find_similar_jobs(stale_slug, current_jobs_df, num_recommendations=5):
+# (slug keywords, category keywords, score) - a rule fires when any slug
+# keyword is in the stale slug and any category keyword is in the live
+# job's category
+STALE_CATEGORY_RULES = [
+    (('prompt',), ('prompt',), 30),
+    (('ml-engineer', 'machine-learning'), ('ml', 'machine learning'), 30),
+    (('llm',), ('llm',), 30),
+    (('mlops',), ('mlops',), 30),
+    (('research',), ('research',), 25),
+    (('agent',), ('agent',), 25),
+]
+
+
+def build_stale_index(current_jobs_df):
+    """Precompute per-job features used to score stale slugs.
+
+    Company slugs are bucketed by length so a stale slug only has to look up
+    its own substrings instead of testing every live company.
+    """
+    blank = pd.Series('', index=current_jobs_df.index)
+    companies = current_jobs_df.get('company', current_jobs_df.get('company_name', blank))
+    # str() first so missing values become 'nan', matching the per-row scoring
+    categories = pd.Series([str(c).lower() for c in current_jobs_df.get('job_category', blank)], dtype=object)
+
+    company_postings = {}
+    for pos, company in enumerate(companies):
+        company = str(company).lower()
+        if company:
+            company_postings.setdefault(make_slug(company), []).append(pos)
+
+    rule_matches = []
+    for _, category_terms, _ in STALE_CATEGORY_RULES:
+        matched = np.zeros(len(current_jobs_df), dtype=bool)
+        for term in category_terms:
+            matched |= categories.str.contains(term, regex=False).to_numpy(dtype=bool)
+        rule_matches.append(matched)
+
+    remote = np.zeros(len(current_jobs_df), dtype=bool)
+    salary = np.zeros(len(current_jobs_df), dtype=bool)
+    for pos, (_, job) in enumerate(current_jobs_df.iterrows()):
+        remote[pos] = is_remote(job)
+        salary[pos] = _has_salary(job)
+
+    return {
+        'df': current_jobs_df,
+        'company': {key: np.array(rows, dtype=np.intp) for key, rows in company_postings.items()},
+        'company_slug_lengths': sorted({len(key) for key in company_postings}),
+        'category_rules': rule_matches,
+        'remote': remote,
+        'salary_score': salary.astype(np.int32) * 5,
+    }
+
+
+def find_similar_jobs(stale_slug, stale_index, num_recommendations=5):
     """Find similar live jobs based on the stale job's characteristics"""
+    current_jobs_df = stale_index['df']
     parts = stale_slug.rsplit('-', 1)
     if len(parts) < 2:
         return current_jobs_df.head(num_recommendations).to_dict('records')
 
     slug_text = parts[0].lower()
 
-    scores = []
-    for idx, job in current_jobs_df.iterrows():
-        score = 0
-        company = str(job.get('company', job.get('company_name', ''))).lower()
-        title = str(job.get('title', '')).lower()
-        category = str(job.get('job_category', '')).lower()
-
-        # Company match (highest weight)
-        if company and make_slug(company) in slug_text:
-            score += 50
-
-        # Category/role type match
-        if 'prompt' in slug_text and 'prompt' in category:
-            score += 30
-        if 'ml-engineer' in slug_text or 'machine-learning' in slug_text:
-            if 'ml' in category or 'machine learning' in category:
-                score += 30
-        if 'llm' in slug_text and 'llm' in category:
-            score += 30
-        if 'mlops' in slug_text and 'mlops' in category:
-            score += 30
-        if 'research' in slug_text and 'research' in category:
-            score += 25
-        if 'agent' in slug_text and 'agent' in category:
-            score += 25
-
-        # Remote preference
-        if 'remote' in slug_text and is_remote(job):
-            score += 10
-
-        # Has salary (prefer jobs with disclosed salary)
-        if pd.notna(job.get('salary_max', job.get('max_amount'))) and float(job.get('salary_max', job.get('max_amount', 0))) > 0:
-            score += 5
-
-        scores.append((idx, score))
-
-    scores.sort(key=lambda x: x[1], reverse=True)
-    top_indices = [s[0] for s in scores[:num_recommendations]]
-
-    return current_jobs_df.loc[top_indices].to_dict('records')
-
-
-def create_stale_job_page(stale_slug, similar_jobs):
+    scores = stale_index['salary_score'].copy()
+
+    # Company match (highest weight): any live company slug contained in the stale slug
+    company_postings = stale_index['company']
+    matched_companies = set()
+    for length in stale_index['company_slug_lengths']:
+        if length > len(slug_text):
+            break
+        for start in range(len(slug_text) - length + 1):
+            matched_companies.add(slug_text[start:start + length])
+    for company_slug in matched_companies:
+        rows = company_postings.get(company_slug)
+        if rows is not None:
+            scores[rows] += 50
+
+    # Category/role type match
+    for (slug_terms, _, score), matched in zip(STALE_CATEGORY_RULES, stale_index['category_rules']):
+        if any(term in slug_text for term in slug_terms):
+            scores[matched] += score
+
+    # Remote preference
+    if 'remote' in slug_text:
+        scores[stale_index['remote']] += 10
+
+    top = top_positions(scores, num_recommendations)
+    return current_jobs_df.iloc[top].to_dict('records')
+
+
+def create_stale_job_page(stale_slug, similar_jobs, last_seen=None):
     """Generate a page for an expired job with similar job recommendations"""
 
     parts = stale_slug.rsplit('-', 1)
@@ -727,14 +937,8 @@ def create_stale_job_page(stale_slug, similar_jobs):
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
 
+    {get_base_styles()}
     <style>
-        {CSS_VARIABLES}
-        {CSS_NAV}
-        {CSS_LAYOUT}
-        {CSS_CARDS}
-        {CSS_CTA}
-        {CSS_FOOTER}
-
         .expired-header {{
             background: linear-gradient(135deg, var(--teal-primary) 0%, var(--bg-darker) 100%);
             padding: 48px 0;
@@ -817,6 +1021,7 @@ def create_stale_job_page(stale_slug, similar_jobs):
         <div class="container">
             <div class="message-box">
                 <h2>This position is no longer available</h2>
+                {f'<p>It was last listed on {datetime.strptime(last_seen, "%Y-%m-%d").strftime("%B %d, %Y")}.</p>' if last_seen else ''}
                 <p>Good news - we have similar AI opportunities that might be a great fit for you.</p>
                 <a href="/jobs/" class="browse-all-btn">Browse All AI Jobs →</a>
             </div>
@@ -834,45 +1039,105 @@ def create_stale_job_page(stale_slug, similar_jobs):
 
 {get_footer_html()}'''
 
-    page_dir = f'{JOBS_DIR}/{stale_slug}'
-    os.makedirs(page_dir, exist_ok=True)
-    with open(f'{page_dir}/index.html', 'w') as f:
-        f.write(html)
+    write_page(f'{JOBS_DIR}/{stale_slug}/index.html', html)
+
+
+def render_stale_job_page(stale_slug, stale_index, previous_hashes, last_seen):
+    """Recommend similar jobs for a stale slug and render its page (render_pages work unit).
+
+    Returns (slug, input_hash, written) like create_job_page.
+    """
+    similar_jobs = find_similar_jobs(stale_slug, stale_index, num_recommendations=5)
+    page_hash = page_input_hash('stale', stale_slug, str(last_seen.get(stale_slug)), *similar_jobs)
+    if page_is_current(stale_slug, page_hash, previous_hashes):
+        return stale_slug, page_hash, False
+    create_stale_job_page(stale_slug, similar_jobs, last_seen.get(stale_slug))
+    return stale_slug, page_hash, True
+
+
+def find_stale_slugs(current_slugs, known_pages):
+    """Slugs of job pages whose job is no longer listed, and where they were found.
 
+    Every page of the last run's manifest (live and stale) that is not in the
+    current data; without a manifest, every page directory not in the data.
+    """
+    if known_pages is not None:
+        return set(known_pages) - current_slugs, MANIFEST_PATH
+
+    existing_pages = set()
+    if os.path.exists(JOBS_DIR):
+        for item in os.listdir(JOBS_DIR):
+            item_path = os.path.join(JOBS_DIR, item)
+            if os.path.isdir(item_path) and item not in ['index.html', '.DS_Store']:
+                existing_pages.add(item)
+    return existing_pages - current_slugs, 'pages on disk'
+
+
+def load_last_seen(stale_slugs):
+    """slug -> date its job was last listed, per the master store's lifecycle table.
+
+    Metadata only: stale pages without a lifecycle entry (pages from before the
+    store, rows without a URL) are simply missing from the result.
+    """
+    if not stale_slugs or not has_store():
+        return {}
+    try:
+        build_job_db()
+        expired = expired_jobs(['company', 'company_name', 'title', 'location'])
+    except (sqlite3.Error, OSError) as e:
+        print(f"   Job lifecycle unavailable ({e})")
+        return {}
+    expired = expired[expired['title'].notna() & expired['company'].notna()]
+    last_seen = {}
+    for idx, row in expired.iterrows():
+        slug = make_job_page_slug(row, idx)
+        if slug in stale_slugs and row['last_seen']:
+            last_seen[slug] = max(last_seen.get(slug, ''), row['last_seen'])
+    return last_seen
 
-# Find all existing job page directories
-existing_pages = set()
-if os.path.exists(JOBS_DIR):
-    for item in os.listdir(JOBS_DIR):
-        item_path = os.path.join(JOBS_DIR, item)
-        if os.path.isdir(item_path) and item not in ['index.html', '.DS_Store']:
-            existing_pages.add(item)
 
 # Convert current job slugs to a set for comparison
 current_slugs = set(job_slugs)
 
-# Find stale pages (exist on disk but not in current data)
-stale_slugs = existing_pages - current_slugs
+# Find stale pages (jobs that expired since their page was generated)
+stale_slugs, stale_source = find_stale_slugs(current_slugs, manifest_pages)
+last_seen = load_last_seen(stale_slugs)
 
 print(f"\n Page Analysis:")
 print(f"   - Current live jobs: {len(current_slugs)}")
-print(f"   - Existing pages on disk: {len(existing_pages)}")
-print(f"   - Stale pages to update: {len(stale_slugs)}")
+print(f"   - Expired jobs from: {stale_source}")
+print(f"   - Stale pages to update: {len(stale_slugs)} ({len(last_seen)} with a last-listed date)")
 
 if stale_slugs:
     print(f"\n Updating {len(stale_slugs)} stale job pages with similar recommendations...")
+    stale_index = build_stale_index(df)
     stale_count = 0
-    for stale_slug in stale_slugs:
-        similar_jobs = find_similar_jobs(stale_slug, df, num_recommendations=5)
-        create_stale_job_page(stale_slug, similar_jobs)
+    stale_written = 0
+    for slug, page_hash, written in render_pages(render_stale_job_page, sorted(stale_slugs), jobs=RENDER_JOBS,
+                                                  shared={'stale_index': stale_index,
+                                                          'previous_hashes': previous_hashes,
+                                                          'last_seen': last_seen}):
+        page_hashes[slug] = page_hash
         stale_count += 1
+        stale_written += written
         if stale_count % 50 == 0:
             print(f"   Updated {stale_count} stale pages...")
 
     print(f"\n Updated {len(stale_slugs)} stale job pages with similar job recommendations")
+    if INCREMENTAL:
+        print(f"   - Rewritten: {stale_written}, unchanged: {stale_count - stale_written}")
 else:
     print(f"\n No stale job pages found - all pages are current")
 
+# Write the last batch of pages before recording them
+flush_pages()
+
+# Record page input hashes so the next --incremental run can skip unchanged pages
+with open(MANIFEST_PATH, 'w') as f:
+    json.dump({'template_version': TEMPLATE_VERSION, 'generated': iso_date, 'snapshot': snapshot_fingerprint,
+               'pages': page_hashes}, f, indent=2, sort_keys=True)
+print(f" Saved page manifest ({len(page_hashes)} pages) to {MANIFEST_PATH}")
+
 print(f"\n SEO Features Added:")
 print(f"   - Correct canonical URLs ({BASE_URL})")
 print(f"   - Skills in title tags and meta descriptions")
@@ -11,7 +11,6 @@ These pages capture long-tail search traffic and provide better internal linking
 
 import pandas as pd
 import os
-import glob
 import json
 import re
 import hashlib
@@ -25,10 +24,13 @@ sys.path.insert(0, script_dir)
 
 from templates import (
     get_html_head, get_nav_html, get_footer_html, get_cta_box,
-    slugify, format_salary, is_remote, BASE_URL, SITE_NAME,
+    slugify, format_salary, is_remote, BASE_URL, SITE_NAME, get_stylesheet_link,
     CSS_VARIABLES, CSS_NAV, CSS_LAYOUT, CSS_CARDS, CSS_CTA, CSS_FOOTER
 )
 from seo_core import generate_breadcrumb_schema, generate_collectionpage_schema, generate_faq_schema, generate_faq_html, CSS_FAQ_SECTION
+from render_pool import parse_jobs_arg, render_pages
+from job_data import load_jobs, remote_mask
+from site_manifest import write_page, flush_pages
 
 DATA_DIR = 'data'
 SITE_DIR = 'site'
@@ -45,15 +47,7 @@ print("=" * 70)
 
 def get_latest_jobs():
     """Load latest enriched job data"""
-    job_files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
-    if not job_files:
-        if os.path.exists(f"{DATA_DIR}/jobs.json"):
-            with open(f"{DATA_DIR}/jobs.json") as f:
-                data = json.load(f)
-            return pd.DataFrame(data.get('jobs', []))
-        return pd.DataFrame()
-    latest_file = sorted(job_files)[-1]
-    return pd.read_csv(latest_file)
+    return load_jobs(data_dir=DATA_DIR)
 
 
 def escape_html(text):
@@ -581,7 +575,7 @@ def generate_location_page(location_slug, config, jobs_df, all_locations):
     )}
     {breadcrumb_schema}
     {collection_schema}
-    <style>{CSS_LANDING}{CSS_FAQ_SECTION}</style>
+    {get_stylesheet_link('landing', CSS_LANDING + CSS_FAQ_SECTION)}
 {get_nav_html('jobs')}
 
     <div class="landing-header">
@@ -623,10 +617,7 @@ def generate_location_page(location_slug, config, jobs_df, all_locations):
 {get_footer_html()}'''
 
     # Save page
-    page_dir = f'{JOBS_DIR}/{location_slug}'
-    os.makedirs(page_dir, exist_ok=True)
-    with open(f'{page_dir}/index.html', 'w') as f:
-        f.write(html)
+    write_page(f'{JOBS_DIR}/{location_slug}/index.html', html)
 
     return location_slug, is_thin
 
@@ -718,34 +709,54 @@ SKILL_CONFIGS = {
 }
 
 
-def job_has_skill(job, keywords):
-    """Check if a job mentions any of the skill keywords."""
-    # Check skills_tags
-    skills = parse_skills(job.get('skills_tags'))
-    for skill in skills:
-        for keyword in keywords:
-            if keyword.lower() in skill.lower():
-                return True
+def build_skill_index(jobs_df, skill_configs=None):
+    """Match every job against every skill page once.
+
+    A job belongs to a skill page if one of the page's keywords appears
+    (case-insensitively) in one of its skills_tags, its category or its title.
+    skills_tags is parsed once per job and each distinct tag or category is
+    matched once; titles get one vectorized substring search per keyword.
+
+    Returns {'members': {skill_slug: boolean row mask}, 'remote': boolean row mask}.
+    """
+    if skill_configs is None:
+        skill_configs = SKILL_CONFIGS
+
+    def column(name):
+        if name in jobs_df.columns:
+            return jobs_df[name]
+        return pd.Series([''] * len(jobs_df), index=jobs_df.index)
+
+    job_skills = [[str(skill).lower() for skill in parse_skills(value)] for value in column('skills_tags')]
+    # Missing values become '' (astype(str) keeps NaN/None on pandas' string dtype)
+    categories = column('job_category').fillna('').astype(str).str.lower()
+    titles = column('title').fillna('').astype(str).str.lower()
+
+    members = {}
+    for skill_slug, config in skill_configs.items():
+        keywords = [keyword.lower() for keyword in config['keywords']]
+
+        def matches(text):
+            return any(keyword in text for keyword in keywords)
 
-    # Check job category
-    category = str(job.get('job_category', '')).lower()
-    for keyword in keywords:
-        if keyword.lower() in category:
-            return True
+        # Distinct tags and categories are few, so each is matched once
+        tag_matches = {tag: matches(tag) for tags in job_skills for tag in tags}
+        tag_hit = [any(tag_matches[tag] for tag in tags) for tags in job_skills]
+        category_hit = categories.map({value: matches(value) for value in categories.unique()})
 
-    # Check title
-    title = str(job.get('title', '')).lower()
-    for keyword in keywords:
-        if keyword.lower() in title:
-            return True
+        mask = pd.Series(tag_hit, index=jobs_df.index, dtype=bool) | category_hit.astype(bool)
+        for keyword in keywords:
+            mask |= titles.str.contains(keyword, regex=False)
+        members[skill_slug] = mask.to_numpy()
 
-    return False
+    return {'members': members, 'remote': remote_mask(jobs_df).to_numpy()}
 
 
-def generate_skill_page(skill_slug, config, jobs_df, all_skills):
-    """Generate a skill-based landing page."""
+def generate_skill_page(skill_slug, config, jobs_df, all_skills, skill_index):
+    """Generate a skill-based landing page (jobs looked up in build_skill_index's result)."""
     # Filter jobs for this skill
-    skill_jobs = jobs_df[jobs_df.apply(lambda job: job_has_skill(job, config['keywords']), axis=1)]
+    members = skill_index['members'][skill_slug]
+    skill_jobs = jobs_df[members]
     num_jobs = len(skill_jobs)
 
     if num_jobs == 0:
@@ -758,7 +769,7 @@ def generate_skill_page(skill_slug, config, jobs_df, all_skills):
     # Calculate stats
     with_salary = skill_jobs['salary_max'].notna().sum() if 'salary_max' in skill_jobs.columns else 0
     avg_salary = skill_jobs['salary_max'].dropna().mean() if 'salary_max' in skill_jobs.columns and with_salary > 0 else 0
-    remote_count = skill_jobs.apply(is_remote, axis=1).sum()
+    remote_count = int(skill_index['remote'][members].sum())
 
     # Breadcrumbs
     breadcrumbs = [
@@ -808,7 +819,7 @@ def generate_skill_page(skill_slug, config, jobs_df, all_skills):
     )}
     {breadcrumb_schema}
     {collection_schema}
-    <style>{CSS_LANDING}{CSS_FAQ_SECTION}</style>
+    {get_stylesheet_link('landing', CSS_LANDING + CSS_FAQ_SECTION)}
 {get_nav_html('jobs')}
 
     <div class="landing-header">
@@ -854,10 +865,7 @@ def generate_skill_page(skill_slug, config, jobs_df, all_skills):
 {get_footer_html()}'''
 
     # Save page
-    page_dir = f'{JOBS_DIR}/skills/{skill_slug}'
-    os.makedirs(page_dir, exist_ok=True)
-    with open(f'{page_dir}/index.html', 'w') as f:
-        f.write(html)
+    write_page(f'{JOBS_DIR}/skills/{skill_slug}/index.html', html)
 
     return skill_slug, is_thin
 
@@ -895,8 +903,8 @@ def generate_skills_index(jobs_df, skill_pages):
         "jobs/skills/"
     )}
     {collection_schema}
+    {get_stylesheet_link('landing', CSS_LANDING + CSS_FAQ_SECTION)}
     <style>
-        {CSS_LANDING}
         .skills-index-grid {{
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(220px, 1fr));
@@ -946,8 +954,7 @@ def generate_skills_index(jobs_df, skill_pages):
 
 {get_footer_html()}'''
 
-    with open(f'{JOBS_DIR}/skills/index.html', 'w') as f:
-        f.write(html)
+    write_page(f'{JOBS_DIR}/skills/index.html', html)
 
     print(f"  Generated skills index page")
 
@@ -956,7 +963,20 @@ def generate_skills_index(jobs_df, skill_pages):
 # MAIN EXECUTION
 # =============================================================================
 
+# Work units for render_pages take only the slug: configs hold lambdas, which
+# can't be pickled, so workers look them up in their inherited module state.
+
+def render_location_page(location_slug, jobs_df):
+    return generate_location_page(location_slug, LOCATION_CONFIGS[location_slug], jobs_df, list(LOCATION_CONFIGS.keys()))
+
+
+def render_skill_page(skill_slug, jobs_df, skill_index):
+    return generate_skill_page(skill_slug, SKILL_CONFIGS[skill_slug], jobs_df, list(SKILL_CONFIGS.keys()), skill_index)
+
+
 def main():
+    render_jobs = parse_jobs_arg()
+
     # Load job data
     jobs_df = get_latest_jobs()
     if jobs_df.empty:
@@ -971,8 +991,9 @@ def main():
     location_thin = 0
     generated_locations = []
 
-    for location_slug, config in LOCATION_CONFIGS.items():
-        result, is_thin = generate_location_page(location_slug, config, jobs_df, list(LOCATION_CONFIGS.keys()))
+    location_slugs = list(LOCATION_CONFIGS.keys())
+    results = render_pages(render_location_page, location_slugs, jobs=render_jobs, shared={'jobs_df': jobs_df})
+    for location_slug, (result, is_thin) in zip(location_slugs, results):
         if result:
             location_count += 1
             generated_locations.append(location_slug)
@@ -990,12 +1011,14 @@ def main():
     skill_thin = 0
     skill_pages = {}
 
-    for skill_slug, config in SKILL_CONFIGS.items():
-        result, is_thin = generate_skill_page(skill_slug, config, jobs_df, list(SKILL_CONFIGS.keys()))
+    skill_slugs = list(SKILL_CONFIGS.keys())
+    skill_index = build_skill_index(jobs_df)
+    results = render_pages(render_skill_page, skill_slugs, jobs=render_jobs,
+                           shared={'jobs_df': jobs_df, 'skill_index': skill_index})
+    for skill_slug, (result, is_thin) in zip(skill_slugs, results):
         if result:
             skill_count += 1
-            skill_jobs = jobs_df[jobs_df.apply(lambda job: job_has_skill(job, config['keywords']), axis=1)]
-            skill_pages[skill_slug] = {'count': len(skill_jobs), 'is_thin': is_thin}
+            skill_pages[skill_slug] = {'count': int(skill_index['members'][skill_slug].sum()), 'is_thin': is_thin}
             if is_thin:
                 skill_thin += 1
                 print(f"    /jobs/skills/{skill_slug}/ (noindex: thin content)")
@@ -1006,6 +1029,7 @@ def main():
 
     # Generate skills index page
     generate_skills_index(jobs_df, skill_pages)
+    flush_pages()
 
     print(f"\n  Generated {skill_count} skill pages ({skill_thin} noindexed)")
 
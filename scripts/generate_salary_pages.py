@@ -6,9 +6,7 @@ Creates pages like /salaries/ml-engineer/, /salaries/san-francisco/, /salaries/s
 
 import pandas as pd
 from datetime import datetime
-import glob
 import os
-import json
 import sys
 import traceback
 
@@ -19,6 +17,9 @@ sys.path.insert(0, script_dir)
 try:
     from templates import get_html_head, get_nav_html, get_footer_html, get_cta_box, BASE_URL, SITE_NAME
     from seo_core import generate_breadcrumb_schema, generate_faq_schema, generate_salary_faqs, generate_dataset_schema, generate_collectionpage_schema
+    from render_pool import parse_jobs_arg, render_pages
+    from job_data import list_jobs_files, load_jobs
+    from site_manifest import write_page, flush_pages
 except Exception as e:
     print(f"ERROR importing templates: {e}")
     traceback.print_exc()
@@ -376,10 +377,7 @@ def generate_salary_page(filtered_df, slug, title, category_type, salary_col, mi
 
 {get_footer_html()}'''
 
-    page_dir = f'{SALARIES_DIR}/{slug}'
-    os.makedirs(page_dir, exist_ok=True)
-    with open(f'{page_dir}/index.html', 'w') as f:
-        f.write(html)
+    write_page(f'{SALARIES_DIR}/{slug}/index.html', html)
     return True, is_thin_content
 
 
@@ -389,18 +387,15 @@ def main():
     print("="*70)
 
     os.makedirs(SALARIES_DIR, exist_ok=True)
+    render_jobs = parse_jobs_arg()
 
     # Load job data
-    files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
+    files = list_jobs_files(DATA_DIR)
     print(f"  Looking for CSV files in {DATA_DIR}/")
     print(f"  Found: {files}")
 
-    if files:
-        df = pd.read_csv(max(files, key=os.path.getmtime))
-    elif os.path.exists(f"{DATA_DIR}/jobs.json"):
-        with open(f"{DATA_DIR}/jobs.json") as f:
-            df = pd.DataFrame(json.load(f).get('jobs', []))
-    else:
+    df = load_jobs(data_dir=DATA_DIR)
+    if df.empty:
         print(" No job data found")
         sys.exit(1)
 
@@ -422,21 +417,13 @@ def main():
     indexed_count = 0
     noindex_count = 0
 
-    # Generate role-based salary pages
-    print("\n Generating role-based salary pages...")
+    # Collect role, metro and experience pages, then render them in one pass
+    salary_pages = []
+
     for category, slug, display in ROLE_CATEGORIES:
         filtered = df_salary[df_salary['job_category'] == category] if 'job_category' in df_salary.columns else pd.DataFrame()
-        result = generate_salary_page(filtered, slug, display, 'role', salary_col, min_col)
-        if result[0]:  # generated
-            status = "noindex" if result[1] else "indexed"
-            print(f"   Generated /salaries/{slug}/ ({len(filtered)} jobs) [{status}]")
-            if result[1]:
-                noindex_count += 1
-            else:
-                indexed_count += 1
+        salary_pages.append((filtered, slug, display, 'role'))
 
-    # Generate metro-based salary pages
-    print("\n Generating metro-based salary pages...")
     for metro, slug in METRO_CATEGORIES:
         if metro == 'Remote':
             if 'remote_type' in df_salary.columns:
@@ -450,20 +437,24 @@ def main():
                 filtered = df_salary[df_salary['location'].str.contains(metro, case=False, na=False)]
             else:
                 filtered = pd.DataFrame()
-        result = generate_salary_page(filtered, slug, metro, 'metro', salary_col, min_col)
-        if result[0]:  # generated
-            status = "noindex" if result[1] else "indexed"
-            print(f"   Generated /salaries/{slug}/ ({len(filtered)} jobs) [{status}]")
-            if result[1]:
-                noindex_count += 1
-            else:
-                indexed_count += 1
+        salary_pages.append((filtered, slug, metro, 'metro'))
 
-    # Generate experience-based salary pages
-    print("\n Generating experience-based salary pages...")
     for level, slug, display in EXPERIENCE_CATEGORIES:
         filtered = df_salary[df_salary['experience_level'] == level] if 'experience_level' in df_salary.columns else pd.DataFrame()
-        result = generate_salary_page(filtered, slug, display, 'experience', salary_col, min_col)
+        salary_pages.append((filtered, slug, display, 'experience'))
+
+    section_headers = {
+        'role': "\n Generating role-based salary pages...",
+        'metro': "\n Generating metro-based salary pages...",
+        'experience': "\n Generating experience-based salary pages...",
+    }
+    current_section = None
+    results = render_pages(generate_salary_page, salary_pages, jobs=render_jobs,
+                           shared={'salary_col': salary_col, 'min_col': min_col})
+    for (filtered, slug, _, category_type), result in zip(salary_pages, results):
+        if category_type != current_section:
+            current_section = category_type
+            print(section_headers[category_type])
         if result[0]:  # generated
             status = "noindex" if result[1] else "indexed"
             print(f"   Generated /salaries/{slug}/ ({len(filtered)} jobs) [{status}]")
@@ -585,8 +576,8 @@ def main():
 
 {get_footer_html()}'''
 
-    with open(f'{SALARIES_DIR}/index.html', 'w') as f:
-        f.write(index_html)
+    write_page(f'{SALARIES_DIR}/index.html', index_html)
+    flush_pages()
 
     print(f"\n Generated salary index page")
     print(f"\n SEO Summary:")
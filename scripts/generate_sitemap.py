@@ -10,43 +10,56 @@ Creates category-indexed sitemaps for better crawlability at scale:
 - sitemaps/sitemap-jobs.xml - All job pages
 - sitemaps/sitemap-companies.xml - All company pages
 - sitemaps/sitemap-insights.xml - All insight/trend pages
+
+By default every HTML file under site/ is opened to check for noindex and
+stat'ed for lastmod. With --manifest the sitemaps are built from the build
+manifest the generators record (see site_manifest.py) without reading any
+page, and lastmod is the date a page's content last changed. The first
+--manifest run, or one with --rescan, walks site/ once to seed the manifest
+with hand-written pages.
+
+Sitemaps are streamed to disk one <url> at a time: each category's entries
+are built on the fly from its sorted URL paths, and the flat sitemap merges
+those streams. No per-URL sitemap entries are kept, but memory still grows
+with the page count: the page records (with --manifest, the whole manifest)
+and each category's sorted paths are held in memory. A sitemap that would pass
+50,000 URLs or 50 MB is split into -1, -2, ... parts, and --gzip also writes
+.xml.gz copies (the index then points at those).
+
+Usage:
+    python scripts/generate_sitemap.py              # walk site/
+    python scripts/generate_sitemap.py --manifest   # from data/site_manifest.json
+    python scripts/generate_sitemap.py --manifest --gzip
 """
 
+import argparse
+import gzip
+import heapq
 import os
 import re
+import sys
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from site_manifest import (
+    categorize_url, url_for_path, is_noindex, load_manifest, merge_journals, save_manifest, scan_site,
+    prune_stylesheets, MANIFEST_PATH
+)
 
 SITE_DIR = 'site'
 SITEMAPS_DIR = f'{SITE_DIR}/sitemaps'
 BASE_URL = 'https://theaimarketpulse.com'
 MAX_URLS_PER_SITEMAP = 50000  # Google's limit
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024  # ... and 50 MB uncompressed
 
 print("=" * 70)
 print("  AI MARKET PULSE - GENERATING CATEGORY-INDEXED SITEMAPS")
 print("=" * 70)
 
 
-def categorize_url(url_path: str) -> str:
-    """Categorize a URL into its sitemap category."""
-    if url_path == '/':
-        return 'main'
-    elif url_path in ['/jobs/', '/salaries/', '/insights/', '/tools/', '/companies/', '/about/', '/join/']:
-        return 'main'
-    elif '/salaries/' in url_path:
-        return 'salaries'
-    elif '/tools/' in url_path:
-        return 'tools'
-    elif '/jobs/' in url_path:
-        return 'jobs'
-    elif '/companies/' in url_path:
-        return 'companies'
-    elif '/insights/' in url_path:
-        return 'insights'
-    else:
-        return 'main'
-
-
 def is_noindexed(filepath: str) -> bool:
     """Check if an HTML file has noindex meta tag."""
     try:
@@ -103,16 +116,16 @@ def get_url_priority(url_path: str, category: str) -> Tuple[str, str]:
     return '0.5', 'monthly'
 
 
-def collect_urls() -> Dict[str, List[dict]]:
-    """Collect all HTML pages and categorize them, excluding noindexed pages."""
-    categorized_urls = {
-        'main': [],
-        'salaries': [],
-        'tools': [],
-        'jobs': [],
-        'companies': [],
-        'insights': []
-    }
+CATEGORIES = ['main', 'salaries', 'tools', 'jobs', 'companies', 'insights']
+
+
+def collect_urls() -> Dict[str, dict]:
+    """Collect all HTML pages and categorize them, excluding noindexed pages.
+
+    Returns:
+        {url_path: {'category', 'lastmod'}}, the same shape as manifest records
+    """
+    pages = {}
 
     skipped_noindex = 0
 
@@ -132,21 +145,7 @@ def collect_urls() -> Dict[str, List[dict]]:
                     continue
 
                 # Convert filepath to URL
-                if rel_path == 'index.html':
-                    url_path = '/'
-                elif rel_path.endswith('/index.html'):
-                    url_path = '/' + rel_path[:-10]
-                else:
-                    url_path = '/' + rel_path.replace('.html', '/')
-
-                # Clean up path
-                url_path = url_path.replace('//', '/')
-                if not url_path.endswith('/') and url_path != '/':
-                    url_path += '/'
-
-                # Categorize and get metadata
-                category = categorize_url(url_path)
-                priority, changefreq = get_url_priority(url_path, category)
+                url_path = url_for_path(rel_path)
 
                 # Get file modification time for more accurate lastmod
                 try:
@@ -155,48 +154,159 @@ def collect_urls() -> Dict[str, List[dict]]:
                 except:
                     lastmod = datetime.now().strftime('%Y-%m-%d')
 
-                categorized_urls[category].append({
-                    'loc': f'{BASE_URL}{url_path}',
-                    'lastmod': lastmod,
-                    'changefreq': changefreq,
-                    'priority': priority
-                })
+                pages[url_path] = {'category': categorize_url(url_path), 'lastmod': lastmod}
 
     print(f"  Skipped {skipped_noindex} noindexed pages from sitemap")
-    return categorized_urls
+    return pages
+
+
+def collect_urls_from_manifest(rescan: bool = False) -> Dict[str, dict]:
+    """The build manifest's page records, excluding noindexed pages."""
+    pages = load_manifest()
+    if pages is None or rescan:
+        pages = pages or {}
+        print(f"  Scanning {SITE_DIR}/ to seed the manifest...")
+        scanned = scan_site(pages)
+        print(f"  Recorded {scanned} pages from {SITE_DIR}/")
+
+    merged, journals = merge_journals(pages)
+    save_manifest(pages, journals=journals)
+    print(f"  Merged {merged} page records from {len(journals)} generator journal(s) into {MANIFEST_PATH}")
+
+    # The build is done: stylesheets no recorded page links can go
+    pruned = prune_stylesheets(pages)
+    if pruned is None:
+        print(f"  Kept old stylesheets: some pages predate stylesheet tracking (run with --rescan)")
+    else:
+        print(f"  Removed {pruned} stylesheets no page links any more")
 
+    # Shares the manifest's records rather than copying them
+    indexed = {url_path: page for url_path, page in pages.items() if not is_noindex(page['robots'])}
+    print(f"  Skipped {len(pages) - len(indexed)} noindexed pages from sitemap")
+    return indexed
 
-def generate_sitemap_xml(urls: List[dict]) -> str:
-    """Generate sitemap XML content for a list of URLs."""
-    # Sort URLs by priority (descending), then alphabetically
-    urls.sort(key=lambda x: (-float(x['priority']), x['loc']))
 
-    xml = '''<?xml version="1.0" encoding="UTF-8"?>
+def category_paths(pages: Dict[str, dict], category: str) -> List[str]:
+    """URL paths of one category's pages, in sitemap order (see url_sort_key)."""
+    paths = [url_path for url_path, page in pages.items() if page['category'] == category]
+    paths.sort(key=lambda url_path: (-float(get_url_priority(url_path, category)[0]), url_path))
+    return paths
+
+
+def iter_category_urls(pages: Dict[str, dict], category: str, paths: List[str]) -> Iterator[dict]:
+    """Build the sitemap entries for category_paths() one at a time."""
+    for url_path in paths:
+        priority, changefreq = get_url_priority(url_path, category)
+        yield {
+            'loc': f'{BASE_URL}{url_path}',
+            'lastmod': pages[url_path]['lastmod'],
+            'changefreq': changefreq,
+            'priority': priority
+        }
+
+
+SITEMAP_HEADER = b'''<?xml version="1.0" encoding="UTF-8"?>
 <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
 '''
+SITEMAP_FOOTER = b'</urlset>'
 
-    for url in urls:
-        xml += f'''  <url>
+
+def url_sort_key(url: dict) -> tuple:
+    """Sitemap order: priority (descending), then alphabetically."""
+    return (-float(url['priority']), url['loc'])
+
+
+def sitemap_url_entry(url: dict) -> bytes:
+    """One <url> element of a sitemap."""
+    return f'''  <url>
     <loc>{url['loc']}</loc>
     <lastmod>{url['lastmod']}</lastmod>
     <changefreq>{url['changefreq']}</changefreq>
     <priority>{url['priority']}</priority>
   </url>
-'''
+'''.encode('utf-8')
+
+
+def _open_sitemap_part(filepath: str, gzip_output: bool) -> list:
+    """Open a sitemap file (and its .gz variant) and write the header."""
+    outputs = [open(filepath, 'wb')]
+    if gzip_output:
+        # mtime=0 keeps the .gz byte-identical when the sitemap is unchanged
+        outputs.append(gzip.GzipFile(f'{filepath}.gz', 'wb', compresslevel=6, mtime=0))
+    for out in outputs:
+        out.write(SITEMAP_HEADER)
+    return outputs
 
-    xml += '</urlset>'
-    return xml
 
+def _close_sitemap_part(outputs: list):
+    for out in outputs:
+        out.write(SITEMAP_FOOTER)
+        out.close()
 
-def generate_sitemap_index(sitemap_files: List[str]) -> str:
-    """Generate sitemap index XML pointing to category sitemaps."""
-    lastmod = datetime.now().strftime('%Y-%m-%d')
+
+def write_sitemaps(urls: Iterable[dict], directory: str, stem: str,
+                   gzip_output: bool = False) -> List[Tuple[str, int, str]]:
+    """Stream sorted URLs into directory/<stem>.xml, one <url> at a time.
+
+    A new part is started before a file would pass MAX_URLS_PER_SITEMAP URLs
+    or MAX_SITEMAP_BYTES uncompressed; parts are then named <stem>-1.xml,
+    <stem>-2.xml, ... With gzip_output each file gets a .xml.gz twin.
+
+    Returns:
+        (filename, url count, newest lastmod) for each part
+    """
+    parts = [[f'{stem}.xml', 0, '']]
+    outputs = _open_sitemap_part(os.path.join(directory, parts[0][0]), gzip_output)
+    size = len(SITEMAP_HEADER)
+
+    for url in urls:
+        entry = sitemap_url_entry(url)
+        part = parts[-1]
+        if part[1] and (part[1] >= MAX_URLS_PER_SITEMAP
+                        or size + len(entry) + len(SITEMAP_FOOTER) > MAX_SITEMAP_BYTES):
+            _close_sitemap_part(outputs)
+            if len(parts) == 1:
+                first = f'{stem}-1.xml'
+                os.replace(os.path.join(directory, part[0]), os.path.join(directory, first))
+                if gzip_output:
+                    os.replace(os.path.join(directory, f'{part[0]}.gz'), os.path.join(directory, f'{first}.gz'))
+                part[0] = first
+            part = [f'{stem}-{len(parts) + 1}.xml', 0, '']
+            parts.append(part)
+            outputs = _open_sitemap_part(os.path.join(directory, part[0]), gzip_output)
+            size = len(SITEMAP_HEADER)
+
+        for out in outputs:
+            out.write(entry)
+        size += len(entry)
+        part[1] += 1
+        part[2] = max(part[2], url['lastmod'])
+
+    _close_sitemap_part(outputs)
+    return [tuple(part) for part in parts]
+
+
+def remove_stale_sitemaps(directory: str, pattern: str, keep: List[str]):
+    """Delete sitemap files from earlier runs (e.g. parts of a category that has since shrunk)."""
+    keep = set(keep)
+    for name in os.listdir(directory):
+        if re.fullmatch(pattern, name) and name not in keep:
+            os.remove(os.path.join(directory, name))
+
+
+def generate_sitemap_index(sitemap_files: List[str], lastmods: List[str] = None) -> str:
+    """Generate sitemap index XML pointing to category sitemaps.
+
+    lastmods gives each sitemap's newest page date (default: today for all).
+    """
+    if lastmods is None:
+        lastmods = [datetime.now().strftime('%Y-%m-%d')] * len(sitemap_files)
 
     xml = '''<?xml version="1.0" encoding="UTF-8"?>
 <sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
 '''
 
-    for sitemap_file in sitemap_files:
+    for sitemap_file, lastmod in zip(sitemap_files, lastmods):
         xml += f'''  <sitemap>
     <loc>{BASE_URL}/sitemaps/{sitemap_file}</loc>
     <lastmod>{lastmod}</lastmod>
@@ -208,52 +318,49 @@ def generate_sitemap_index(sitemap_files: List[str]) -> str:
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate XML sitemaps')
+    parser.add_argument('--manifest', action='store_true',
+                        help=f'Build from {MANIFEST_PATH} instead of walking {SITE_DIR}/')
+    parser.add_argument('--rescan', action='store_true',
+                        help=f'With --manifest: walk {SITE_DIR}/ first to pick up hand-written or deleted pages')
+    parser.add_argument('--gzip', action='store_true',
+                        help='Also write .xml.gz sitemaps and point the index at them')
+    args = parser.parse_args()
+
     # Create sitemaps directory
     os.makedirs(SITEMAPS_DIR, exist_ok=True)
 
     # Collect and categorize URLs
-    categorized_urls = collect_urls()
+    if args.manifest:
+        pages = collect_urls_from_manifest(rescan=args.rescan)
+    else:
+        pages = collect_urls()
 
     # Track generated sitemaps
     generated_sitemaps = []
+    sitemap_lastmods = []
+    written_files = []
     total_urls = 0
 
-    # Generate category sitemaps
-    for category, urls in categorized_urls.items():
-        if not urls:
+    # Generate category sitemaps (large categories are split into -1, -2, ... parts)
+    for category in CATEGORIES:
+        paths = category_paths(pages, category)
+        if not paths:
             continue
 
-        # Handle large categories that exceed 50K limit
-        if len(urls) > MAX_URLS_PER_SITEMAP:
-            # Split into multiple sitemaps
-            for i in range(0, len(urls), MAX_URLS_PER_SITEMAP):
-                chunk = urls[i:i + MAX_URLS_PER_SITEMAP]
-                chunk_num = i // MAX_URLS_PER_SITEMAP + 1
-                filename = f'sitemap-{category}-{chunk_num}.xml'
-
-                sitemap_xml = generate_sitemap_xml(chunk)
-                filepath = f'{SITEMAPS_DIR}/{filename}'
-
-                with open(filepath, 'w') as f:
-                    f.write(sitemap_xml)
-
-                generated_sitemaps.append(filename)
-                total_urls += len(chunk)
-                print(f"  Generated {filename} with {len(chunk)} URLs")
-        else:
-            filename = f'sitemap-{category}.xml'
-            sitemap_xml = generate_sitemap_xml(urls)
-            filepath = f'{SITEMAPS_DIR}/{filename}'
+        urls = iter_category_urls(pages, category, paths)
+        for filename, count, lastmod in write_sitemaps(urls, SITEMAPS_DIR, f'sitemap-{category}',
+                                                       gzip_output=args.gzip):
+            generated_sitemaps.append(f'{filename}.gz' if args.gzip else filename)
+            sitemap_lastmods.append(lastmod)
+            written_files += [filename, f'{filename}.gz'] if args.gzip else [filename]
+            total_urls += count
+            print(f"  Generated {filename} with {count} URLs")
 
-            with open(filepath, 'w') as f:
-                f.write(sitemap_xml)
-
-            generated_sitemaps.append(filename)
-            total_urls += len(urls)
-            print(f"  Generated {filename} with {len(urls)} URLs")
+    remove_stale_sitemaps(SITEMAPS_DIR, r'sitemap-.+\.xml(\.gz)?', written_files)
 
     # Generate sitemap index
-    sitemap_index = generate_sitemap_index(generated_sitemaps)
+    sitemap_index = generate_sitemap_index(generated_sitemaps, sitemap_lastmods)
     index_path = f'{SITE_DIR}/sitemap_index.xml'
 
     with open(index_path, 'w') as f:
@@ -261,18 +368,15 @@ def main():
 
     print(f"\n  Generated sitemap_index.xml pointing to {len(generated_sitemaps)} sitemaps")
 
-    # Also keep a flat sitemap.xml for backwards compatibility
-    all_urls = []
-    for urls in categorized_urls.values():
-        all_urls.extend(urls)
-
-    flat_sitemap = generate_sitemap_xml(all_urls)
-    flat_path = f'{SITE_DIR}/sitemap.xml'
+    # Also keep a flat sitemap.xml for backwards compatibility, merged from the sorted categories
+    all_urls = heapq.merge(*(iter_category_urls(pages, category, category_paths(pages, category))
+                             for category in CATEGORIES), key=url_sort_key)
+    flat_parts = write_sitemaps(all_urls, SITE_DIR, 'sitemap', gzip_output=args.gzip)
+    remove_stale_sitemaps(SITE_DIR, r'sitemap(-\d+)?\.xml(\.gz)?',
+                          [name for part in flat_parts for name in (part[0], f'{part[0]}.gz' if args.gzip else part[0])])
 
-    with open(flat_path, 'w') as f:
-        f.write(flat_sitemap)
-
-    print(f"  Generated sitemap.xml (flat) with {len(all_urls)} URLs")
+    for filename, count, lastmod in flat_parts:
+        print(f"  Generated {filename} (flat) with {count} URLs")
 
     # Update robots.txt
     robots_path = f'{SITE_DIR}/robots.txt'
@@ -283,8 +387,7 @@ Allow: /
 Sitemap: {BASE_URL}/sitemap_index.xml
 
 # Flat sitemap for backwards compatibility
-Sitemap: {BASE_URL}/sitemap.xml
-'''
+''' + ''.join(f'Sitemap: {BASE_URL}/{part[0]}\n' for part in flat_parts)
 
     with open(robots_path, 'w') as f:
         f.write(robots_content)
@@ -16,7 +16,6 @@ Creates in-depth review pages following best practices:
 
 import os
 import json
-import glob
 import pandas as pd
 from datetime import datetime
 import sys
@@ -29,6 +28,8 @@ from templates import (
 )
 from seo_core import generate_collectionpage_schema, generate_itemlist_schema, generate_review_schema, generate_breadcrumb_schema, generate_faq_schema
 from nav_config import SITE_NAME
+from job_data import latest_jobs_file, load_jobs
+from site_manifest import write_page, flush_pages
 
 DATA_DIR = 'data'
 SITE_DIR = 'site'
@@ -2064,8 +2065,7 @@ def generate_tool_review_page(slug, tool_data, job_count):
     html += get_footer_html()
 
     output_path = f"{tool_dir}/index.html"
-    with open(output_path, 'w') as f:
-        f.write(html)
+    write_page(output_path, html)
 
     return slug
 
@@ -2262,8 +2262,7 @@ def generate_tools_index(tools_with_counts):
     html += get_footer_html()
 
     output_path = f"{TOOLS_DIR}/index.html"
-    with open(output_path, 'w') as f:
-        f.write(html)
+    write_page(output_path, html)
 
     print(f"  Saved tools index: {output_path}")
 
@@ -2275,10 +2274,9 @@ def main():
 
     # Load job data for counting
     jobs_df = pd.DataFrame()
-    job_files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
-    if job_files:
-        latest_file = sorted(job_files)[-1]
-        jobs_df = pd.read_csv(latest_file)
+    latest_file = latest_jobs_file(DATA_DIR)
+    if latest_file:
+        jobs_df = load_jobs(latest_file, columns=['skills_tags'], data_dir=DATA_DIR)
         print(f"  Loaded {len(jobs_df)} jobs for tool counting")
 
     # Generate pages
@@ -2297,6 +2295,7 @@ def main():
 
     # Generate index
     generate_tools_index(tools_with_counts)
+    flush_pages()
 
     print(f"\n{'='*70}")
     print(f"  Generated {generated} tool review pages")
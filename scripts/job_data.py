@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Shared loader for enriched job snapshots (data/ai_jobs_YYYYMMDD.csv).
+
+Every generator used to glob, pick the latest file and pd.read_csv it. This
+module does that in one place and keeps a columnar cache so the CSV (with its
+long descriptions) is parsed once per snapshot:
+
+- The cache lives in data/.jobs_cache/<csv name>-<size>-<mtime>/, one pickle
+  per column, so a changed source file gets a fresh cache automatically.
+- Callers that pass columns=[...] only unpickle those columns, e.g.
+  load_jobs(columns=['salary_max', 'job_category']) never touches description.
+- Pickles keep the parsed dtypes, so cached frames match pd.read_csv. The
+  cache is ignored if it was written by a different pandas version.
+
+enrich_jobs.py also writes a summary sidecar next to each snapshot
+(ai_jobs_YYYYMMDD.summary.json: row count, salary stats, category, metro,
+remote and seniority counts, content digest). load_snapshot_summary() reads
+it and only goes back to the CSV when it is missing or stale.
+
+Usage:
+    from job_data import load_jobs, latest_jobs_file
+    df = load_jobs()                                   # latest snapshot, all columns
+    df = load_jobs(columns=['job_category'])           # projection
+    prev = load_jobs(previous_jobs_file(), columns=['job_id'])
+    companies = summarize_companies(df)               # one row per company
+    summary = load_snapshot_summary()                  # totals without reading the CSV
+"""
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import re
+import shutil
+import tempfile
+from datetime import datetime
+
+import pandas as pd
+
+DATA_DIR = 'data'
+CACHE_DIR_NAME = '.jobs_cache'
+
+_SNAPSHOT_DATE = re.compile(r'(\d{8})\.csv$')
+
+# Columns summarize_snapshot() reads, and those it counts values of
+SUMMARY_COLUMNS = ['job_category', 'metro', 'remote_type', 'seniority', 'is_remote', 'salary_max', 'max_amount']
+SUMMARY_COUNT_COLUMNS = ['job_category', 'metro', 'remote_type', 'seniority']
+
+# salary_max outside this range is a parsing error (hourly rates, typos)
+SALARY_RANGE = (50000, 1000000)
+
+
+def list_jobs_files(data_dir=DATA_DIR):
+    """Enriched snapshot CSVs, oldest first (by YYYYMMDD in the name, then name)."""
+    files = glob.glob(os.path.join(data_dir, 'ai_jobs_*.csv'))
+
+    def sort_key(path):
+        match = _SNAPSHOT_DATE.search(os.path.basename(path))
+        return (match.group(1) if match else '', os.path.basename(path))
+
+    return sorted(files, key=sort_key)
+
+
+def latest_jobs_file(data_dir=DATA_DIR):
+    """Path of the most recent snapshot, or None."""
+    files = list_jobs_files(data_dir)
+    return files[-1] if files else None
+
+
+def previous_jobs_file(data_dir=DATA_DIR, path=None):
+    """Path of the snapshot before `path` (default: before the latest one), or None."""
+    files = list_jobs_files(data_dir)
+    if path is None:
+        return files[-2] if len(files) >= 2 else None
+    names = [os.path.basename(f) for f in files]
+    position = names.index(os.path.basename(path)) if os.path.basename(path) in names else len(files)
+    return files[position - 1] if position >= 1 else None
+
+
+def snapshot_date(path):
+    """Date a snapshot was taken, YYYY-MM-DD: the YYYYMMDD in its name (else its mtime)."""
+    match = _SNAPSHOT_DATE.search(os.path.basename(path))
+    if match:
+        return datetime.strptime(match.group(1), '%Y%m%d').strftime('%Y-%m-%d')
+    return datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y-%m-%d')
+
+
+def _cache_dir(path):
+    """Cache directory for a CSV, keyed by its size and mtime."""
+    stat = os.stat(path)
+    key = f"{os.path.basename(path)}-{stat.st_size}-{stat.st_mtime_ns}"
+    return os.path.join(os.path.dirname(path) or '.', CACHE_DIR_NAME, key)
+
+
+def _column_file(cache_dir, position):
+    # Column names can contain anything, so files are named by position
+    return os.path.join(cache_dir, f'col_{position:03d}.pkl')
+
+
+def _write_cache(path, df):
+    """Write df column by column; the directory is renamed into place when complete."""
+    cache_dir = _cache_dir(path)
+    cache_root = os.path.dirname(cache_dir)
+    os.makedirs(cache_root, exist_ok=True)
+
+    # Drop caches of older versions of the same file
+    prefix = f"{os.path.basename(path)}-"
+    for name in os.listdir(cache_root):
+        if name.startswith(prefix) and os.path.join(cache_root, name) != cache_dir:
+            shutil.rmtree(os.path.join(cache_root, name), ignore_errors=True)
+
+    staging = tempfile.mkdtemp(dir=cache_root, prefix='.tmp-')
+    try:
+        for position, column in enumerate(df.columns):
+            with open(_column_file(staging, position), 'wb') as f:
+                pickle.dump(df[column], f, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(os.path.join(staging, 'meta.json'), 'w') as f:
+            json.dump({'source': os.path.basename(path), 'rows': len(df), 'columns': list(df.columns),
+                       'pandas': pd.__version__}, f)
+        os.rename(staging, cache_dir)
+    except OSError:
+        # Another process won the race or the disk is read-only; the cache is optional
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _read_cache(path, columns=None):
+    """Load (a projection of) a cached snapshot, or None if there is no usable cache."""
+    cache_dir = _cache_dir(path)
+    try:
+        with open(os.path.join(cache_dir, 'meta.json')) as f:
+            meta = json.load(f)
+        if meta.get('pandas') != pd.__version__:
+            return None
+        all_columns = meta['columns']
+        wanted = all_columns if columns is None else [c for c in columns if c in all_columns]
+        data = {}
+        for column in wanted:
+            with open(_column_file(cache_dir, all_columns.index(column)), 'rb') as f:
+                data[column] = pickle.load(f)
+    except (OSError, ValueError, KeyError, pickle.UnpicklingError, EOFError):
+        return None
+    if not wanted:
+        return pd.DataFrame(index=pd.RangeIndex(meta['rows']))
+    return pd.DataFrame(data, columns=wanted)
+
+
+def _load_jobs_json(data_dir):
+    """Legacy fallback: data/jobs.json with a top-level 'jobs' list."""
+    json_path = os.path.join(data_dir, 'jobs.json')
+    if not os.path.exists(json_path):
+        return pd.DataFrame()
+    with open(json_path) as f:
+        return pd.DataFrame(json.load(f).get('jobs', []))
+
+
+def load_jobs(path=None, columns=None, data_dir=DATA_DIR, use_cache=True):
+    """Load an enriched job snapshot.
+
+    Args:
+        path: CSV to load (default: latest_jobs_file(); falls back to jobs.json)
+        columns: Only return these columns (missing ones are skipped)
+        data_dir: Directory holding the snapshots
+        use_cache: Read/write the columnar cache
+
+    Returns:
+        DataFrame (empty if no data is found)
+    """
+    if path is None:
+        path = latest_jobs_file(data_dir)
+        if path is None:
+            df = _load_jobs_json(data_dir)
+            return df if columns is None else df[[c for c in columns if c in df.columns]]
+
+    if use_cache:
+        df = _read_cache(path, columns)
+        if df is not None:
+            return df
+
+    df = pd.read_csv(path)
+    if use_cache:
+        _write_cache(path, df)
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+
+def remote_mask(df):
+    """Vectorized templates.is_remote: remote_type 'remote', is_remote set, or 'remote' in location."""
+    mask = pd.Series(False, index=df.index)
+    if 'remote_type' in df.columns:
+        mask |= df['remote_type'].astype('string').str.lower().eq('remote').fillna(False).astype(bool)
+    if 'is_remote' in df.columns:
+        mask |= df['is_remote'].fillna(False).astype(bool)
+    if 'location' in df.columns:
+        mask |= df['location'].astype('string').str.lower().str.contains('remote', regex=False).fillna(False).astype(bool)
+    return mask
+
+
+def summarize_companies(df):
+    """Aggregate a snapshot into one row per company with a single groupby.
+
+    Columns:
+        jobs: number of postings
+        salary_count, salary_min, salary_max, salary_median: over the
+            postings' salary_max (NaN when no posting shows a salary)
+        categories, locations: distinct values in first-seen order
+        remote_share: fraction of postings that are remote
+
+    Rows are sorted by jobs, largest first; ties keep first-seen order.
+    Postings without a company are left out.
+    """
+    columns = ['jobs', 'salary_count', 'salary_min', 'salary_max', 'salary_median',
+               'categories', 'locations', 'remote_share']
+    if df.empty or 'company' not in df.columns:
+        return pd.DataFrame(columns=columns)
+
+    company = df['company']
+    salary = pd.to_numeric(df['salary_max'], errors='coerce') if 'salary_max' in df.columns \
+        else pd.Series(float('nan'), index=df.index)
+    frame = pd.DataFrame({'company': company, 'salary': salary, 'remote': remote_mask(df)})
+    summary = frame.groupby('company', sort=False).agg(
+        jobs=('company', 'size'),
+        salary_count=('salary', 'count'),
+        salary_min=('salary', 'min'),
+        salary_max=('salary', 'max'),
+        salary_median=('salary', 'median'),
+        remote_share=('remote', 'mean'),
+    )
+
+    def distinct(column):
+        if column not in df.columns:
+            return pd.Series([[] for _ in summary.index], index=summary.index)
+        values = df[column].dropna().groupby(company, sort=False).unique().map(list)
+        return values.reindex(summary.index).map(lambda v: v if isinstance(v, list) else [])
+
+    summary['categories'] = distinct('job_category')
+    summary['locations'] = distinct('location')
+    return summary.sort_values('jobs', ascending=False, kind='stable')[columns]
+
+
+# =============================================================================
+# SNAPSHOT SIDECARS
+# =============================================================================
+
+_digests = {}
+
+
+def file_digest(path):
+    """Content digest of a snapshot (md5 of the file bytes).
+
+    Cached for the process by path, size and mtime, so a script that reads
+    several sidecars of the same snapshot hashes it once.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if key not in _digests:
+        digest = hashlib.md5()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        _digests[key] = digest.hexdigest()
+    return _digests[key]
+
+
+def file_stamp(path):
+    """What a sidecar records about the snapshot it was computed from."""
+    stat = os.stat(path)
+    return {'file': os.path.basename(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+            'digest': file_digest(path)}
+
+
+def stamp_matches(stamp, path):
+    """True if a recorded file_stamp still describes the file at path.
+
+    Same size and mtime, or (after a git checkout resets mtimes) same digest.
+    """
+    if not isinstance(stamp, dict) or stamp.get('file') != os.path.basename(path):
+        return False
+    stat = os.stat(path)
+    if stamp.get('size') != stat.st_size:
+        return False
+    return stamp.get('mtime_ns') == stat.st_mtime_ns or stamp.get('digest') == file_digest(path)
+
+
+def refresh_stamp(stamp, path):
+    """Move a matching stamp's mtime_ns to the file's current one.
+
+    Returns True if it changed, i.e. the match was by digest and the sidecar
+    should be saved again so the next read takes the mtime fast path.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    if stamp.get('mtime_ns') == mtime_ns:
+        return False
+    stamp['mtime_ns'] = mtime_ns
+    return True
+
+
+def save_sidecar(sidecar, data):
+    """Write a sidecar's JSON atomically (via a .tmp file)."""
+    tmp_path = f'{sidecar}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp_path, sidecar)
+
+
+def summary_path(path):
+    return f'{os.path.splitext(path)[0]}.summary.json'
+
+
+def _salary_stats(values):
+    if values.empty:
+        return {'count': 0, 'mean': None, 'median': None, 'min': None, 'max': None}
+    return {'count': int(len(values)), 'mean': float(values.mean()), 'median': float(values.median()),
+            'min': float(values.min()), 'max': float(values.max())}
+
+
+def summarize_snapshot(df):
+    """Totals of a snapshot, as stored in its summary sidecar.
+
+    Keys:
+        rows: number of postings
+        salary: count/mean/median/min/max of salary_max within SALARY_RANGE
+            (None without a salary_max column)
+        positive_salary: the same over every positive salary_max (or max_amount)
+        counts: {column: {value: postings}} for SUMMARY_COUNT_COLUMNS present,
+            most common first (value_counts order)
+        is_remote: postings with is_remote set (None without the column)
+    """
+    salary = None
+    if 'salary_max' in df.columns:
+        values = pd.to_numeric(df['salary_max'], errors='coerce')
+        salary = _salary_stats(values[(values > SALARY_RANGE[0]) & (values < SALARY_RANGE[1])])
+
+    positive_salary = None
+    salary_col = 'salary_max' if 'salary_max' in df.columns else 'max_amount'
+    if salary_col in df.columns:
+        values = pd.to_numeric(df[salary_col], errors='coerce').dropna()
+        positive_salary = _salary_stats(values[values > 0])
+
+    counts = {}
+    for column in SUMMARY_COUNT_COLUMNS:
+        if column in df.columns:
+            counts[column] = {str(value): int(n) for value, n in df[column].value_counts().items()}
+
+    is_remote = None
+    if 'is_remote' in df.columns:
+        is_remote = int(df['is_remote'].fillna(False).astype(bool).sum())
+
+    return {'rows': len(df), 'salary': salary, 'positive_salary': positive_salary,
+            'counts': counts, 'is_remote': is_remote}
+
+
+def write_snapshot_summary(path, data_dir=DATA_DIR):
+    """Compute the summary of a snapshot and save it as its sidecar. Returns the summary."""
+    summary = summarize_snapshot(load_jobs(path, columns=SUMMARY_COLUMNS, data_dir=data_dir))
+    summary['source'] = file_stamp(path)
+    save_sidecar(summary_path(path), summary)
+    return summary
+
+
+def load_snapshot_summary(path=None, data_dir=DATA_DIR):
+    """Summary of a snapshot (default: the latest), see summarize_snapshot.
+
+    Read from the sidecar when it matches the CSV; otherwise recomputed from
+    the CSV and saved. Returns None if there is no snapshot.
+    """
+    if path is None:
+        path = latest_jobs_file(data_dir)
+        if path is None:
+            return None
+    try:
+        with open(summary_path(path)) as f:
+            summary = json.load(f)
+        if stamp_matches(summary.get('source'), path):
+            if refresh_stamp(summary['source'], path):
+                save_sidecar(summary_path(path), summary)
+            return summary
+    except (OSError, ValueError):
+        pass
+    return write_snapshot_summary(path, data_dir)
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Embedded SQL query layer over the master job store for AI Market Pulse.
+
+merge_to_master.py loads the weekly partitions of data/master/ (see
+master_store.py) into a SQLite database, data/master_jobs.sqlite, with indexes
+on company, job_category, metro, seniority, import_week and url. Callers ask it for
+grouped aggregates or a narrow set of columns instead of reading every
+partition into pandas.
+
+The lifecycle table mirrors the store's URL index (first_seen, last_seen,
+times_seen per job URL) and joins to jobs on url, so expired jobs and time
+on market are indexed lookups.
+
+The database is derived data: a partition (or the URL index) is reloaded when
+its content hash changes, and a missing database is rebuilt from data/master/.
+
+Usage:
+    from job_db import build_job_db, count_by, salary_by, load_rows
+    build_job_db()                                  # sync with data/master/
+    count_by('job_category', limit=10)              # jobs per category
+    expired_jobs(['title', 'company', 'location'])  # jobs missing from the latest import
+    salary_by('metro', min_jobs=3)                  # salary aggregates per metro
+    load_rows(['salary_max', 'seniority'], weeks=['2026-W04'])
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+
+import pandas as pd
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from master_store import (
+    DATA_DIR, MASTER_DIR, URL_INDEX_NAME, list_weeks, partition_path, url_column, load_url_index,
+)
+
+DB_PATH = f'{DATA_DIR}/master_jobs.sqlite'
+INDEXED_COLUMNS = ('company', 'job_category', 'metro', 'seniority', 'import_week', 'url')
+
+# Bump when the tables change; an older database is dropped and rebuilt
+SCHEMA_VERSION = 2
+
+# Salaries outside this range are parsing errors (hourly rates, typos)
+SALARY_FLOOR = 50000
+SALARY_CEILING = 1000000
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def connect(db_path=DB_PATH):
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+        for table in ('partitions', 'jobs', 'lifecycle'):
+            conn.execute(f'DROP TABLE IF EXISTS {table}')
+        conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    conn.execute('CREATE TABLE IF NOT EXISTS partitions (import_week TEXT PRIMARY KEY, hash TEXT, rows INTEGER)')
+    conn.execute(f'CREATE TABLE IF NOT EXISTS jobs ({", ".join(_quote(c) for c in INDEXED_COLUMNS)})')
+    for column in INDEXED_COLUMNS:
+        conn.execute(f'CREATE INDEX IF NOT EXISTS idx_jobs_{column} ON jobs ({_quote(column)})')
+    conn.execute('CREATE TABLE IF NOT EXISTS lifecycle (url TEXT PRIMARY KEY, import_week TEXT, '
+                 'first_seen TEXT, last_seen TEXT, times_seen INTEGER)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_lifecycle_last_seen ON lifecycle (last_seen)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_lifecycle_import_week ON lifecycle (import_week)')
+    return conn
+
+
+def table_columns(conn):
+    return [row[1] for row in conn.execute('PRAGMA table_info(jobs)')]
+
+
+def _ensure_columns(conn, columns):
+    """Add columns the table doesn't have yet (partitions gain columns over time)."""
+    existing = set(table_columns(conn))
+    for column in columns:
+        if column not in existing:
+            conn.execute(f'ALTER TABLE jobs ADD COLUMN {_quote(column)}')
+            existing.add(column)
+
+
+def _file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+def _load_partition(conn, week, path):
+    df = pd.read_csv(path)
+    # Early snapshots name the column company_name
+    if 'company_name' in df.columns:
+        df['company'] = df['company'].fillna(df['company_name']) if 'company' in df.columns else df['company_name']
+    # The URL merge_to_master indexed these rows under
+    url_col = url_column(df)
+    df['url'] = df[url_col] if url_col else None
+    df['import_week'] = week
+    _ensure_columns(conn, df.columns)
+    conn.execute('DELETE FROM jobs WHERE import_week = ?', (week,))
+    df.to_sql('jobs', conn, if_exists='append', index=False)
+    return len(df)
+
+
+def _loaded_hash(conn, name):
+    # The URL index is tracked in the partitions table under its file name
+    row = conn.execute('SELECT hash FROM partitions WHERE import_week = ?', (name,)).fetchone()
+    return row[0] if row else None
+
+
+def _load_lifecycle(conn, master_dir):
+    """Replace the lifecycle table with the URL index if the index changed."""
+    path = os.path.join(master_dir, URL_INDEX_NAME)
+    digest = _file_hash(path) if os.path.exists(path) else ''
+    if _loaded_hash(conn, URL_INDEX_NAME) == digest:
+        return
+    conn.execute('DELETE FROM lifecycle')
+    conn.executemany('INSERT OR REPLACE INTO lifecycle VALUES (?, ?, ?, ?, ?)',
+                     load_url_index(master_dir).astype(object).itertuples(index=False, name=None))
+    conn.execute('INSERT OR REPLACE INTO partitions VALUES (?, ?, ?)',
+                 (URL_INDEX_NAME, digest, conn.execute('SELECT COUNT(*) FROM lifecycle').fetchone()[0]))
+
+
+def build_job_db(master_dir=MASTER_DIR, db_path=DB_PATH):
+    """Bring the database in line with the partitions and URL index of master_dir.
+
+    Returns (partitions reloaded, total rows).
+    """
+    conn = connect(db_path)
+    try:
+        loaded = {week: digest for week, digest in conn.execute('SELECT import_week, hash FROM partitions')
+                  if week != URL_INDEX_NAME}
+        weeks = list_weeks(master_dir)
+        reloaded = 0
+        with conn:
+            for week in set(loaded) - set(weeks):
+                conn.execute('DELETE FROM jobs WHERE import_week = ?', (week,))
+                conn.execute('DELETE FROM partitions WHERE import_week = ?', (week,))
+            for week in weeks:
+                path = partition_path(week, master_dir)
+                digest = _file_hash(path)
+                if loaded.get(week) == digest:
+                    continue
+                rows = _load_partition(conn, week, path)
+                conn.execute('INSERT OR REPLACE INTO partitions VALUES (?, ?, ?)', (week, digest, rows))
+                reloaded += 1
+            _load_lifecycle(conn, master_dir)
+        total = conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+    finally:
+        conn.close()
+    return reloaded, total
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+def query(sql, params=(), db_path=DB_PATH):
+    """Run a query against the jobs database and return the result as a DataFrame."""
+    conn = connect(db_path)
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def _week_filter(weeks):
+    """WHERE clause and parameters selecting import weeks (everything if weeks is None)."""
+    if weeks is None:
+        return '1 = 1', []
+    weeks = list(weeks)
+    if not weeks:
+        return '0 = 1', []
+    return f'import_week IN ({", ".join("?" * len(weeks))})', weeks
+
+
+def load_rows(columns=None, weeks=None, db_path=DB_PATH):
+    """Rows of the selected import weeks, restricted to `columns` (those that exist)."""
+    conn = connect(db_path)
+    try:
+        available = table_columns(conn)
+        if columns is not None:
+            available = [column for column in available if column in set(columns)]
+        if not available:
+            return pd.DataFrame(columns=columns or [])
+        where, params = _week_filter(weeks)
+        sql = f'SELECT {", ".join(_quote(c) for c in available)} FROM jobs WHERE {where}'
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def job_columns(db_path=DB_PATH):
+    """Columns of the jobs table. Check before grouping: SQLite reads an unknown "column" as a string."""
+    conn = connect(db_path)
+    try:
+        return table_columns(conn)
+    finally:
+        conn.close()
+
+
+def count_by(column, weeks=None, limit=None, db_path=DB_PATH):
+    """Jobs per value of `column` (NULLs skipped), most common first."""
+    if column not in job_columns(db_path):
+        return pd.DataFrame(columns=['value', 'jobs'])
+    where, params = _week_filter(weeks)
+    sql = (f'SELECT {_quote(column)} AS value, COUNT(*) AS jobs FROM jobs '
+           f'WHERE {where} AND {_quote(column)} IS NOT NULL '
+           f'GROUP BY {_quote(column)} ORDER BY jobs DESC, value')
+    if limit:
+        sql += f' LIMIT {int(limit)}'
+    return query(sql, params, db_path)
+
+
+def salary_by(column, weeks=None, min_jobs=1, db_path=DB_PATH):
+    """Salary aggregates per value of `column`, over jobs with a plausible salary_max.
+
+    Columns: value, jobs, min_base_avg, max_base_avg, median (of salary_max),
+    max_base_top. A missing salary_min counts as 0.
+    """
+    columns = ['value', 'jobs', 'min_base_avg', 'max_base_avg', 'median', 'max_base_top']
+    available = job_columns(db_path)
+    if column not in available or 'salary_max' not in available:
+        return pd.DataFrame(columns=columns)
+    min_base = 'COALESCE(CAST(salary_min AS REAL), 0)' if 'salary_min' in available else '0'
+    where, params = _week_filter(weeks)
+    # Median: the middle row (or the mean of the middle two) of each group, by window position
+    sql = (f'WITH salaries AS (SELECT {_quote(column)} AS value, CAST(salary_max AS REAL) AS max_base, '
+           f'{min_base} AS min_base FROM jobs WHERE {where} AND {_quote(column)} IS NOT NULL '
+           f'AND CAST(salary_max AS REAL) > ? AND CAST(salary_max AS REAL) < ?), '
+           f'ranked AS (SELECT *, ROW_NUMBER() OVER (PARTITION BY value ORDER BY max_base) AS position, '
+           f'COUNT(*) OVER (PARTITION BY value) AS n FROM salaries) '
+           f'SELECT value, COUNT(*) AS jobs, AVG(min_base) AS min_base_avg, AVG(max_base) AS max_base_avg, '
+           f'AVG(CASE WHEN position IN ((n + 1) / 2, (n + 2) / 2) THEN max_base END) AS median, '
+           f'MAX(max_base) AS max_base_top FROM ranked '
+           f'GROUP BY value HAVING COUNT(*) >= ? ORDER BY jobs DESC, value')
+    return query(sql, params + [SALARY_FLOOR, SALARY_CEILING, min_jobs], db_path)[columns]
+
+
+def total_jobs(weeks=None, db_path=DB_PATH):
+    where, params = _week_filter(weeks)
+    return int(query(f'SELECT COUNT(*) AS jobs FROM jobs WHERE {where}', params, db_path)['jobs'][0])
+
+
+# =============================================================================
+# JOB LIFECYCLE
+# =============================================================================
+
+def _job_columns(conn, columns):
+    available = table_columns(conn)
+    if columns is not None:
+        available = [column for column in available if column in set(columns)]
+    return ', '.join(f'j.{_quote(c)}' for c in available)
+
+
+def expired_jobs(columns=None, db_path=DB_PATH):
+    """Jobs whose URL was not in the latest import, with first_seen/last_seen/times_seen."""
+    conn = connect(db_path)
+    try:
+        selected = _job_columns(conn, columns)
+        sql = (f'SELECT {selected + ", " if selected else ""}l.first_seen, l.last_seen, l.times_seen '
+               'FROM lifecycle l JOIN jobs j ON j.url = l.url '
+               'WHERE l.last_seen < (SELECT MAX(last_seen) FROM lifecycle)')
+        return pd.read_sql_query(sql, conn)
+    finally:
+        conn.close()
+
+
+def time_on_market(group_by=None, db_path=DB_PATH):
+    """Days between first and last sighting, over jobs no longer listed.
+
+    Columns: [value,] jobs, avg_days, max_days (grouped by a jobs column if given).
+    """
+    days = 'julianday(l.last_seen) - julianday(l.first_seen)'
+    value = f'j.{_quote(group_by)} AS value, ' if group_by else ''
+    group = f' GROUP BY j.{_quote(group_by)} ORDER BY jobs DESC' if group_by else ''
+    sql = (f'SELECT {value}COUNT(*) AS jobs, AVG({days}) AS avg_days, MAX({days}) AS max_days '
+           'FROM lifecycle l JOIN jobs j ON j.url = l.url '
+           "WHERE l.first_seen != '' AND l.last_seen < (SELECT MAX(last_seen) FROM lifecycle)" + group)
+    return query(sql, (), db_path)
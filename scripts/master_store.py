@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Append-only master job store for AI Market Pulse.
+
+Replaces data/master_jobs_database.csv, which merge_to_master.py read in full
+and rewrote on every import. The store lives in data/master/:
+
+- jobs-<import_week>.csv: one partition per import week (e.g. jobs-2026-W04.csv).
+  A merge writes only the partition of the current week; older partitions are
+  never touched again.
+- url_index.csv: every job URL in the store with the week it was added and
+  its lifecycle: first_seen, last_seen (snapshot dates) and times_seen
+  (snapshots it appeared in). A merge joins the new snapshot against this
+  index instead of reading the partitions, to find which postings are new
+  and to update the lifecycle of the rest.
+- imports.csv: every snapshot merged so far (file name, content digest,
+  snapshot date), so merging the same snapshot again is a no-op.
+
+Sightings are dated by the snapshot (the YYYYMMDD in its name), not by the day
+the merge ran, so two snapshots merged on the same day are two sightings and
+re-running a merge later counts nothing.
+
+CSV keeps the store readable and diffable in git, which is where the workflow
+persists data/ between runs.
+
+Usage:
+    from master_store import load_master, list_weeks
+    df = load_master()                                   # every week
+    df = load_master(weeks=list_weeks()[-4:])            # last four import weeks
+    df = load_master(columns=['salary_max', 'job_category'])
+"""
+
+import glob
+import os
+import re
+
+import pandas as pd
+
+DATA_DIR = 'data'
+MASTER_DIR = f'{DATA_DIR}/master'
+URL_INDEX_NAME = 'url_index.csv'
+IMPORT_LOG_NAME = 'imports.csv'
+LEGACY_MASTER_FILE = f'{DATA_DIR}/master_jobs_database.csv'
+
+_PARTITION = re.compile(r'^jobs-(.+)\.csv$')
+
+
+def url_column(df):
+    """Column that identifies a posting: job_url_direct, else source_url (None if neither)."""
+    for column in ('job_url_direct', 'source_url'):
+        if column in df.columns:
+            return column
+    return None
+
+
+def partition_path(week, master_dir=MASTER_DIR):
+    return os.path.join(master_dir, f'jobs-{week}.csv')
+
+
+def list_weeks(master_dir=MASTER_DIR):
+    """Import weeks with a partition, oldest first."""
+    weeks = []
+    for path in glob.glob(os.path.join(master_dir, 'jobs-*.csv')):
+        match = _PARTITION.match(os.path.basename(path))
+        if match:
+            weeks.append(match.group(1))
+    return sorted(weeks)
+
+
+def has_store(master_dir=MASTER_DIR):
+    return bool(list_weeks(master_dir))
+
+
+URL_INDEX_COLUMNS = ['url', 'import_week', 'first_seen', 'last_seen', 'times_seen']
+
+
+def load_url_index(master_dir=MASTER_DIR):
+    """URL index as a DataFrame with URL_INDEX_COLUMNS (empty if there is none)."""
+    path = os.path.join(master_dir, URL_INDEX_NAME)
+    if not os.path.exists(path):
+        return pd.DataFrame({column: pd.Series(dtype=str) for column in URL_INDEX_COLUMNS})
+    index = pd.read_csv(path, dtype=str, keep_default_na=False)
+    for column in ('first_seen', 'last_seen'):
+        if column not in index.columns:
+            index[column] = ''
+    index['times_seen'] = pd.to_numeric(index.get('times_seen', 1), errors='coerce').fillna(1).astype(int)
+    return index[URL_INDEX_COLUMNS]
+
+
+def save_url_index(index, master_dir=MASTER_DIR):
+    os.makedirs(master_dir, exist_ok=True)
+    path = os.path.join(master_dir, URL_INDEX_NAME)
+    tmp_path = f'{path}.tmp'
+    index[URL_INDEX_COLUMNS].to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def update_url_index(index, urls, week, date):
+    """Record one import of `urls` (the URLs of a snapshot) in the URL index.
+
+    `date` is the snapshot date. URLs already indexed get one more times_seen
+    (once per snapshot date, so a re-enriched snapshot doesn't count twice)
+    and their first_seen/last_seen widened to include date, so snapshots
+    merged out of order still give the right range; new URLs are added with
+    first_seen = last_seen = date.
+
+    Returns (updated index, number of URLs added).
+    """
+    urls = pd.Series(urls, dtype=object).dropna().astype(str)
+    urls = urls[~urls.duplicated()]
+    index = index.copy()
+
+    listed = index['url'].isin(urls)
+    seen = listed & (index['last_seen'] != date) & (index['first_seen'] != date)
+    index.loc[seen, 'times_seen'] += 1
+    index.loc[listed & (index['last_seen'] < date), 'last_seen'] = date
+    index.loc[listed & ((index['first_seen'] == '') | (index['first_seen'] > date)), 'first_seen'] = date
+
+    new_urls = urls[~urls.isin(index['url'])]
+    added = pd.DataFrame({'url': new_urls.values, 'import_week': week, 'first_seen': date,
+                          'last_seen': date, 'times_seen': 1})
+    if len(added):
+        index = pd.concat([index, added], ignore_index=True)
+    return index, len(added)
+
+
+IMPORT_LOG_COLUMNS = ['snapshot', 'digest', 'snapshot_date', 'import_week', 'jobs']
+
+
+def load_import_log(master_dir=MASTER_DIR):
+    """Snapshots merged so far as a DataFrame with IMPORT_LOG_COLUMNS (empty if none)."""
+    path = os.path.join(master_dir, IMPORT_LOG_NAME)
+    if not os.path.exists(path):
+        return pd.DataFrame({column: pd.Series(dtype=str) for column in IMPORT_LOG_COLUMNS})
+    return pd.read_csv(path, dtype=str, keep_default_na=False)[IMPORT_LOG_COLUMNS]
+
+
+def record_import(snapshot, digest, date, week, jobs, master_dir=MASTER_DIR):
+    """Add a merged snapshot to the import log."""
+    log = load_import_log(master_dir)
+    entry = pd.DataFrame([{'snapshot': snapshot, 'digest': digest, 'snapshot_date': date,
+                           'import_week': week, 'jobs': str(jobs)}])
+    log = pd.concat([log, entry], ignore_index=True)
+    os.makedirs(master_dir, exist_ok=True)
+    path = os.path.join(master_dir, IMPORT_LOG_NAME)
+    tmp_path = f'{path}.tmp'
+    log.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def append_partition(df, week, master_dir=MASTER_DIR):
+    """Add rows to the partition of `week`.
+
+    A new week is a plain write. A second import in the same week rewrites
+    only that week's partition, so columns added since stay aligned.
+    """
+    os.makedirs(master_dir, exist_ok=True)
+    path = partition_path(week, master_dir)
+    if os.path.exists(path):
+        df = pd.concat([pd.read_csv(path), df], ignore_index=True)
+    tmp_path = f'{path}.tmp'
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def load_master(weeks=None, columns=None, master_dir=MASTER_DIR):
+    """Load (part of) the master store.
+
+    Args:
+        weeks: Import weeks to read (default: all)
+        columns: Only read these columns (missing ones are skipped)
+        master_dir: Store directory
+
+    Returns:
+        DataFrame of the selected partitions, oldest week first (empty if none)
+    """
+    available = list_weeks(master_dir)
+    if weeks is not None:
+        wanted = set(weeks)
+        available = [week for week in available if week in wanted]
+
+    usecols = None if columns is None else (lambda column: column in set(columns))
+    frames = [pd.read_csv(partition_path(week, master_dir), usecols=usecols) for week in available]
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=columns or [])
+    return pd.concat(frames, ignore_index=True)
+
+
+def _week_of(df):
+    """import_week of each row of a legacy master CSV (from import_date if missing)."""
+    week = df['import_week'] if 'import_week' in df.columns else pd.Series(pd.NA, index=df.index)
+    if 'import_date' in df.columns:
+        derived = pd.to_datetime(df['import_date'], errors='coerce').dt.strftime('%Y-W%W')
+        week = week.fillna(derived)
+    return week.fillna('legacy').astype(str)
+
+
+def migrate_legacy_master(legacy_file=LEGACY_MASTER_FILE, master_dir=MASTER_DIR):
+    """Split master_jobs_database.csv into weekly partitions and build the URL index.
+
+    Returns the number of rows migrated (0 if there is nothing to migrate).
+    """
+    if has_store(master_dir) or not os.path.exists(legacy_file):
+        return 0
+    legacy_df = pd.read_csv(legacy_file)
+    if legacy_df.empty:
+        return 0
+
+    weeks = _week_of(legacy_df)
+    dates = legacy_df['import_date'].astype(str) if 'import_date' in legacy_df.columns else weeks
+    url_col = url_column(legacy_df)
+    index = load_url_index(master_dir)
+    for week, rows in legacy_df.groupby(weeks, sort=True):
+        append_partition(rows, week, master_dir)
+        if url_col:
+            # The old file only kept the first import of each job
+            for date, dated_rows in rows.groupby(dates.loc[rows.index], sort=True):
+                index, _ = update_url_index(index, dated_rows[url_col], week, date)
+    if url_col:
+        save_url_index(index, master_dir)
+    return len(legacy_df)
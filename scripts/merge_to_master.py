@@ -1,68 +1,103 @@
 #!/usr/bin/env python3
 """
-Merge weekly enriched data into master database.
-This ensures the master_jobs_database.csv is up to date for the website.
+Merge weekly enriched data into the master job store (data/master/).
+This ensures the master store is up to date for the website.
+
+Only the snapshot's week partition, the URL index and the import log are
+written; see master_store.py. Sightings are dated by the snapshot, and a
+snapshot that was already merged is skipped. An existing
+master_jobs_database.csv is migrated once.
 """
 
 import pandas as pd
 import os
-import glob
+import sys
 from datetime import datetime
 
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from master_store import (
+    MASTER_DIR, LEGACY_MASTER_FILE, url_column, load_url_index, save_url_index, update_url_index,
+    append_partition, list_weeks, migrate_legacy_master, load_import_log, record_import,
+)
+from job_data import latest_jobs_file, snapshot_date, file_digest
+from job_db import DB_PATH, build_job_db, time_on_market
+
 DATA_DIR = "data"
 
 print("="*70)
 print("  AI MARKET PULSE - MERGE TO MASTER DATABASE")
 print("="*70)
 
-# Find most recent enriched file
-enriched_files = glob.glob(f"{DATA_DIR}/ai_jobs_*.csv")
-if not enriched_files:
+# Find most recent enriched file (by the date in its name)
+latest_enriched = latest_jobs_file(DATA_DIR)
+if not latest_enriched:
     print("\n No enriched CSV files found")
     print("   Run enrich_jobs.py first")
     exit(0)
 
-latest_enriched = max(enriched_files, key=os.path.getctime)
 print(f"\n Latest enriched file: {latest_enriched}")
 
+# One-time migration of the old single-file master database
+migrated = migrate_legacy_master()
+if migrated:
+    print(f" Migrated {LEGACY_MASTER_FILE}: {migrated} records -> {MASTER_DIR}/")
+    print(f"   {LEGACY_MASTER_FILE} is no longer read and can be deleted")
+
+# A snapshot is merged once; re-running the workflow must not count it again
+snapshot_digest = file_digest(latest_enriched)
+if snapshot_digest in set(load_import_log()['digest']):
+    print(f" {os.path.basename(latest_enriched)} is already in the master store, nothing to merge")
+    reloaded, db_rows = build_job_db()
+    print(f" Query database {DB_PATH}: {reloaded} partitions reloaded, {db_rows} rows")
+    print("="*70)
+    exit(0)
+
 # Load new data
 new_df = pd.read_csv(latest_enriched)
 print(f" New records: {len(new_df)}")
 
-# Add import metadata
-new_df['import_date'] = datetime.now().strftime('%Y-%m-%d')
-new_df['import_week'] = datetime.now().strftime('%Y-W%W')
-
-# Load or create master database
-master_file = f"{DATA_DIR}/master_jobs_database.csv"
-
-if os.path.exists(master_file):
-    master_df = pd.read_csv(master_file)
-    print(f" Existing master database: {len(master_df)} records")
-
-    # Deduplicate based on job_url or source_url
-    url_col = 'job_url_direct' if 'job_url_direct' in new_df.columns else 'source_url'
-
-    if url_col in new_df.columns and url_col in master_df.columns:
-        existing_urls = set(master_df[url_col].dropna().unique())
-        new_records = new_df[~new_df[url_col].isin(existing_urls)]
-        print(f" New unique records: {len(new_records)}")
-
-        if len(new_records) > 0:
-            combined_df = pd.concat([master_df, new_records], ignore_index=True)
-        else:
-            combined_df = master_df
-            print("   No new records to add")
-    else:
-        # No URL column, just append
-        combined_df = pd.concat([master_df, new_df], ignore_index=True)
+# Add import metadata: the snapshot's date, not the day this merge runs
+import_date = snapshot_date(latest_enriched)
+import_week = datetime.strptime(import_date, '%Y-%m-%d').strftime('%Y-W%W')
+new_df['import_date'] = import_date
+new_df['import_week'] = import_week
+
+# Deduplicate against the URL index (the partitions themselves are not read)
+url_index = load_url_index()
+print(f" Master store: {len(url_index)} indexed job URLs in {len(list_weeks())} weekly partitions")
+
+url_col = url_column(new_df)
+if url_col:
+    existing_urls = set(url_index['url'])
+    new_records = new_df[~new_df[url_col].isin(existing_urls)]
+    print(f" New unique records: {len(new_records)}")
 else:
-    print(" Creating new master database")
-    combined_df = new_df
+    # No URL column, just append
+    new_records = new_df
 
-# Save master database
-combined_df.to_csv(master_file, index=False)
-print(f"\n Master database saved: {len(combined_df)} total records")
+if len(new_records) > 0:
+    append_partition(new_records, import_week)
+    print(f"\n Master store saved: {len(new_records)} records added to week {import_week}")
+else:
+    print("   No new records to add")
+
+# Job lifecycle: first_seen / last_seen / times_seen of every URL in this snapshot
+if url_col:
+    url_index, added_urls = update_url_index(url_index, new_df[url_col], import_week, import_date)
+    save_url_index(url_index)
+    seen_now = url_index['url'].isin(new_df[url_col].dropna().astype(str))
+    print(f" Job lifecycle ({import_date}): {seen_now.sum()} seen in this snapshot ({added_urls} first seen), "
+          f"{(~seen_now).sum()} not listed")
+record_import(os.path.basename(latest_enriched), snapshot_digest, import_date, import_week, len(new_df))
+
+# Sync the SQL query layer (reloads only partitions that changed)
+reloaded, db_rows = build_job_db()
+print(f" Query database {DB_PATH}: {reloaded} partitions reloaded, {db_rows} rows")
+market = time_on_market()
+if market['jobs'][0]:
+    print(f" Time on market: {market['avg_days'][0]:.0f} days on average over {market['jobs'][0]} expired jobs")
 
 # Update historical tracking file for trend charts
 tracking_file = f"{DATA_DIR}/job_count_history.csv"
@@ -90,13 +125,13 @@ else:
 print(f"\n{'='*70}")
 print(" MERGE COMPLETE")
 print(f"{'='*70}")
-print(f" Master database: {len(combined_df)} total jobs")
+print(f" Master store: {len(url_index)} unique job URLs")
 print(f" Latest import: {len(new_df)} jobs")
 
 # Category breakdown
-if 'job_category' in combined_df.columns:
-    print("\n Top categories in master database:")
-    cats = combined_df['job_category'].value_counts().head(5)
+if 'job_category' in new_records.columns and len(new_records) > 0:
+    print("\n Top categories among new records:")
+    cats = new_records['job_category'].value_counts().head(5)
     for cat, count in cats.items():
         print(f"   {cat}: {count}")
 
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Parallel page rendering for AI Market Pulse generators.
+
+Generators hand a render function and a list of work items to render_pages().
+With --jobs 1 (the default) pages render in-process exactly as before. With
+--jobs N the items are split into chunks and fanned out to a process pool.
+
+Large read-only inputs (the job DataFrame, related-job indexes) are passed as
+`shared` keyword arguments. Workers are forked, so they inherit these objects
+from the parent instead of receiving a pickled copy per page.
+
+enrich_jobs.py --workers uses the same pool with row ranges of the raw scrape
+as work items.
+
+Usage:
+    jobs = parse_jobs_arg()
+    for result in render_pages(generate_page, [(slug, config), ...], jobs=jobs,
+                               shared={'jobs_df': jobs_df}):
+        ...
+"""
+
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Aim for a few chunks per worker so slow pages don't leave workers idle
+CHUNKS_PER_WORKER = 4
+
+# Set in each worker by _init_worker (inherited via fork, never pickled)
+_worker_render_fn = None
+_worker_shared = {}
+
+
+def parse_jobs_arg(argv=None):
+    """Read --jobs N from the command line (0 = one worker per CPU).
+
+    Unknown arguments are ignored so scripts with their own flags can call this too.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Parallel render processes (0 = all CPUs, default: 1)')
+    args, _ = parser.parse_known_args(argv)
+    return resolve_jobs(args.jobs)
+
+
+def resolve_jobs(jobs):
+    """Normalize a --jobs value to a worker count >= 1."""
+    if jobs is None or jobs < 0:
+        return 1
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _init_worker(render_fn, shared):
+    global _worker_render_fn, _worker_shared
+    _worker_render_fn = render_fn
+    _worker_shared = shared
+
+
+def _render_chunk(chunk):
+    return [_worker_render_fn(*args, **_worker_shared) for args in chunk]
+
+
+def _get_fork_context():
+    """Fork context if the platform supports it, else None."""
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context('fork')
+
+
+def render_pages(render_fn, work_items, jobs=1, shared=None, chunk_size=None):
+    """Render pages, optionally in a process pool.
+
+    Args:
+        render_fn: Called as render_fn(*item, **shared) for each work item
+        work_items: List of argument tuples, one per page
+        jobs: Number of worker processes (1 = render in this process)
+        shared: Read-only keyword arguments passed to every call
+        chunk_size: Items per work unit (default: spread over CHUNKS_PER_WORKER x jobs)
+
+    Yields:
+        render_fn's return value for each item, in work_items order
+    """
+    shared = shared or {}
+    work_items = [item if isinstance(item, tuple) else (item,) for item in work_items]
+
+    context = _get_fork_context() if jobs > 1 else None
+    if jobs > 1 and context is None:
+        print("  Parallel rendering needs fork(); rendering sequentially")
+
+    if context is None or len(work_items) < 2:
+        for args in work_items:
+            yield render_fn(*args, **shared)
+        return
+
+    workers = min(jobs, len(work_items))
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(work_items) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [work_items[i:i + chunk_size] for i in range(0, len(work_items), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(render_fn, shared)) as executor:
+        for results in executor.map(_render_chunk, chunks):
+            yield from results
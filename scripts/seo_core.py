@@ -7,8 +7,10 @@ Centralized SEO logic including:
 - FAQ content generators with data-driven answers
 - Internal linking engine for AI tools and companies
 - Content enrichment and validation utilities
+- Render-time validation of generated pages (see validate_page_seo)
 """
 
+import html as html_lib
 import json
 import re
 from datetime import datetime
@@ -871,6 +873,168 @@ def validate_all_pages(pages: List[Dict[str, Any]], strict: bool = False) -> Dic
     return results
 
 
+# =============================================================================
+# RENDER-TIME VALIDATION
+# =============================================================================
+
+# Below this many words thin content is critical rather than a warning
+THIN_CONTENT_THRESHOLD = 150
+
+# Elements whose text is not page content
+_NON_CONTENT_BLOCK = re.compile(r'<(head|nav|footer|script|style)\b[^>]*>.*?</\1\s*>|<!--.*?-->',
+                                re.IGNORECASE | re.DOTALL)
+# A '<' not followed by a tag name (e.g. "<5%") is text, as in an HTML parser
+_TAG = re.compile(r'</?[A-Za-z][^>]*>|<[!?][^>]*>')
+
+_TITLE_TAG = re.compile(r'<title\b[^>]*>(.*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+_HEAD_TAG = re.compile(r'<(meta|link)\b([^>]*)>', re.IGNORECASE)
+_SCHEMA_SCRIPT = re.compile(r'<script\b[^>]*type=["\']application/ld\+json["\']', re.IGNORECASE)
+_ATTRIBUTE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+# Head facts recorded by get_html_head(), picked up when the page is written
+_page_heads = {}
+
+
+def record_page_head(page_path: str, title: str, description: str,
+                     has_og_tags: bool = True, has_twitter_card: bool = True):
+    """
+    Remember what a page's <head> declares, for validation when the page is written.
+
+    Args:
+        page_path: Path after the site root (e.g. 'salaries/prompt-engineer/')
+        title: Full <title> text
+        description: Meta description
+        has_og_tags: Whether og:title and og:description are set
+        has_twitter_card: Whether twitter:card is set
+    """
+    url_path = '/' + page_path.strip('/') + '/' if page_path.strip('/') else '/'
+    _page_heads[url_path] = {
+        'title': html_lib.unescape(title),
+        'description': html_lib.unescape(description),
+        'has_og_tags': has_og_tags,
+        'has_twitter_card': has_twitter_card,
+    }
+
+
+def head_facts_from_html(html: str) -> Dict[str, Any]:
+    """
+    What a page's <head> declares, read from the HTML (for pages whose head
+    wasn't built with record_page_head, e.g. hand-written ones).
+
+    Returns:
+        Dict in the form record_page_head() stores, plus has_canonical
+    """
+    end = html.lower().find('</head>')
+    head = html if end == -1 else html[:end]
+
+    title_match = _TITLE_TAG.search(head)
+    facts = {
+        'title': html_lib.unescape(title_match.group(1)) if title_match else '',
+        'description': '',
+        'has_og_tags': False,
+        'has_twitter_card': False,
+        'has_canonical': False,
+    }
+    og = set()
+    seen_description = False
+    for tag, attr_text in _HEAD_TAG.findall(head):
+        attrs = {name.lower(): html_lib.unescape(dq or sq) for name, dq, sq in _ATTRIBUTE.findall(attr_text)}
+        tag = tag.lower()
+        if tag == 'meta':
+            name = attrs.get('name')
+            if name == 'description' and not seen_description:
+                seen_description = True
+                facts['description'] = attrs.get('content', '')
+            elif name == 'twitter:card':
+                facts['has_twitter_card'] = True
+            if attrs.get('property') in ('og:title', 'og:description'):
+                og.add(attrs['property'])
+        elif tag == 'link' and 'canonical' in attrs.get('rel', '').split() and attrs.get('href'):
+            facts['has_canonical'] = True
+    facts['has_og_tags'] = len(og) == 2
+    return facts
+
+
+def count_content_words(html: str) -> int:
+    """Words of visible page content (head, nav, footer, scripts and styles excluded)."""
+    text = _NON_CONTENT_BLOCK.sub(' ', html)
+    text = _TAG.sub(' ', text)
+    return len(html_lib.unescape(text).split())
+
+
+def rendered_page_facts(url_path: str, html: str) -> Dict[str, Any]:
+    """
+    SEO facts of a page about to be written: head facts recorded at render time
+    plus the content word count and JSON-LD block count.
+
+    Returns:
+        Dict with title_length, description_length, word_count, schema_count,
+        has_og_tags, has_twitter_card and has_canonical
+    """
+    head = _page_heads.pop(url_path, None)
+    if head is None:
+        head = head_facts_from_html(html)
+    return {
+        'title_length': len(head['title']),
+        'description_length': len(head['description']),
+        'word_count': count_content_words(html),
+        'schema_count': len(_SCHEMA_SCRIPT.findall(html)),
+        'has_og_tags': head['has_og_tags'],
+        'has_twitter_card': head['has_twitter_card'],
+        'has_canonical': head.get('has_canonical', True),
+    }
+
+
+def validate_page_seo(facts: Dict[str, Any]) -> tuple:
+    """
+    Check a rendered page against the thresholds validate_seo.py enforces.
+
+    Args:
+        facts: Dict with title_length, description_length, word_count,
+            schema_count, has_og_tags, has_twitter_card and optionally
+            has_canonical (default True)
+
+    Returns:
+        (issues, warnings) lists of strings
+    """
+    issues = []
+    warnings = []
+
+    word_count = facts['word_count']
+    if word_count < MIN_WORD_COUNT:
+        severity = 'CRITICAL' if word_count < THIN_CONTENT_THRESHOLD else 'WARNING'
+        issues.append(f"[{severity}] Thin content: {word_count} words (minimum: {MIN_WORD_COUNT})")
+
+    title_length = facts['title_length']
+    if not title_length:
+        issues.append("[CRITICAL] Missing title tag")
+    elif title_length > MAX_TITLE_LENGTH:
+        warnings.append(f"Title too long: {title_length} chars (max: {MAX_TITLE_LENGTH})")
+    elif title_length < MIN_TITLE_LENGTH:
+        warnings.append(f"Title too short: {title_length} chars (min: {MIN_TITLE_LENGTH})")
+
+    description_length = facts['description_length']
+    if not description_length:
+        issues.append("[CRITICAL] Missing meta description")
+    elif description_length > MAX_DESCRIPTION_LENGTH:
+        warnings.append(f"Description too long: {description_length} chars")
+    elif description_length < MIN_DESCRIPTION_LENGTH:
+        warnings.append(f"Description too short: {description_length} chars")
+
+    if not facts.get('has_canonical', True):
+        issues.append("[CRITICAL] Missing canonical URL")
+
+    if facts['schema_count'] == 0:
+        warnings.append("No JSON-LD schema markup found")
+
+    if not facts['has_og_tags']:
+        warnings.append("Missing Open Graph tags")
+    if not facts['has_twitter_card']:
+        warnings.append("Missing Twitter Card tags")
+
+    return issues, warnings
+
+
 # =============================================================================
 # FAQ HTML GENERATOR
 # =============================================================================
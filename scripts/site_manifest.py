@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Build manifest of generated pages for AI Market Pulse.
+
+Generators save pages with write_page() instead of open(..., 'w'). Besides
+writing the file it records what the sitemap needs to know about the page,
+taken from the HTML already in memory:
+
+- url, sitemap category and robots directive
+- a content hash, and the date that hash last changed (the sitemap lastmod)
+- SEO facts for validate_seo.py --manifest (title/description length, word
+  count, schema count, OG/Twitter tags; see seo_core.rendered_page_facts)
+- the fingerprinted /assets stylesheets it links, so stylesheets no page
+  links any more can be removed after the build (prune_stylesheets)
+
+Records are appended to a journal per process (data/.site_manifest/<pid>.jsonl),
+so pages rendered in render_pool workers are captured too. generate_sitemap.py
+--manifest folds the journals into data/site_manifest.json and builds the
+sitemaps from it without opening a single page. A page rewritten with identical
+HTML keeps its lastmod.
+
+The file itself is written by site_writer.write_file: batched, skipped when
+unchanged, and redirected to site.staging/ during a staged build.
+
+Usage:
+    from site_manifest import write_page, flush_pages
+    write_page(f'{page_dir}/index.html', html)
+    flush_pages()  # at the end of the generator, so write errors fail it
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import datetime
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from seo_core import rendered_page_facts
+from site_writer import write_file, flush_pages
+
+DATA_DIR = 'data'
+SITE_DIR = 'site'
+MANIFEST_PATH = f'{DATA_DIR}/site_manifest.json'
+JOURNAL_DIR = f'{DATA_DIR}/.site_manifest'
+
+# The robots meta tag sits in <head>; no need to look further
+ROBOTS_SCAN_CHARS = 5000
+
+_ROBOTS_META = [
+    re.compile(r'<meta\s+name=["\']robots["\']\s+content=["\']([^"\']*)["\']', re.IGNORECASE),
+    re.compile(r'content=["\']([^"\']*)["\']\s+name=["\']robots["\']', re.IGNORECASE),
+]
+
+# Journal file of this process (reopened after a fork)
+_journal = None
+_journal_pid = None
+
+# <link> to a stylesheet under /assets (see templates.get_stylesheet_link)
+_STYLESHEET_LINK = re.compile(r'href="(/assets/[^"]+\.css)"')
+# Fingerprinted stylesheet file: <name>.<10 hex digits>.css
+_FINGERPRINTED_CSS = re.compile(r'.+\.[0-9a-f]{10}\.css')
+
+SECTION_PAGES = ['/jobs/', '/salaries/', '/insights/', '/tools/', '/companies/', '/about/', '/join/']
+
+
+def categorize_url(url_path):
+    """Categorize a URL into its sitemap category."""
+    if url_path == '/':
+        return 'main'
+    elif url_path in SECTION_PAGES:
+        return 'main'
+    elif '/salaries/' in url_path:
+        return 'salaries'
+    elif '/tools/' in url_path:
+        return 'tools'
+    elif '/jobs/' in url_path:
+        return 'jobs'
+    elif '/companies/' in url_path:
+        return 'companies'
+    elif '/insights/' in url_path:
+        return 'insights'
+    else:
+        return 'main'
+
+
+def url_for_path(rel_path):
+    """URL path of an HTML file given relative to site/ (about/index.html -> /about/)."""
+    rel_path = rel_path.replace(os.sep, '/')
+    if rel_path == 'index.html':
+        url_path = '/'
+    elif rel_path.endswith('/index.html'):
+        url_path = '/' + rel_path[:-10]
+    else:
+        url_path = '/' + rel_path.replace('.html', '/')
+
+    url_path = url_path.replace('//', '/')
+    if not url_path.endswith('/') and url_path != '/':
+        url_path += '/'
+    return url_path
+
+
+def robots_directive(html):
+    """Content of the page's robots meta tag ('index, follow' if it has none)."""
+    head = html[:ROBOTS_SCAN_CHARS]
+    for pattern in _ROBOTS_META:
+        match = pattern.search(head)
+        if match:
+            return match.group(1).strip()
+    return 'index, follow'
+
+
+def is_noindex(robots):
+    return 'noindex' in robots.lower()
+
+
+def content_hash(html):
+    return hashlib.md5(html.encode('utf-8')).hexdigest()[:12]
+
+
+def page_record(filepath, html, site_dir=SITE_DIR):
+    """Manifest record for a page about to be written to filepath, or None if it's outside site/."""
+    rel_path = os.path.relpath(filepath, site_dir)
+    if rel_path.startswith('..') or not rel_path.endswith('.html'):
+        return None
+    url_path = url_for_path(rel_path)
+    return {
+        'url': url_path,
+        'category': categorize_url(url_path),
+        'robots': robots_directive(html),
+        'hash': content_hash(html),
+        'date': datetime.now().strftime('%Y-%m-%d'),
+        'seo': rendered_page_facts(url_path, html),
+        'stylesheets': sorted(set(_STYLESHEET_LINK.findall(html))),
+    }
+
+
+def _journal_file():
+    global _journal, _journal_pid
+    if _journal is None or _journal_pid != os.getpid():
+        os.makedirs(JOURNAL_DIR, exist_ok=True)
+        # Line buffered: forked workers exit without flushing open files
+        _journal = open(os.path.join(JOURNAL_DIR, f'{os.getpid()}.jsonl'), 'a', buffering=1)
+        _journal_pid = os.getpid()
+    return _journal
+
+
+def record_page(filepath, html):
+    """Add a page to the build manifest journal."""
+    record = page_record(filepath, html)
+    if record is not None:
+        _journal_file().write(json.dumps(record) + '\n')
+
+
+def write_page(filepath, html):
+    """Write a generated page (batched, see site_writer.py) and record it in the build manifest."""
+    write_file(filepath, html)
+    record_page(filepath, html)
+
+
+def apply_record(pages, record):
+    """Merge one page record into the manifest; lastmod only moves when the hash changes."""
+    previous = pages.get(record['url'])
+    lastmod = record['date']
+    if previous is not None and previous.get('hash') == record['hash']:
+        lastmod = previous.get('lastmod', lastmod)
+    pages[record['url']] = {
+        'category': record['category'],
+        'robots': record['robots'],
+        'hash': record['hash'],
+        'lastmod': lastmod,
+        'seo': record.get('seo'),
+        'stylesheets': record.get('stylesheets'),
+    }
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Pages of the saved manifest ({url: entry}), or None if there is none."""
+    try:
+        with open(path) as f:
+            return json.load(f).get('pages', {})
+    except (OSError, ValueError):
+        return None
+
+
+def journal_files():
+    """Pending journals, oldest first."""
+    return sorted(glob.glob(os.path.join(JOURNAL_DIR, '*.jsonl')), key=os.path.getmtime)
+
+
+def merge_journals(pages):
+    """Fold pending journal records into pages. Returns (records merged, journal files)."""
+    files = journal_files()
+    merged = 0
+    for journal in files:
+        with open(journal) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A worker killed mid-write leaves a partial last line
+                    continue
+                apply_record(pages, record)
+                merged += 1
+    return merged, files
+
+
+def save_manifest(pages, path=MANIFEST_PATH, journals=()):
+    """Write the manifest, then drop the journals it now contains."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({'generated': datetime.now().strftime('%Y-%m-%d'),
+                   'pages': dict(sorted(pages.items()))}, f, indent=1)
+    os.replace(tmp_path, path)
+    for journal in journals:
+        try:
+            os.remove(journal)
+        except OSError:
+            pass
+
+
+def prune_stylesheets(pages, site_dir=SITE_DIR):
+    """Delete fingerprinted stylesheets in site_dir/assets/ that no page in the manifest links.
+
+    Run after a build, never during one: a page that was not re-rendered
+    (skipped generator, incremental run) keeps its old record, and with it
+    the stylesheet it links. Returns the number of files removed, or None if
+    some page was recorded before stylesheets were tracked (nothing is
+    removed until a --rescan has recorded them all).
+    """
+    referenced = set()
+    for page in pages.values():
+        if page.get('stylesheets') is None:
+            return None
+        referenced.update(os.path.basename(href) for href in page['stylesheets'])
+
+    assets_dir = os.path.join(site_dir, 'assets')
+    removed = 0
+    for filename in os.listdir(assets_dir) if os.path.isdir(assets_dir) else []:
+        if _FINGERPRINTED_CSS.fullmatch(filename) and filename not in referenced:
+            os.remove(os.path.join(assets_dir, filename))
+            removed += 1
+    return removed
+
+
+def scan_site(pages, site_dir=SITE_DIR):
+    """Record every HTML page under site_dir and drop manifest entries with no file.
+
+    This is the slow path: it seeds the manifest with hand-written pages
+    (about/, privacy/, ...) and catches pages deleted by hand.
+
+    Returns the number of pages recorded.
+    """
+    seen = set()
+    for root, dirs, files in os.walk(site_dir):
+        if 'sitemaps' in root:
+            continue
+        for file in files:
+            if not file.endswith('.html'):
+                continue
+            filepath = os.path.join(root, file)
+            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                html = f.read()
+            record = page_record(filepath, html, site_dir)
+            if record is None:
+                continue
+            mtime = os.path.getmtime(filepath)
+            record['date'] = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d')
+            apply_record(pages, record)
+            seen.add(record['url'])
+    for url in set(pages) - seen:
+        del pages[url]
+    return len(seen)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Batched page writer and staged site builds for AI Market Pulse.
+
+site_manifest.write_page() hands every rendered page to write_file(). Pages
+are buffered and written in batches by a thread pool:
+
+- a page whose bytes already match the file on disk is not rewritten, so its
+  mtime stays put and unchanged pages don't churn the deploy
+- each file is written to a temp name and renamed into place, so a reader
+  never sees a half-written page
+- pool workers (render_pool) write synchronously; their buffers would not
+  survive the worker exiting
+- generators call flush_pages() when they are done, so a failed write raises
+  and fails the step; pages still buffered at exit are flushed by an atexit
+  handler that exits with status 1 if the write fails
+
+Staged builds
+-------------
+By default pages go straight into site/. Between `begin` and `commit` they go
+to site.staging/ instead, a hard-linked clone of site/ made by `begin`, and
+`commit` swaps the finished tree into place in one rename. `commit` does not
+know whether the generators succeeded: the caller runs it only if all of them
+did, and `abort` (which drops the staging tree) otherwise, so a build that
+fails half-way leaves site/ exactly as it was. The workflow checks the
+outcome of each generator step before choosing.
+
+Files written into site/ by other means during a staged build (the charts
+of generate_graphs.py) are carried over at commit: the newer of the live and staged
+copy wins. Files deleted from site/ during the build are not.
+
+Usage:
+    python scripts/site_writer.py begin
+    python scripts/generate_homepage.py  # ... and the other generators
+    python scripts/site_writer.py commit  # or: abort
+"""
+
+import argparse
+import atexit
+import ctypes
+import multiprocessing
+import os
+import shutil
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+SITE_DIR = 'site'
+STAGING_DIR = f'{SITE_DIR}.staging'
+BUILD_MARKER = '.build-started'
+
+# Pages buffered before a batch is written
+BATCH_SIZE = 256
+WRITE_THREADS = 8
+
+# path -> bytes waiting to be written by this process
+_pending = {}
+_pending_pid = None
+_staging = None
+
+
+def staging_active(staging_dir=STAGING_DIR):
+    """True while a staged build is in progress."""
+    return os.path.exists(os.path.join(staging_dir, BUILD_MARKER))
+
+
+def _target_path(filepath):
+    """Where a file for filepath is written: under site.staging/ during a staged build."""
+    global _staging
+    if _staging is None:
+        _staging = staging_active()
+    if not _staging:
+        return filepath
+    rel_path = os.path.relpath(os.path.abspath(filepath), os.path.abspath(SITE_DIR))
+    if rel_path.startswith('..'):
+        return filepath
+    return os.path.join(STAGING_DIR, rel_path)
+
+
+def _write_if_changed(path, data):
+    """Write data to path unless the file already holds exactly these bytes. Returns True if written."""
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    # Renaming over the old file also breaks its hard link to the live site
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def flush_pages(parallel=True):
+    """Write all buffered pages of this process.
+
+    The exit-time flush is sequential: no new threads can be started once the
+    interpreter is shutting down.
+    """
+    if not _pending:
+        return
+    batch = list(_pending.items())
+    _pending.clear()
+    if not parallel:
+        for path, data in batch:
+            _write_if_changed(path, data)
+        return
+    with ThreadPoolExecutor(max_workers=WRITE_THREADS) as executor:
+        # list() re-raises the first write error here
+        list(executor.map(lambda item: _write_if_changed(*item), batch))
+
+
+def _flush_at_exit():
+    """Safety net for pages still buffered at exit; generators call flush_pages() themselves.
+
+    An exception in an atexit callback is only printed and the process still
+    exits 0, so a failed write ends the process with status 1 instead.
+    """
+    try:
+        flush_pages(parallel=False)
+    except Exception as e:
+        print(f"ERROR: writing buffered pages failed: {e}", file=sys.stderr)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
+
+
+def write_file(filepath, content):
+    """Queue a page for writing (see module docstring)."""
+    global _pending_pid
+    path = _target_path(filepath)
+    data = content.encode('utf-8')
+
+    if multiprocessing.parent_process() is not None:
+        _write_if_changed(path, data)
+        return
+
+    if _pending_pid != os.getpid():
+        _pending.clear()
+        _pending_pid = os.getpid()
+        atexit.register(_flush_at_exit)
+    _pending[path] = data
+    if len(_pending) >= BATCH_SIZE:
+        flush_pages()
+
+
+# =============================================================================
+# STAGED BUILDS
+# =============================================================================
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def clone_tree(src_dir, dst_dir):
+    """Copy src_dir to dst_dir with hard links (no file data is copied). Returns the file count."""
+    count = 0
+    for root, dirs, files in os.walk(src_dir):
+        target_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        os.makedirs(target_root, exist_ok=True)
+        for name in files:
+            _link_or_copy(os.path.join(root, name), os.path.join(target_root, name))
+            count += 1
+    return count
+
+
+def carry_over_changes(live_dir, staging_dir, since):
+    """Bring files changed in live_dir after `since` (epoch seconds) into staging_dir.
+
+    A live file replaces the staged one when it is newer, unless both are the
+    same file already (hard link modified in place). Returns the file count.
+    """
+    count = 0
+    for root, dirs, files in os.walk(live_dir):
+        target_root = os.path.join(staging_dir, os.path.relpath(root, live_dir))
+        for name in files:
+            live_path = os.path.join(root, name)
+            live_stat = os.stat(live_path)
+            if live_stat.st_mtime < since:
+                continue
+            staged_path = os.path.join(target_root, name)
+            try:
+                staged_stat = os.stat(staged_path)
+                if os.path.samestat(live_stat, staged_stat) or staged_stat.st_mtime >= live_stat.st_mtime:
+                    continue
+                os.remove(staged_path)
+            except FileNotFoundError:
+                os.makedirs(target_root, exist_ok=True)
+            _link_or_copy(live_path, staged_path)
+            count += 1
+    return count
+
+
+def exchange_dirs(a, b):
+    """Swap two directories in one atomic rename where the OS supports it (Linux renameat2)."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        renameat2 = None
+    if renameat2 is not None:
+        AT_FDCWD = -100
+        RENAME_EXCHANGE = 2
+        if renameat2(AT_FDCWD, os.fsencode(a), AT_FDCWD, os.fsencode(b), RENAME_EXCHANGE) == 0:
+            return
+    # Fallback: two renames, with a brief window where `a` does not exist
+    tmp = f'{a}.swap'
+    os.rename(a, tmp)
+    os.rename(b, a)
+    os.rename(tmp, b)
+
+
+def begin_build(site_dir=SITE_DIR, staging_dir=STAGING_DIR):
+    """Start a staged build. Returns False if one is already in progress."""
+    if os.path.exists(staging_dir):
+        return False
+    os.makedirs(site_dir, exist_ok=True)
+    started = time.time()
+    tmp_dir = f'{staging_dir}.tmp'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    count = clone_tree(site_dir, tmp_dir)
+    with open(os.path.join(tmp_dir, BUILD_MARKER), 'w') as f:
+        f.write(str(started))
+    os.rename(tmp_dir, staging_dir)
+    print(f"  Staged {count} files in {staging_dir}/")
+    return True
+
+
+def commit_build(site_dir=SITE_DIR, staging_dir=STAGING_DIR):
+    """Swap the staged tree into place. Returns False if no build is in progress."""
+    marker = os.path.join(staging_dir, BUILD_MARKER)
+    try:
+        with open(marker) as f:
+            started = float(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return False
+    carried = carry_over_changes(site_dir, staging_dir, started)
+    print(f"  Carried over {carried} files written to {site_dir}/ during the build")
+    os.remove(marker)
+    exchange_dirs(site_dir, staging_dir)
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    print(f"  Swapped {staging_dir}/ into {site_dir}/")
+    return True
+
+
+def abort_build(staging_dir=STAGING_DIR):
+    """Drop a staged build, leaving the live site untouched."""
+    if not os.path.exists(staging_dir):
+        return False
+    try:
+        with open(os.path.join(staging_dir, BUILD_MARKER)) as f:
+            started = float(f.read().strip() or 0)
+    except (OSError, ValueError):
+        started = 0
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    # Journals written during the build describe pages that were just thrown away
+    from site_manifest import journal_files
+    for journal in journal_files():
+        if os.path.getmtime(journal) >= started:
+            os.remove(journal)
+    print(f"  Removed {staging_dir}/")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stage a site build and swap it into place')
+    parser.add_argument('command', choices=['begin', 'commit', 'abort', 'status'])
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"  AI MARKET PULSE - SITE BUILD: {args.command.upper()}")
+    print("=" * 70)
+
+    if args.command == 'begin':
+        if not begin_build():
+            print(f"  ERROR: {STAGING_DIR}/ already exists; commit or abort the previous build first")
+            return 1
+    elif args.command == 'commit':
+        if not commit_build():
+            print(f"  ERROR: no staged build in progress ({STAGING_DIR}/{BUILD_MARKER} not found)")
+            return 1
+    elif args.command == 'abort':
+        if not abort_build():
+            print("  No staged build to abort")
+    else:
+        print(f"  Staged build in progress: {'yes' if staging_active() else 'no'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
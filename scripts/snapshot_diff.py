@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Diff two enriched job snapshots (data/ai_jobs_YYYYMMDD.csv) for AI Market Pulse.
+
+Jobs are matched on their URL (job_url_direct, else source_url) with a hash
+join. Only the key and the DIFF_FIELDS columns are read (through the columnar
+cache in job_data.py), and each row is reduced to one 64-bit hash of those
+fields, so a changed job is one whose hash differs.
+
+The result is saved as a sidecar next to the newer snapshot
+(ai_jobs_YYYYMMDD.diff.json):
+
+- old/new: file name, size, mtime, content digest, row count and a
+  fingerprint of the hashed rows (same fingerprint = same jobs, fields and
+  order)
+- added/removed/changed/unchanged: number of jobs (by URL)
+- by_category/by_metro: jobs per value in each snapshot, with the delta
+
+Only counts are kept (not the URLs), so the sidecar stays small in git.
+
+The sidecar is reused as long as both snapshots match what it recorded: same
+size and mtime, or (after a git checkout resets mtimes) the same digest.
+
+Usage:
+    python scripts/snapshot_diff.py                  # latest vs previous snapshot
+    python scripts/snapshot_diff.py --new B.csv      # B vs the snapshot before it
+    python scripts/snapshot_diff.py --old A.csv --new B.csv
+
+    from snapshot_diff import load_snapshot_diff
+    diff = load_snapshot_diff()                      # None with fewer than two snapshots
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from job_data import (
+    DATA_DIR, latest_jobs_file, previous_jobs_file, load_jobs, file_stamp, stamp_matches, refresh_stamp,
+    save_sidecar,
+)
+
+KEY_COLUMNS = ['job_url_direct', 'source_url']
+
+# A job counts as changed when any of these differ. Covers every field a job
+# page is rendered from (generate_job_pages.JOB_PAGE_FIELDS).
+DIFF_FIELDS = [
+    'company', 'company_name', 'title', 'location', 'metro', 'remote_type', 'is_remote',
+    'salary_min', 'salary_max', 'min_amount', 'max_amount', 'job_category', 'seniority',
+    'experience_level', 'skills_tags', 'date_posted',
+]
+
+BREAKDOWN_COLUMNS = {'by_category': 'job_category', 'by_metro': 'metro'}
+
+# Bump when the sidecar layout changes; older sidecars are recomputed
+SIDECAR_VERSION = 2
+
+
+def sidecar_path(new_path):
+    return f'{os.path.splitext(new_path)[0]}.diff.json'
+
+
+def _snapshot_entry(path, jobs, fingerprint):
+    return {**file_stamp(path), 'jobs': jobs, 'fingerprint': fingerprint}
+
+
+def _snapshot_keys(path, data_dir):
+    """Key (URL), row hash and breakdown columns of one snapshot."""
+    df = load_jobs(path, columns=KEY_COLUMNS + DIFF_FIELDS, data_dir=data_dir)
+    key_col = next((c for c in KEY_COLUMNS if c in df.columns), None)
+    fields = [c for c in DIFF_FIELDS if c in df.columns]
+    hashes = pd.util.hash_pandas_object(df[fields].astype(str), index=False).to_numpy(np.uint64)
+
+    fingerprint = hashlib.md5(json.dumps(fields).encode())
+    fingerprint.update(hashes.tobytes())
+    if key_col:
+        fingerprint.update(pd.util.hash_pandas_object(df[key_col].astype(str), index=False).to_numpy().tobytes())
+
+    keyed = pd.DataFrame({
+        'key': df[key_col] if key_col else pd.Series(pd.NA, index=df.index, dtype=object),
+        'hash': hashes,
+    })
+    for column in BREAKDOWN_COLUMNS.values():
+        keyed[column] = df[column] if column in df.columns else pd.NA
+    return keyed, fingerprint.hexdigest()
+
+
+def _breakdown(old, new, column):
+    """{value: {'old': n, 'new': n, 'delta': n}}, largest current count first."""
+    old_counts = old[column].value_counts()
+    new_counts = new[column].value_counts()
+    counts = pd.DataFrame({'old': old_counts, 'new': new_counts}).fillna(0).astype(int)
+    counts['delta'] = counts['new'] - counts['old']
+    counts = counts.sort_values(['new', 'old'], ascending=False, kind='stable')
+    return {str(value): {name: int(n) for name, n in row.items()} for value, row in counts.to_dict('index').items()}
+
+
+def diff_snapshots(old_path, new_path, data_dir=DATA_DIR):
+    """Diff two snapshots (see module docstring for the result)."""
+    old, old_fingerprint = _snapshot_keys(old_path, data_dir)
+    new, new_fingerprint = _snapshot_keys(new_path, data_dir)
+
+    # Hash join on URL; a URL listed twice is represented by its last row
+    old_by_key = old.dropna(subset=['key']).drop_duplicates('key', keep='last').set_index('key')['hash']
+    new_by_key = new.dropna(subset=['key']).drop_duplicates('key', keep='last').set_index('key')['hash']
+    joined = pd.concat([old_by_key.rename('old'), new_by_key.rename('new')], axis=1, join='outer')
+
+    both = joined.dropna()
+    changed = int((both['old'] != both['new']).sum())
+
+    return {
+        'version': SIDECAR_VERSION,
+        'generated': datetime.now().strftime('%Y-%m-%d'),
+        'old': _snapshot_entry(old_path, len(old), old_fingerprint),
+        'new': _snapshot_entry(new_path, len(new), new_fingerprint),
+        'added': int(joined['old'].isna().sum()),
+        'removed': int(joined['new'].isna().sum()),
+        'changed': changed,
+        'unchanged': int(len(both) - changed),
+        **{name: _breakdown(old, new, column) for name, column in BREAKDOWN_COLUMNS.items()},
+    }
+
+
+def load_snapshot_diff(new_path=None, old_path=None, data_dir=DATA_DIR):
+    """Diff of new_path (default: the latest snapshot) against old_path (default: the one before new_path).
+
+    Read from the sidecar when it matches both files, otherwise computed and
+    saved. Returns None if there are not two snapshots to compare.
+    """
+    new_path = new_path or latest_jobs_file(data_dir)
+    old_path = old_path or (previous_jobs_file(data_dir, new_path) if new_path else None)
+    if not new_path or not old_path:
+        return None
+
+    path = sidecar_path(new_path)
+    try:
+        with open(path) as f:
+            diff = json.load(f)
+        if (diff.get('version') == SIDECAR_VERSION
+                and stamp_matches(diff['old'], old_path) and stamp_matches(diff['new'], new_path)):
+            # Bitwise-or so both stamps are refreshed
+            if refresh_stamp(diff['old'], old_path) | refresh_stamp(diff['new'], new_path):
+                save_sidecar(path, diff)
+            return diff
+    except (OSError, ValueError, KeyError):
+        pass
+
+    diff = diff_snapshots(old_path, new_path, data_dir)
+    save_sidecar(path, diff)
+    return diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Diff two enriched job snapshots')
+    parser.add_argument('--old', help='Older snapshot (default: the one before --new)')
+    parser.add_argument('--new', help='Newer snapshot (default: the latest)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  AI MARKET PULSE - SNAPSHOT DIFF")
+    print("=" * 70)
+
+    new_path = args.new or latest_jobs_file(DATA_DIR)
+    diff = load_snapshot_diff(new_path, args.old)
+    if diff is None:
+        print("\n Need two snapshots to compare")
+        return 0
+
+    print(f"\n {diff['old']['file']} ({diff['old']['jobs']} jobs) -> {diff['new']['file']} ({diff['new']['jobs']} jobs)")
+    print(f"   Added: {diff['added']}, removed: {diff['removed']}, "
+          f"changed: {diff['changed']}, unchanged: {diff['unchanged']}")
+    print("\n Biggest category moves:")
+    moves = sorted(diff['by_category'].items(), key=lambda item: -abs(item[1]['delta']))[:5]
+    for category, counts in moves:
+        print(f"   {category}: {counts['old']} -> {counts['new']} ({counts['delta']:+d})")
+    print(f"\n Saved {sidecar_path(new_path)}")
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
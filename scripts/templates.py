@@ -8,7 +8,10 @@ multiple page generators to eliminate duplication and centralize maintenance.
 Design System: Dark teal + gold accent theme
 """
 
+import functools
+import hashlib
 import re
+import string
 import pandas as pd
 import sys
 import os
@@ -33,6 +36,7 @@ try:
         auto_link_content,
         get_related_pages,
         validate_page_content,
+        record_page_head,
         generate_faq_html,
         CSS_FAQ_SECTION,
     )
@@ -40,6 +44,8 @@ try:
 except ImportError:
     SEO_CORE_AVAILABLE = False
 
+from site_writer import write_file
+
 try:
     from nav_config import NAV_ITEMS, FOOTER_ITEMS, FOOTER_LEGAL_ITEMS, SUBSCRIBE_LINK, SUBSCRIBE_LABEL, NEWSLETTER_LINK, NEWSLETTER_LABEL, SITE_NAME, COPYRIGHT_YEAR
 except Exception as e:
@@ -67,6 +73,10 @@ except Exception as e:
 # SEO: Canonical domain
 BASE_URL = 'https://theaimarketpulse.com'
 
+# Fingerprinted stylesheets (see get_stylesheet_link)
+ASSETS_DIR = 'site/assets'
+ASSETS_URL = '/assets'
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -816,54 +826,108 @@ CSS_JOB_PAGE = '''
 '''
 
 
+def minify_css(css):
+    """Drop comments and the indentation of the CSS constants"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', css).strip()
+
+
+# Styles for the header and page frame, inlined in every page
+CSS_CRITICAL = minify_css(CSS_VARIABLES + CSS_NAV + CSS_LAYOUT)
+
+@functools.lru_cache(maxsize=None)
+def get_stylesheet_href(name, css):
+    """Write css to site/assets/<name>.<hash>.css (once per content) and return its URL.
+
+    The hash is of the content, so browsers can cache the file forever and a
+    CSS change gets a new URL. Cached per process, so the CSS is minified and
+    hashed once per run rather than once per page. Written through
+    site_writer like the pages, so it lands in site.staging/ during a staged
+    build and an unchanged file is not rewritten. Old fingerprints are left
+    for pages that still link them; generate_sitemap.py --manifest removes
+    the ones no page in the build manifest references.
+    """
+    css = minify_css(css)
+    filename = f"{name}.{hashlib.md5(css.encode('utf-8')).hexdigest()[:10]}.css"
+    write_file(os.path.join(ASSETS_DIR, filename), css)
+    return f'{ASSETS_URL}/{filename}'
+
+
+def get_stylesheet_link(name, css):
+    """<link> to a fingerprinted stylesheet (see get_stylesheet_href).
+
+    Render-blocking on purpose: the sheet styles above-the-fold content (job
+    details, cards), and it is cached forever, so only the first visit waits.
+    """
+    return f'<link rel="stylesheet" href="{get_stylesheet_href(name, css)}">'
+
+
+@functools.lru_cache(maxsize=None)
 def get_base_styles():
-    """Get all base CSS styles"""
+    """Get base CSS: critical styles inline, the rest as the shared site stylesheet"""
     faq_css = CSS_FAQ_SECTION if SEO_CORE_AVAILABLE else ''
+    site_css = CSS_CARDS + CSS_CTA + CSS_FOOTER + CSS_JOB_PAGE + faq_css
     return f'''
-    <style>
-        {CSS_VARIABLES}
-        {CSS_NAV}
-        {CSS_LAYOUT}
-        {CSS_CARDS}
-        {CSS_CTA}
-        {CSS_FOOTER}
-        {CSS_JOB_PAGE}
-        {faq_css}
-    </style>
+    <style>{CSS_CRITICAL}</style>
+    {get_stylesheet_link('site', site_css)}
 '''
 
 
 # =============================================================================
-# HTML GENERATORS
+# PRECOMPILED PAGE TEMPLATES
 # =============================================================================
+# The shared page frame (head, nav, footer, CTA) is the same on thousands of
+# pages. Static fragments are built once per run and cached; the head, which
+# varies per page, is split once into static chunks and slots so rendering a
+# page is a single join.
 
-def get_html_head(title, description, page_path, include_styles=True, extra_head='', robots='index, follow'):
-    """Generate SEO-compliant head section with Core Web Vitals optimizations.
-
-    Args:
-        title: Page title
-        description: Meta description
-        page_path: Path after BASE_URL (e.g., 'salaries/prompt-engineer/')
-        include_styles: Whether to include base CSS styles
-        extra_head: Additional content to include in <head>
-        robots: Robots meta tag content (default: 'index, follow')
+def compile_template(template, **static):
+    """Split a str.format-style template into static chunks and named slots.
 
-    Core Web Vitals optimizations:
-        - Preconnect to font origins before font request
-        - font-display: swap to prevent FOIT (invisible text)
-        - Deferred analytics to not block rendering
-        - Inline critical CSS to avoid render-blocking
+    Fields given in `static` are filled in now and become part of the chunks.
+    '{{' and '}}' are literal braces, as in an f-string.
 
-    International SEO:
-        - hreflang tags for language/region targeting
-        - x-default for default version
+    Returns:
+        (parts, slots): parts is the list of chunks with None at each slot,
+        slots is a list of (position in parts, field name)
     """
-    styles = get_base_styles() if include_styles else ''
-
-    # Construct full canonical URL
-    canonical_url = f"{BASE_URL}/{page_path}"
-
-    return f'''<!DOCTYPE html>
+    parts = []
+    slots = []
+    literal = []
+    for text, field, spec, conversion in string.Formatter().parse(template):
+        literal.append(text)
+        if field is None:
+            continue
+        if spec or conversion:
+            raise ValueError(f"Unsupported format spec in template field '{field}'")
+        if field in static:
+            literal.append(str(static[field]))
+            continue
+        parts.append(''.join(literal))
+        literal = []
+        slots.append((len(parts), field))
+        parts.append(None)
+    parts.append(''.join(literal))
+    return parts, slots
+
+
+def render_template(compiled, **fields):
+    """Fill the slots of a compiled template and join it into one string."""
+    parts, slots = compiled
+    buffer = parts.copy()
+    for position, field in slots:
+        buffer[position] = fields[field]
+    return ''.join(buffer)
+
+
+def clear_template_cache():
+    """Forget the cached fragments (e.g. after changing nav_config in-process)."""
+    for fragment in (get_nav_html, get_footer_html, get_cta_box, get_base_styles, get_stylesheet_href):
+        fragment.cache_clear()
+
+
+_HEAD_TEMPLATE = compile_template('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -918,9 +982,52 @@ def get_html_head(title, description, page_path, include_styles=True, extra_head
         gtag('config', 'G-1E2SX5J91V');
     </script>
 </head>
-'''
+''', SITE_NAME=SITE_NAME, BASE_URL=BASE_URL)
+
+
+# =============================================================================
+# HTML GENERATORS
+# =============================================================================
+
+def get_html_head(title, description, page_path, include_styles=True, extra_head='', robots='index, follow'):
+    """Generate SEO-compliant head section with Core Web Vitals optimizations.
+
+    Args:
+        title: Page title
+        description: Meta description
+        page_path: Path after BASE_URL (e.g., 'salaries/prompt-engineer/')
+        include_styles: Whether to include base CSS styles
+        extra_head: Additional content to include in <head>
+        robots: Robots meta tag content (default: 'index, follow')
+
+    Core Web Vitals optimizations:
+        - Preconnect to font origins before font request
+        - font-display: swap to prevent FOIT (invisible text)
+        - Deferred analytics to not block rendering
+        - Inline critical CSS; shared CSS is a cached, fingerprinted /assets file
+          loaded with a plain (render-blocking) <link>, so nothing paints unstyled
+
+    International SEO:
+        - hreflang tags for language/region targeting
+        - x-default for default version
+
+    Rendered from _HEAD_TEMPLATE, which is compiled once at import.
+    """
+    styles = get_base_styles() if include_styles else ''
+
+    # Construct full canonical URL
+    canonical_url = f"{BASE_URL}/{page_path}"
+
+    # Checked against SEO thresholds when the page is written (see site_manifest.write_page)
+    if SEO_CORE_AVAILABLE:
+        record_page_head(page_path, f"{title} | {SITE_NAME}", description)
+
+    return render_template(_HEAD_TEMPLATE, title=title, description=description,
+                           canonical_url=canonical_url, robots=robots,
+                           styles=styles, extra_head=extra_head)
 
 
+@functools.lru_cache(maxsize=None)
 def get_nav_html(active_page=None):
     """Generate site navigation including mobile nav and JS.
 
@@ -1000,6 +1107,7 @@ def get_nav_html(active_page=None):
 '''
 
 
+@functools.lru_cache(maxsize=None)
 def get_footer_html():
     """Generate site footer.
 
@@ -1034,6 +1142,7 @@ def get_footer_html():
 '''
 
 
+@functools.lru_cache(maxsize=None)
 def get_cta_box(title="Join the AI Community",
                 description="Connect with prompt engineers and AI professionals. Get job alerts, salary insights, and market intelligence.",
                 button_text="Join Community",
@@ -5,39 +5,56 @@ SEO Content Validation Script
 Scans generated pages to identify thin content and SEO issues
 that could cause Google to flag the site for spamming.
 
+--fast swaps BeautifulSoup for a streaming pass with the stdlib HTMLParser
+(no tree is built), --jobs N spreads pages over a process pool, and results
+are cached per file in data/.seo_cache.json keyed by content hash, so pages
+that haven't changed since the last run are not parsed again.
+
+--manifest skips HTML entirely: generators record each page's SEO facts when
+they write it (seo_core.rendered_page_facts via site_manifest.write_page), and
+the report is built from data/site_manifest.json plus pending journals.
+
 Usage:
     python scripts/validate_seo.py [--fix]
+    python scripts/validate_seo.py --fast --jobs 4
+    python scripts/validate_seo.py --no-cache
+    python scripts/validate_seo.py --manifest
 """
 
+import argparse
+import hashlib
+import json
 import os
 import re
 import sys
 import glob
 from collections import defaultdict
-from bs4 import BeautifulSoup
+from html.parser import HTMLParser
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
 
 # Add scripts directory to path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
-SITE_DIR = 'site'
-
-# Validation thresholds
-MIN_WORD_COUNT = 250
-MIN_TITLE_LENGTH = 20
-MAX_TITLE_LENGTH = 70
-MIN_DESCRIPTION_LENGTH = 50
-MAX_DESCRIPTION_LENGTH = 160
+from render_pool import render_pages, resolve_jobs
+from seo_core import validate_page_seo, MIN_WORD_COUNT
+from site_manifest import load_manifest, merge_journals, MANIFEST_PATH
 
-# Pages that should have noindex if thin
-THIN_CONTENT_THRESHOLD = 150  # words
+SITE_DIR = 'site'
+DATA_DIR = 'data'
+RESULT_CACHE_PATH = f'{DATA_DIR}/.seo_cache.json'
 
 
-def extract_page_data(html_path):
+def extract_page_data(html_path, content=None):
     """Extract SEO-relevant data from an HTML file"""
     try:
-        with open(html_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if content is None:
+            with open(html_path, 'r', encoding='utf-8') as f:
+                content = f.read()
 
         soup = BeautifulSoup(content, 'html.parser')
 
@@ -75,15 +92,7 @@ def extract_page_data(html_path):
             except:
                 pass
 
-        # Get main content word count (excluding nav, footer, scripts, styles)
-        for tag in soup.find_all(['nav', 'footer', 'script', 'style', 'head']):
-            tag.decompose()
-
-        text = soup.get_text(separator=' ', strip=True)
-        text = re.sub(r'\s+', ' ', text)
-        word_count = len(text.split())
-
-        # Check for OG tags
+        # Check for OG tags (before <head> is removed below)
         og_title = soup.find('meta', attrs={'property': 'og:title'})
         og_desc = soup.find('meta', attrs={'property': 'og:description'})
         has_og_tags = bool(og_title and og_desc)
@@ -92,6 +101,14 @@ def extract_page_data(html_path):
         tw_card = soup.find('meta', attrs={'name': 'twitter:card'})
         has_twitter_card = bool(tw_card)
 
+        # Get main content word count (excluding nav, footer, scripts, styles)
+        for tag in soup.find_all(['nav', 'footer', 'script', 'style', 'head']):
+            tag.decompose()
+
+        text = soup.get_text(separator=' ', strip=True)
+        text = re.sub(r'\s+', ' ', text)
+        word_count = len(text.split())
+
         return {
             'path': html_path,
             'title': title,
@@ -110,6 +127,225 @@ def extract_page_data(html_path):
         return {'path': html_path, 'error': str(e)}
 
 
+# Elements whose text is not page content
+NON_CONTENT_TAGS = {'nav', 'footer', 'script', 'style', 'head'}
+
+# Tags BeautifulSoup closes immediately (they never contain text)
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link',
+             'menuitem', 'meta', 'param', 'source', 'track', 'wbr', 'basefont', 'bgsound',
+             'command', 'frame', 'image', 'isindex', 'nextid', 'spacer'}
+
+
+class PageDataParser(HTMLParser):
+    """Single streaming pass collecting what extract_page_data reads from the soup.
+
+    Keeps only a stack of open tag names, closed the way BeautifulSoup's
+    html.parser builder closes them, so word counts and first-match lookups
+    agree with the BeautifulSoup path.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.non_content_depth = 0
+        self.word_count = 0
+        self.text_parts = []
+        self.title = None
+        self.title_parts = None
+        self.description = None
+        self.canonical = None
+        self.robots = None
+        self.og_title = False
+        self.og_description = False
+        self.twitter_card = False
+        self.schema_texts = []
+        self.schema_parts = None
+
+    def flush_text(self):
+        # HTMLParser can hand one text node over in pieces (e.g. around a stray '<')
+        if self.text_parts:
+            self.word_count += len(''.join(self.text_parts).split())
+            self.text_parts = []
+
+    def handle_starttag(self, tag, attrs):
+        self.flush_text()
+        attrs = dict(attrs)
+        if tag == 'title' and self.title is None and self.title_parts is None:
+            self.title_parts = []
+        elif tag == 'meta':
+            name = attrs.get('name')
+            if name == 'description' and self.description is None:
+                self.description = attrs.get('content') or ''
+            elif name == 'robots' and self.robots is None:
+                self.robots = attrs.get('content') or ''
+            elif name == 'twitter:card':
+                self.twitter_card = True
+            prop = attrs.get('property')
+            if prop == 'og:title':
+                self.og_title = True
+            elif prop == 'og:description':
+                self.og_description = True
+        elif tag == 'link' and self.canonical is None and 'canonical' in (attrs.get('rel') or '').split():
+            self.canonical = attrs.get('href') or ''
+        elif tag == 'script' and attrs.get('type') == 'application/ld+json':
+            self.schema_parts = []
+
+        if tag in VOID_TAGS:
+            return
+        self.stack.append(tag)
+        if tag in NON_CONTENT_TAGS:
+            self.non_content_depth += 1
+
+    def handle_endtag(self, tag):
+        self.flush_text()
+        if tag not in self.stack:
+            return
+        while self.stack:
+            closed = self.stack.pop()
+            if closed in NON_CONTENT_TAGS:
+                self.non_content_depth -= 1
+            if closed == 'title' and self.title_parts is not None:
+                self.title = ''.join(self.title_parts)
+                self.title_parts = None
+            elif closed == 'script' and self.schema_parts is not None:
+                self.schema_texts.append(''.join(self.schema_parts) if self.schema_parts else None)
+                self.schema_parts = None
+            if closed == tag:
+                break
+
+    def handle_data(self, data):
+        if self.title_parts is not None:
+            self.title_parts.append(data)
+        if self.schema_parts is not None:
+            self.schema_parts.append(data)
+        if not self.non_content_depth:
+            self.text_parts.append(data)
+
+    def handle_comment(self, data):
+        self.flush_text()
+
+    def handle_decl(self, decl):
+        self.flush_text()
+
+    def handle_pi(self, data):
+        self.flush_text()
+
+    def unknown_decl(self, data):
+        self.flush_text()
+        # BeautifulSoup counts CDATA sections as text
+        if data.startswith('CDATA[') and not self.non_content_depth:
+            self.word_count += len(data[6:].split())
+
+    def close(self):
+        super().close()
+        self.flush_text()
+        # Tags left open at the end of the document still count
+        if self.title_parts is not None:
+            self.title = ''.join(self.title_parts)
+        if self.schema_parts is not None:
+            self.schema_texts.append(''.join(self.schema_parts) if self.schema_parts else None)
+
+
+def extract_page_data_fast(html_path, content=None):
+    """Extract the same data as extract_page_data in one HTMLParser pass"""
+    try:
+        if content is None:
+            with open(html_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+        parser = PageDataParser()
+        parser.feed(content)
+        parser.close()
+
+        schema_types = []
+        for text in parser.schema_texts:
+            try:
+                data = json.loads(text)
+                if isinstance(data, dict):
+                    if '@type' in data:
+                        schema_types.append(data['@type'])
+                    elif '@graph' in data:
+                        for item in data['@graph']:
+                            if '@type' in item:
+                                schema_types.append(item['@type'])
+            except:
+                pass
+
+        title = parser.title or ''
+        description = parser.description or ''
+        return {
+            'path': html_path,
+            'title': title,
+            'title_length': len(title),
+            'description': description,
+            'description_length': len(description),
+            'canonical': parser.canonical or '',
+            'word_count': parser.word_count,
+            'schema_count': len(parser.schema_texts),
+            'schema_types': schema_types,
+            'is_noindex': parser.robots is not None and 'noindex' in parser.robots.lower(),
+            'has_og_tags': parser.og_title and parser.og_description,
+            'has_twitter_card': parser.twitter_card,
+        }
+    except Exception as e:
+        return {'path': html_path, 'error': str(e)}
+
+
+def get_validator_version():
+    """Hash of this script, so changes to extraction invalidate cached results"""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()[:12]
+
+
+def load_result_cache(path=RESULT_CACHE_PATH):
+    """Cached page data by path, or {} if missing, unreadable or from another version"""
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != get_validator_version():
+        return {}
+    return cache.get('pages', {})
+
+
+def save_result_cache(entries, path=RESULT_CACHE_PATH):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({'version': get_validator_version(), 'pages': entries}, f)
+    os.replace(tmp_path, path)
+
+
+def load_page_data(html_path, cached=None, fast=False):
+    """Page data for one file, reusing cached[html_path] if the content hash matches (render_pages work unit).
+
+    Returns (page_data, cache entry or None, was cached)
+    """
+    try:
+        with open(html_path, 'rb') as f:
+            raw = f.read()
+    except OSError as e:
+        return {'path': html_path, 'error': str(e)}, None, False
+
+    content_hash = hashlib.md5(raw).hexdigest()
+    parser_name = 'fast' if fast else 'bs4'
+    entry = (cached or {}).get(html_path)
+    if entry and entry.get('hash') == content_hash and entry.get('parser') == parser_name:
+        return entry['data'], entry, True
+
+    try:
+        # Same text open(..., encoding='utf-8') would give, universal newlines included
+        content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    except UnicodeDecodeError as e:
+        return {'path': html_path, 'error': str(e)}, None, False
+    extract = extract_page_data_fast if fast else extract_page_data
+    page_data = extract(html_path, content)
+    if 'error' in page_data:
+        return page_data, None, False
+    return page_data, {'hash': content_hash, 'parser': parser_name, 'data': page_data}, False
+
+
 def validate_page(page_data):
     """Validate a single page and return issues"""
     issues = []
@@ -119,48 +355,33 @@ def validate_page(page_data):
         issues.append(f"Parse error: {page_data['error']}")
         return issues, warnings
 
-    path = page_data['path']
-
     # Skip validation for noindexed pages (they're already protected)
     if page_data['is_noindex']:
         return issues, warnings
 
-    # 1. Thin content check
-    if page_data['word_count'] < MIN_WORD_COUNT:
-        severity = 'CRITICAL' if page_data['word_count'] < THIN_CONTENT_THRESHOLD else 'WARNING'
-        issues.append(f"[{severity}] Thin content: {page_data['word_count']} words (minimum: {MIN_WORD_COUNT})")
+    # Same checks as at render time (seo_core.validate_page_seo); manifest data has has_canonical already
+    if 'has_canonical' not in page_data:
+        page_data = {**page_data, 'has_canonical': bool(page_data['canonical'])}
+    return validate_page_seo(page_data)
 
-    # 2. Title validation
-    if not page_data['title']:
-        issues.append("[CRITICAL] Missing title tag")
-    elif page_data['title_length'] > MAX_TITLE_LENGTH:
-        warnings.append(f"Title too long: {page_data['title_length']} chars (max: {MAX_TITLE_LENGTH})")
-    elif page_data['title_length'] < MIN_TITLE_LENGTH:
-        warnings.append(f"Title too short: {page_data['title_length']} chars (min: {MIN_TITLE_LENGTH})")
 
-    # 3. Description validation
-    if not page_data['description']:
-        issues.append("[CRITICAL] Missing meta description")
-    elif page_data['description_length'] > MAX_DESCRIPTION_LENGTH:
-        warnings.append(f"Description too long: {page_data['description_length']} chars")
-    elif page_data['description_length'] < MIN_DESCRIPTION_LENGTH:
-        warnings.append(f"Description too short: {page_data['description_length']} chars")
+def manifest_page_data(pages, directory):
+    """Page data for the manifest's pages under directory, as recorded at render time.
 
-    # 4. Canonical URL check
-    if not page_data['canonical']:
-        issues.append("[CRITICAL] Missing canonical URL")
-
-    # 5. Schema markup check
-    if page_data['schema_count'] == 0:
-        warnings.append("No JSON-LD schema markup found")
-
-    # 6. Social meta tags check
-    if not page_data['has_og_tags']:
-        warnings.append("Missing Open Graph tags")
-    if not page_data['has_twitter_card']:
-        warnings.append("Missing Twitter Card tags")
-
-    return issues, warnings
+    Pages recorded before the manifest carried SEO facts come back with an error.
+    """
+    prefix = '/' + os.path.relpath(directory, SITE_DIR).replace(os.sep, '/') + '/'
+    page_data = []
+    for url_path, page in pages.items():
+        if not url_path.startswith(prefix):
+            continue
+        data = {'path': f'{SITE_DIR}{url_path}index.html'}
+        if page.get('seo') is None:
+            data['error'] = 'no render-time SEO data (rebuild or run generate_sitemap.py --manifest --rescan)'
+        else:
+            data.update(page['seo'], is_noindex='noindex' in page['robots'].lower())
+        page_data.append(data)
+    return page_data
 
 
 def scan_directory(directory, pattern='**/index.html'):
@@ -170,10 +391,39 @@ def scan_directory(directory, pattern='**/index.html'):
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Validate SEO of generated pages')
+    parser.add_argument('--fix', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--fast', action='store_true',
+                        help='Parse with the stdlib streaming HTMLParser instead of BeautifulSoup')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Parallel parse processes (0 = all CPUs, default: 1)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Parse every page instead of reusing results from {RESULT_CACHE_PATH}')
+    parser.add_argument('--manifest', action='store_true',
+                        help=f'Report from the SEO facts recorded at render time in {MANIFEST_PATH} (no HTML parsing)')
+    args = parser.parse_args()
+    jobs = resolve_jobs(args.jobs)
+
     print("=" * 70)
     print("  AI MARKET PULSE - SEO VALIDATION REPORT")
     print("=" * 70)
 
+    manifest_pages = None
+    if args.manifest:
+        manifest_pages = load_manifest() or {}
+        # Read-only: generate_sitemap.py --manifest folds and clears the journals
+        merged, journals = merge_journals(manifest_pages)
+        print(f"\n  Using render-time results: {len(manifest_pages)} pages in {MANIFEST_PATH}, "
+              f"{merged} records from {len(journals)} pending journal(s)")
+
+    fast = args.fast
+    if not fast and BeautifulSoup is None and not args.manifest:
+        print("\n  BeautifulSoup is not installed; using the fast parser")
+        fast = True
+    cached = {} if args.no_cache else load_result_cache()
+    cache_entries = {}
+    cache_hits = 0
+
     # Track results
     results = {
         'total': 0,
@@ -196,19 +446,28 @@ def main():
     ]
 
     for page_type, directory in page_types:
-        if not os.path.exists(directory):
-            print(f"\n  Skipping {page_type} (directory not found: {directory})")
-            continue
+        if manifest_pages is not None:
+            print(f"\n  Checking {page_type} pages...")
+            page_results = [(page_data, None, False) for page_data in manifest_page_data(manifest_pages, directory)]
+            print(f"    Found {len(page_results)} pages")
+        else:
+            if not os.path.exists(directory):
+                print(f"\n  Skipping {page_type} (directory not found: {directory})")
+                continue
 
-        print(f"\n  Scanning {page_type} pages...")
-        html_files = scan_directory(directory)
-        print(f"    Found {len(html_files)} pages")
+            print(f"\n  Scanning {page_type} pages...")
+            html_files = scan_directory(directory)
+            print(f"    Found {len(html_files)} pages")
+            page_results = render_pages(load_page_data, html_files, jobs=jobs,
+                                        shared={'cached': cached, 'fast': fast})
 
         type_results = {'valid': 0, 'issues': 0, 'noindex': 0}
 
-        for html_path in html_files:
+        for page_data, entry, was_cached in page_results:
             results['total'] += 1
-            page_data = extract_page_data(html_path)
+            if entry is not None:
+                cache_entries[page_data['path']] = entry
+            cache_hits += was_cached
             issues, warnings = validate_page(page_data)
 
             if page_data.get('is_noindex'):
@@ -243,6 +502,11 @@ def main():
 
         print(f"    Valid: {type_results['valid']}, Issues: {type_results['issues']}, Noindex: {type_results['noindex']}")
 
+    if not args.no_cache and manifest_pages is None:
+        save_result_cache(cache_entries)
+        print(f"\n  Result cache: {cache_hits} unchanged pages reused, "
+              f"{results['total'] - cache_hits} parsed")
+
     # Print summary
     print("\n" + "=" * 70)
     print("  SUMMARY")